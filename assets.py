@@ -7,13 +7,20 @@ Fornece fallbacks (placeholders) caso os assets não sejam encontrados.
 """
 
 import pygame
+import json
+import mmap
+import queue
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 # Importa constantes necessárias
 from config import (
-    BASE_DIR, ASSETS_DIR, ANIM32_DIR, CENTROS48_DIR, CENTROS_DIR,
+    BASE_DIR, ASSETS_DIR, ANIM32_DIR, CENTROS48_DIR, CENTROS_DIR, PACOTE_ASSETS_DIR,
     AMARELO, VERMELHO_CRISE, CINZA, ROXO,
+    TAMANHO_CACHE_TEXTOS, ALPHA_CLONE, ALPHA_FANTASMA_INVISIVEL,
     COR_MOEDA, COR_ALIMENTO, COR_LIVRO, COR_TIJOLO
 )
 
@@ -21,6 +28,10 @@ from config import (
 #   FUNÇÕES DE BASE
 # =======================
 
+# Imagens já lidas/decodificadas pela thread do CarregadorAssets, ainda sem convert_alpha
+_IMAGENS_DECODIFICADAS: Dict[Path, pygame.Surface] = {}
+_TRAVA_DECODIFICADAS = threading.Lock()
+
 def _segura_surface(tamanho: Tuple[int,int], cor=(255,0,0), shape="circle") -> pygame.Surface:
     """Cria um placeholder (Surface) caso um asset falhe em carregar."""
     surf = pygame.Surface(tamanho, pygame.SRCALPHA)
@@ -48,6 +59,11 @@ def _resolve_asset_path(relative) -> Path:
 def _load_image(path: Path) -> Optional[pygame.Surface]:
     """Carrega uma imagem de forma segura, retornando None em caso de falha."""
     resolved = _resolve_asset_path(path)
+    with _TRAVA_DECODIFICADAS:
+        decodificada = _IMAGENS_DECODIFICADAS.pop(resolved, None)
+    if decodificada is not None:
+        # Já lida do disco pela thread de carregamento; aqui só converte (thread principal)
+        return decodificada.convert_alpha()
     if not resolved.exists():
         # print(f"[ASSET_WARN] Arquivo nao encontrado: {resolved}")
         return None
@@ -57,6 +73,186 @@ def _load_image(path: Path) -> Optional[pygame.Surface]:
         print(f"[ASSET_ERROR] Erro ao carregar imagem {resolved}: {e}")
         return None
 
+# =======================
+#   CACHE DE FONTES
+# =======================
+
+# Fontes compartilhadas por todas as telas, indexadas por (nome, tamanho, negrito).
+_CACHE_FONTES: Dict[Tuple, pygame.font.Font] = {}
+_ESTATISTICAS_FONTES = {"hits": 0, "misses": 0}
+
+def obter_fonte(nome, tamanho: int, negrito: bool = False) -> pygame.font.Font:
+    """Retorna a fonte do sistema pedida, criando-a apenas na primeira vez."""
+    chave_nome = tuple(nome) if isinstance(nome, list) else nome
+    chave = (chave_nome, tamanho, negrito)
+    fonte = _CACHE_FONTES.get(chave)
+    if fonte is not None:
+        _ESTATISTICAS_FONTES["hits"] += 1
+        return fonte
+    _ESTATISTICAS_FONTES["misses"] += 1
+    if not pygame.font.get_init():
+        pygame.font.init() # Inicialização adiada até a primeira fonte pedida
+    fonte = pygame.font.SysFont(nome, tamanho, bold=negrito)
+    _CACHE_FONTES[chave] = fonte
+    return fonte
+
+def estatisticas_fontes() -> Dict[str, int]:
+    """Retorna os contadores de acertos/falhas e o total de fontes criadas."""
+    return {**_ESTATISTICAS_FONTES, "fontes": len(_CACHE_FONTES)}
+
+# =======================
+#   CACHE DE TEXTOS (LRU)
+# =======================
+
+# Surfaces de texto já renderizadas, indexadas por (fonte, texto, cor, antialias).
+# A ordem do OrderedDict é a ordem de uso: o primeiro item é o menos recente.
+_CACHE_TEXTOS: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+_ESTATISTICAS_TEXTOS = {"hits": 0, "misses": 0, "evictions": 0}
+_limite_cache_textos = TAMANHO_CACHE_TEXTOS
+
+def renderizar_texto(fonte: pygame.font.Font, texto: str, cor, antialias: bool = True) -> pygame.Surface:
+    """
+    Equivalente a fonte.render(texto, antialias, cor), mas reaproveita a
+    Surface se a mesma combinação já foi renderizada. A Surface retornada é
+    compartilhada e não deve ser modificada.
+    """
+    chave = (fonte, texto, tuple(cor), antialias)
+    render = _CACHE_TEXTOS.get(chave)
+    if render is not None:
+        _CACHE_TEXTOS.move_to_end(chave)
+        _ESTATISTICAS_TEXTOS["hits"] += 1
+        return render
+    _ESTATISTICAS_TEXTOS["misses"] += 1
+    render = fonte.render(texto, antialias, cor)
+    _CACHE_TEXTOS[chave] = render
+    while len(_CACHE_TEXTOS) > _limite_cache_textos:
+        _CACHE_TEXTOS.popitem(last=False)
+        _ESTATISTICAS_TEXTOS["evictions"] += 1
+    return render
+
+def definir_limite_cache_textos(limite: int):
+    """Altera o número máximo de textos guardados, descartando os mais antigos se preciso."""
+    global _limite_cache_textos
+    _limite_cache_textos = max(1, limite)
+    while len(_CACHE_TEXTOS) > _limite_cache_textos:
+        _CACHE_TEXTOS.popitem(last=False)
+        _ESTATISTICAS_TEXTOS["evictions"] += 1
+
+def estatisticas_textos() -> Dict[str, int]:
+    """Retorna acertos, falhas, descartes e a ocupação atual do cache de textos."""
+    return {**_ESTATISTICAS_TEXTOS, "textos": len(_CACHE_TEXTOS), "limite": _limite_cache_textos}
+
+# =======================
+#   SPRITES DE EFEITO (ANÉIS)
+# =======================
+
+# Banco de anéis (brilho dos centros, halo de entrega) indexado por
+# (raio, passo de intensidade, cor, largura). Cada anel é desenhado uma única
+# vez; a intensidade é arredondada para múltiplos de PASSO_INTENSIDADE_ANEL
+# para que o banco fique pequeno.
+PASSO_INTENSIDADE_ANEL = 8
+_BANCO_ANEIS: Dict[Tuple[int, int, Tuple[int, int, int], int], pygame.Surface] = {}
+
+def obter_anel(raio: int, intensidade: float, cor=AMARELO, largura: int = 4) -> pygame.Surface:
+    """Retorna uma Surface (2*raio x 2*raio) com um anel translúcido, reaproveitada entre quadros."""
+    passo = min(255, int(round(intensidade / PASSO_INTENSIDADE_ANEL)) * PASSO_INTENSIDADE_ANEL)
+    chave = (int(raio), passo, tuple(cor[:3]), largura)
+    anel = _BANCO_ANEIS.get(chave)
+    if anel is None:
+        anel = pygame.Surface((chave[0]*2, chave[0]*2), pygame.SRCALPHA)
+        pygame.draw.circle(anel, (*chave[2], passo), (chave[0], chave[0]), chave[0], width=largura)
+        _BANCO_ANEIS[chave] = anel
+    return anel
+
+# =======================
+#   PACOTE DE ASSETS COMPILADO
+# =======================
+
+# Gerado offline por compilar_assets.py: os frames já resolvidos (fallbacks) e
+# redimensionados, em pixels RGBA crus, mais um manifesto com o tamanho/offset
+# de cada entrada e a assinatura (mtime, tamanho, sha1) das imagens de origem.
+ARQUIVO_PACOTE = PACOTE_ASSETS_DIR / "sprites.bin"
+ARQUIVO_MANIFESTO = PACOTE_ASSETS_DIR / "manifest.json"
+VERSAO_PACOTE = 1
+# Pastas cujas imagens participam da resolução de fallbacks dos sprites
+PASTAS_FONTES_SPRITES = ("anim32", "centros48", "centros", "ghosts", "pacman", "items")
+
+_pacote_estado = {"carregado": False, "manifesto": None, "dados": None}
+# O pacote é aberto pela thread de carregamento ou pela principal, a que chegar primeiro
+_TRAVA_PACOTE = threading.Lock()
+
+def _hash_arquivo(path: Path) -> str:
+    import hashlib # Só é preciso quando um mtime muda; fora do caminho normal de inicialização
+    with open(path, 'rb') as f: return hashlib.sha1(f.read()).hexdigest()
+
+def listar_fontes_sprites() -> List[Path]:
+    """Lista as imagens que podem ser usadas (diretamente ou como fallback) pelos carregadores."""
+    return sorted(p for pasta in PASTAS_FONTES_SPRITES for p in (ASSETS_DIR / pasta).rglob("*.png"))
+
+def assinatura_fonte(path: Path) -> Dict:
+    info = path.stat()
+    return {"mtime": info.st_mtime, "tamanho": info.st_size, "sha1": _hash_arquivo(path)}
+
+def _pacote_atualizado(manifesto: Dict) -> bool:
+    """Confere se as imagens de origem são as mesmas usadas para compilar o pacote."""
+    if manifesto.get("versao") != VERSAO_PACOTE: return False
+    fontes = manifesto.get("fontes", {})
+    atuais = {p.relative_to(ASSETS_DIR).as_posix(): p for p in listar_fontes_sprites()}
+    if set(atuais) != set(fontes): return False # Arquivo novo/removido muda os fallbacks
+    for relativo, path in atuais.items():
+        esperado, info = fontes[relativo], path.stat()
+        if info.st_size != esperado["tamanho"]: return False
+        # mtime igual basta; se mudou (ex.: checkout), confirma pelo conteúdo
+        if info.st_mtime != esperado["mtime"] and _hash_arquivo(path) != esperado["sha1"]: return False
+    return True
+
+def _obter_pacote() -> Optional[Dict]:
+    """Abre (uma única vez) o pacote compilado via mmap; retorna None se ausente ou desatualizado."""
+    if _pacote_estado["carregado"]:
+        return _pacote_estado["manifesto"]
+    with _TRAVA_PACOTE:
+        if not _pacote_estado["carregado"]:
+            _pacote_estado["manifesto"] = _abrir_pacote()
+            # Só marca como carregado depois de manifesto e mmap guardados
+            _pacote_estado["carregado"] = True
+    return _pacote_estado["manifesto"]
+
+def _abrir_pacote() -> Optional[Dict]:
+    if not (ARQUIVO_PACOTE.exists() and ARQUIVO_MANIFESTO.exists()):
+        return None
+    try:
+        with open(ARQUIVO_MANIFESTO, 'r', encoding='utf-8') as f: manifesto = json.load(f)
+        if not _pacote_atualizado(manifesto):
+            print("[ASSET_WARN] Pacote de assets desatualizado. Usando carregadores normais (rode compilar_assets.py).")
+            return None
+        with open(ARQUIVO_PACOTE, 'rb') as f:
+            # ACCESS_COPY: mapeamento gravável (copy-on-write), exigido por pygame.image.frombuffer
+            _pacote_estado["dados"] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[ASSET_ERROR] Erro ao abrir pacote de assets: {e}")
+        return None
+    return manifesto
+
+def _surface_do_pacote(chave: str) -> Optional[pygame.Surface]:
+    manifesto = _obter_pacote()
+    entrada = manifesto["entradas"].get(chave) if manifesto else None
+    if entrada is None:
+        return None
+    w, h = entrada["tamanho"]
+    inicio = entrada["offset"]
+    buffer = memoryview(_pacote_estado["dados"])[inicio:inicio + w * h * 4]
+    surface = pygame.image.frombuffer(buffer, (w, h), "RGBA")
+    return surface.convert_alpha() if pygame.display.get_surface() is not None else surface
+
+def _frames_do_pacote(prefixo: str) -> Optional[List[pygame.Surface]]:
+    """Frames prefixo/0, prefixo/1, ... do pacote, ou None se o pacote não os tiver."""
+    frames = []
+    while True:
+        frame = _surface_do_pacote(f"{prefixo}/{len(frames)}")
+        if frame is None: break
+        frames.append(frame)
+    return frames or None
+
 # =======================
 #   CARREGADORES DE SPRITES
 # =======================
@@ -97,6 +293,14 @@ def carregar_sequencia_pasta(pasta, base: str, num_frames: int, tamanho: Tuple[i
     return frames
 
 def carregar_pacman_frames(tamanho=(32,32)) -> Dict[str, List[pygame.Surface]]:
+    """Frames do Pac-Man por direção, do pacote compilado ou (se preciso) dos arquivos."""
+    prefixo = f"pacman/{tamanho[0]}x{tamanho[1]}"
+    frames = {d: _frames_do_pacote(f"{prefixo}/{d}") for d in ("direita", "esquerda", "cima", "baixo")}
+    if all(frames.values()):
+        return frames
+    return _carregar_pacman_frames_disco(tamanho)
+
+def _carregar_pacman_frames_disco(tamanho=(32,32)) -> Dict[str, List[pygame.Surface]]:
     """Carrega os frames do Pac-Man, com múltiplos fallbacks."""
     # 1. Tentar spritesheet
     sheet_path = ASSETS_DIR / "pacman" / "pacman_sheet.png"
@@ -123,7 +327,42 @@ def carregar_pacman_frames(tamanho=(32,32)) -> Dict[str, List[pygame.Surface]]:
     base = _segura_surface(tamanho, AMARELO, "circle")
     return {"direita":[base], "esquerda":[base], "cima":[base], "baixo":[base]}
 
-def carregar_fantasma_frames(nome_interno:str, tamanho=(48,48), invisivel=False) -> List[pygame.Surface]:
+# Frames dos fantasmas já carregados, indexados por (nome, tamanho, invisivel, alpha).
+# As tuplas são compartilhadas entre todos os Inimigo (inclusive os clones).
+_CACHE_FANTASMAS: Dict[Tuple[str, Tuple[int, int], bool, int], Tuple[pygame.Surface, ...]] = {}
+
+def aplicar_alpha_surface(surface: pygame.Surface, alpha: int) -> pygame.Surface:
+    """Retorna uma copia da surface com o canal alpha multiplicado por alpha/255."""
+    translucida = surface.copy()
+    translucida.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
+    return translucida
+
+def carregar_fantasma_frames(nome_interno:str, tamanho=(48,48), invisivel=False, alpha=255) -> Tuple[pygame.Surface, ...]:
+    """
+    Retorna os frames de um fantasma, lendo do disco apenas na primeira vez.
+    Com alpha < 255 retorna a variante translúcida (clones e fantasma invisível),
+    também gerada uma única vez.
+    """
+    chave = (nome_interno, tuple(tamanho), invisivel, alpha)
+    frames = _CACHE_FANTASMAS.get(chave)
+    if frames is None:
+        if alpha >= 255:
+            frames = _frames_do_pacote(f"fantasma/{nome_interno}/{tamanho[0]}x{tamanho[1]}/{int(invisivel)}")
+            frames = tuple(frames or _carregar_fantasma_frames_disco(nome_interno, tamanho, invisivel))
+        else:
+            frames = tuple(aplicar_alpha_surface(f, alpha) for f in carregar_fantasma_frames(nome_interno, tamanho, invisivel))
+        _CACHE_FANTASMAS[chave] = frames
+    return frames
+
+def precarregar_fantasma(nome_interno: str, tamanho=(48,48)):
+    """Carrega um fantasma e as variantes translúcidas que ele usa em jogo."""
+    regioes_fantasma(nome_interno, tamanho, invisivel=False)
+    if nome_interno == "Falta de Acesso":
+        regioes_fantasma(nome_interno, tamanho, invisivel=True, alpha=ALPHA_FANTASMA_INVISIVEL)
+    elif nome_interno == "Crise Economica":
+        regioes_fantasma(nome_interno, tamanho, invisivel=False, alpha=ALPHA_CLONE)
+
+def _carregar_fantasma_frames_disco(nome_interno:str, tamanho=(48,48), invisivel=False) -> List[pygame.Surface]:
     """Carrega os frames dos fantasmas, com múltiplos fallbacks."""
     # 1. Tentar spritesheet (48x48)
     map_sheet = {
@@ -158,6 +397,10 @@ def carregar_fantasma_frames(nome_interno:str, tamanho=(48,48), invisivel=False)
     return [_segura_surface(tamanho, cor, "circle"), _segura_surface(tamanho, cor, "circle")]
 
 def carregar_item(nome: str, tamanho: Tuple[int, int]) -> pygame.Surface:
+    """Imagem de um item/recurso, do pacote compilado ou (se preciso) dos arquivos."""
+    return _surface_do_pacote(f"item/{nome.lower()}/{tamanho[0]}x{tamanho[1]}") or _carregar_item_disco(nome, tamanho)
+
+def _carregar_item_disco(nome: str, tamanho: Tuple[int, int]) -> pygame.Surface:
     """Carrega a imagem de um item/recurso, com fallback."""
     nome_lower = nome.lower()
     # Mapeamento para nomes de arquivos inconsistentes
@@ -196,6 +439,10 @@ def carregar_item(nome: str, tamanho: Tuple[int, int]) -> pygame.Surface:
     return _segura_surface(tamanho, cor_padrao, "circle")
 
 def carregar_centro(prefixo: str, tamanho: Tuple[int, int]) -> List[pygame.Surface]:
+    """Frames de um centro comunitário, do pacote compilado ou (se preciso) dos arquivos."""
+    return _frames_do_pacote(f"centro/{prefixo}/{tamanho[0]}x{tamanho[1]}") or _carregar_centro_disco(prefixo, tamanho)
+
+def _carregar_centro_disco(prefixo: str, tamanho: Tuple[int, int]) -> List[pygame.Surface]:
     """Carrega os 3 frames de animação de um centro comunitário."""
     tentativas = [
         [CENTROS48_DIR / f"{prefixo}_{i}.png" for i in range(3)],
@@ -209,4 +456,235 @@ def carregar_centro(prefixo: str, tamanho: Tuple[int, int]) -> List[pygame.Surfa
     # Fallback: Placeholder
     print(f"[ASSET_WARN] Frames para centro '{prefixo}' nao encontrados. Usando placeholder.")
     cor_map = {"escola": (0,0,255), "hospital": (255,0,0), "mercado": (0,255,0), "moradia": (160,82,45)}
-    return [_segura_surface(tamanho, cor_map.get(prefixo, (0,255,0)), "rect") for _ in range(3)]
\ No newline at end of file
+    return [_segura_surface(tamanho, cor_map.get(prefixo, (0,255,0)), "rect") for _ in range(3)]
+
+# =======================
+#   ATLAS DE SPRITES
+# =======================
+
+class RegiaoAtlas:
+    """Um frame guardado no atlas: a página (Surface) e a área ocupada nela."""
+    __slots__ = ("pagina", "area")
+
+    def __init__(self, pagina: pygame.Surface, area: pygame.Rect):
+        self.pagina, self.area = pagina, area
+
+    def get_size(self) -> Tuple[int, int]: return self.area.size
+    def get_width(self) -> int: return self.area.width
+    def get_height(self) -> int: return self.area.height
+
+    def get_rect(self, **posicao) -> pygame.Rect:
+        """Mesmo uso de Surface.get_rect(center=..., topleft=...)."""
+        rect = pygame.Rect((0, 0), self.area.size)
+        for atributo, valor in posicao.items(): setattr(rect, atributo, valor)
+        return rect
+
+    def desenhar(self, surface: pygame.Surface, destino, special_flags: int = 0):
+        surface.blit(self.pagina, destino, self.area, special_flags)
+
+class AtlasSprites:
+    """
+    Empacota frames em poucas Surfaces grandes (páginas) no formato do display.
+    O empacotamento é feito por prateleiras, à medida que os frames chegam:
+    cada frame entra à direita do anterior e, quando a linha enche, abre-se
+    uma nova prateleira abaixo (ou uma nova página).
+    """
+    def __init__(self, tamanho_pagina: Tuple[int, int] = (512, 512), margem: int = 1):
+        self.tamanho_pagina, self.margem = tamanho_pagina, margem
+        self.paginas: List[pygame.Surface] = []
+        self.regioes: Dict[str, RegiaoAtlas] = {}
+        self.grupos: Dict[str, Tuple[RegiaoAtlas, ...]] = {}
+        self._cursor_x = self._cursor_y = self._altura_prateleira = 0
+
+    def __contains__(self, nome: str) -> bool: return nome in self.regioes
+    def __getitem__(self, nome: str) -> RegiaoAtlas: return self.regioes[nome]
+
+    def _nova_pagina(self, tamanho):
+        pagina = pygame.Surface(tamanho, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            pagina = pagina.convert_alpha()
+        pagina.fill((0, 0, 0, 0))
+        self.paginas.append(pagina)
+        self._cursor_x = self._cursor_y = self._altura_prateleira = 0
+        return pagina
+
+    def adicionar(self, nome: str, surface: pygame.Surface) -> RegiaoAtlas:
+        """Copia 'surface' para o atlas (se 'nome' ainda não existir) e retorna sua região."""
+        if nome in self.regioes: return self.regioes[nome]
+        w, h = surface.get_size()
+        larg_pag, alt_pag = self.tamanho_pagina
+        m = self.margem
+        if w + m > larg_pag or h + m > alt_pag:
+            # Frame maior que uma página: ganha uma página só para ele
+            pagina, x, y = self._nova_pagina((w, h)), 0, 0
+            self._cursor_y = alt_pag # Força a próxima adição a abrir outra página
+        else:
+            if not self.paginas or self._cursor_x + w + m > larg_pag:
+                self._cursor_x, self._cursor_y = 0, self._cursor_y + self._altura_prateleira
+                self._altura_prateleira = 0
+            if not self.paginas or self._cursor_y + h + m > alt_pag or self.paginas[-1].get_size() != self.tamanho_pagina:
+                self._nova_pagina(self.tamanho_pagina)
+            pagina, x, y = self.paginas[-1], self._cursor_x, self._cursor_y
+            self._cursor_x += w + m
+            self._altura_prateleira = max(self._altura_prateleira, h + m)
+        # BLEND_RGBA_MAX sobre a página zerada copia os pixels (inclusive alpha) sem mistura
+        pagina.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        regiao = self.regioes[nome] = RegiaoAtlas(pagina, pygame.Rect(x, y, w, h))
+        return regiao
+
+    def adicionar_frames(self, prefixo: str, frames) -> Tuple[RegiaoAtlas, ...]:
+        """Adiciona uma sequência de frames, acessível depois por ATLAS.grupos[prefixo]."""
+        if prefixo not in self.grupos:
+            self.grupos[prefixo] = tuple(self.adicionar(f"{prefixo}/{i}", f) for i, f in enumerate(frames))
+        return self.grupos[prefixo]
+
+ATLAS = AtlasSprites()
+
+def regioes_pacman(tamanho=(32,32)) -> Dict[str, Tuple[RegiaoAtlas, ...]]:
+    """Frames do Pac-Man por direção, como regiões do atlas."""
+    prefixo = f"pacman/{tamanho[0]}x{tamanho[1]}"
+    if f"{prefixo}/direita" not in ATLAS.grupos:
+        for direcao, frames in carregar_pacman_frames(tamanho).items():
+            ATLAS.adicionar_frames(f"{prefixo}/{direcao}", frames)
+    return {d: ATLAS.grupos[f"{prefixo}/{d}"] for d in ("direita", "esquerda", "cima", "baixo")}
+
+def regioes_fantasma(nome_interno: str, tamanho=(48,48), invisivel=False, alpha=255) -> Tuple[RegiaoAtlas, ...]:
+    """Frames de um fantasma (ou de sua variante translúcida), como regiões do atlas."""
+    prefixo = f"fantasma/{nome_interno}/{tamanho[0]}x{tamanho[1]}/{int(invisivel)}/{alpha}"
+    regioes = ATLAS.grupos.get(prefixo)
+    if regioes is None:
+        regioes = ATLAS.adicionar_frames(prefixo, carregar_fantasma_frames(nome_interno, tamanho, invisivel, alpha))
+    return regioes
+
+def regiao_item(nome: str, tamanho: Tuple[int, int]) -> RegiaoAtlas:
+    """Ícone de um recurso, como região do atlas."""
+    chave = f"item/{nome.lower()}/{tamanho[0]}x{tamanho[1]}"
+    if chave not in ATLAS:
+        return ATLAS.adicionar(chave, carregar_item(nome, tamanho))
+    return ATLAS[chave]
+
+def regioes_centro(prefixo_centro: str, tamanho: Tuple[int, int]) -> Tuple[RegiaoAtlas, ...]:
+    """Os 3 frames de um centro comunitário, como regiões do atlas."""
+    prefixo = f"centro/{prefixo_centro}/{tamanho[0]}x{tamanho[1]}"
+    regioes = ATLAS.grupos.get(prefixo)
+    if regioes is None:
+        regioes = ATLAS.adicionar_frames(prefixo, carregar_centro(prefixo_centro, tamanho))
+    return regioes
+
+# =======================
+#   CARREGAMENTO EM SEGUNDO PLANO
+# =======================
+
+# Cada tarefa: (prioridade, nome, arquivos que seus carregadores podem ler, função que monta as regiões).
+# Prioridade menor sai primeiro da fila: o que aparece logo no início da partida vem antes.
+def _tarefas_atlas() -> List[Tuple[int, str, List[Path], Callable[[], object]]]:
+    tarefas = [(0, "pacman", [ASSETS_DIR / "pacman" / "pacman_sheet.png"] +
+                [ANIM32_DIR / "pacman" / f"pacman_right_{i}.png" for i in range(4)],
+                lambda: regioes_pacman((32, 32)))]
+    # (spritesheet, pasta 32x32) de cada fantasma, como em _carregar_fantasma_frames_disco
+    arquivos_fantasma = {
+        "Desemprego": [("desemprego.png", "ghost_desemprego")],
+        "Desigualdade": [("desigualdade.png", "ghost_desigualdade_small")],
+        "Falta de Acesso": [("falta_acesso_visible.png", "ghost_falta_acesso_visible"),
+                            ("falta_acesso_invisivel.png", "ghost_falta_acesso_invisivel")],
+        "Crise Economica": [("crise_economica.png", "ghost_crise_economica")],
+    }
+    for nome, fontes in arquivos_fantasma.items():
+        arquivos = []
+        for folha, pasta in fontes:
+            arquivos += [ASSETS_DIR / "ghosts" / folha] + [ANIM32_DIR / pasta / f"{pasta}_{i}.png" for i in range(2)]
+        tarefas.append((1, f"fantasma/{nome}", arquivos, lambda nome=nome: precarregar_fantasma(nome)))
+    for prefixo in ("escola", "hospital", "mercado", "moradia"):
+        arquivos = [d / f"{prefixo}_{i}.png" for d in (CENTROS48_DIR, CENTROS_DIR) for i in range(3)]
+        tarefas.append((2, f"centro/{prefixo}", arquivos, lambda p=prefixo: regioes_centro(p, (48, 48))))
+    for nome, arquivo in (("moeda", "moeda"), ("alimento", "alimento"), ("livro", "livro"), ("tijolo", "tijolos")):
+        arquivos = [ANIM32_DIR / "itens" / f"item_{arquivo}.png", ASSETS_DIR / "items" / f"{arquivo}.png"]
+        tarefas.append((2, f"item/{nome}", arquivos, lambda n=nome: regiao_item(n, (24, 24))))
+    return tarefas
+
+class CarregadorAssets:
+    """
+    Lê e decodifica as imagens do jogo numa thread separada, em ordem de prioridade.
+    A conversão (convert_alpha, escala, atlas) fica na thread principal, feita aos poucos em processar().
+    """
+    def __init__(self):
+        self._fila: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._prontas: "queue.Queue" = queue.Queue()
+        self._finalizar: Dict[str, Tuple[Callable[[], object], List[Path]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._sequencia = 0
+        self.total = self.concluidas = 0
+
+    def agendar(self, prioridade: int, nome: str, arquivos: List[Path], finalizar: Callable[[], object]):
+        # 'sequencia' desempata prioridades iguais mantendo a ordem de agendamento
+        self._finalizar[nome] = (finalizar, [_resolve_asset_path(a) for a in arquivos])
+        self._fila.put((prioridade, self._sequencia, nome))
+        self._sequencia += 1
+        self.total += 1
+
+    def iniciar(self):
+        # A thread termina quando a fila esvazia; tarefas agendadas depois disso pedem outra
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._trabalhar, name="CarregadorAssets", daemon=True)
+            self._thread.start()
+
+    def _trabalhar(self):
+        # Com o pacote compilado válido não há o que decodificar: os sprites saem direto do mmap
+        usar_pacote = _obter_pacote() is not None
+        while True:
+            try:
+                _, _, nome = self._fila.get_nowait()
+            except queue.Empty:
+                return
+            if not usar_pacote:
+                for path in self._finalizar[nome][1]:
+                    if not path.exists(): continue
+                    try:
+                        imagem = pygame.image.load(str(path))
+                    except Exception as e:
+                        print(f"[ASSET_ERROR] Erro ao carregar imagem {path}: {e}")
+                        continue
+                    with _TRAVA_DECODIFICADAS:
+                        _IMAGENS_DECODIFICADAS[path] = imagem
+            self._prontas.put(nome)
+
+    def _concluir(self, nome: str):
+        finalizar, arquivos = self._finalizar.pop(nome)
+        finalizar()
+        # Descarta fallbacks decodificados que não chegaram a ser usados
+        with _TRAVA_DECODIFICADAS:
+            for path in arquivos: _IMAGENS_DECODIFICADAS.pop(path, None)
+        self.concluidas += 1
+
+    def processar(self, limite_ms: float = 4.0):
+        """Monta (na thread principal) as tarefas já decodificadas, até gastar 'limite_ms' neste quadro."""
+        inicio = time.perf_counter()
+        while not self.concluido and (time.perf_counter() - inicio) * 1000 < limite_ms:
+            try:
+                nome = self._prontas.get_nowait()
+            except queue.Empty:
+                return
+            self._concluir(nome)
+
+    def aguardar(self):
+        """Termina todas as tarefas agora (bloqueando se a thread ainda estiver lendo arquivos)."""
+        self.iniciar()
+        while not self.concluido:
+            self._concluir(self._prontas.get())
+
+    @property
+    def concluido(self) -> bool: return self.concluidas >= self.total
+
+    def progresso(self) -> float:
+        """Fração (0.0 a 1.0) das tarefas já prontas para uso."""
+        return 1.0 if self.total == 0 else self.concluidas / self.total
+
+CARREGADOR = CarregadorAssets()
+
+def iniciar_carregamento_assets() -> CarregadorAssets:
+    """Agenda os sprites do jogo e começa a lê-los em segundo plano (chamar após criar a janela)."""
+    if CARREGADOR.total == 0:
+        for tarefa in _tarefas_atlas():
+            CARREGADOR.agendar(*tarefa)
+        CARREGADOR.iniciar()
+    return CARREGADOR
@@ -0,0 +1,74 @@
+"""
+Compilador de Assets (compilar_assets.py)
+
+Passo offline (opcional) que gera o pacote de sprites usado por assets.py:
+- Resolve os fallbacks de cada sprite (spritesheet, pasta, placeholder)
+- Já redimensiona para os tamanhos usados em jogo (32x32, 48x48, 24x24)
+- Grava os pixels RGBA crus em assets/pacote/sprites.bin
+- Grava assets/pacote/manifest.json com offsets e a assinatura das imagens de origem
+
+Uso: python compilar_assets.py
+Se alguma imagem de origem mudar, o jogo ignora o pacote até ele ser recompilado.
+"""
+
+import json
+import pygame
+
+from assets import (
+    ARQUIVO_PACOTE, ARQUIVO_MANIFESTO, VERSAO_PACOTE, ASSETS_DIR,
+    listar_fontes_sprites, assinatura_fonte,
+    _carregar_pacman_frames_disco, _carregar_fantasma_frames_disco,
+    _carregar_item_disco, _carregar_centro_disco
+)
+
+TAMANHO_PACMAN = (32, 32)
+TAMANHO_FANTASMA = (48, 48)
+TAMANHO_ITEM = (24, 24)
+TAMANHO_CENTRO = (48, 48)
+
+def _sufixo(tamanho) -> str:
+    return f"{tamanho[0]}x{tamanho[1]}"
+
+def coletar_sprites() -> dict:
+    """Retorna {chave: surface} com todos os sprites do jogo, nas mesmas chaves lidas por assets.py."""
+    sprites = {}
+    def frames(prefixo, lista):
+        for i, frame in enumerate(lista): sprites[f"{prefixo}/{i}"] = frame
+
+    for direcao, lista in _carregar_pacman_frames_disco(TAMANHO_PACMAN).items():
+        frames(f"pacman/{_sufixo(TAMANHO_PACMAN)}/{direcao}", lista)
+    for nome in ("Desemprego", "Desigualdade", "Falta de Acesso", "Crise Economica"):
+        frames(f"fantasma/{nome}/{_sufixo(TAMANHO_FANTASMA)}/0", _carregar_fantasma_frames_disco(nome, TAMANHO_FANTASMA, False))
+    frames(f"fantasma/Falta de Acesso/{_sufixo(TAMANHO_FANTASMA)}/1",
+           _carregar_fantasma_frames_disco("Falta de Acesso", TAMANHO_FANTASMA, True))
+    for nome in ("moeda", "alimento", "livro", "tijolo"):
+        sprites[f"item/{nome}/{_sufixo(TAMANHO_ITEM)}"] = _carregar_item_disco(nome, TAMANHO_ITEM)
+    for prefixo in ("escola", "hospital", "mercado", "moradia"):
+        frames(f"centro/{prefixo}/{_sufixo(TAMANHO_CENTRO)}", _carregar_centro_disco(prefixo, TAMANHO_CENTRO))
+    return sprites
+
+def compilar():
+    # As assinaturas são lidas antes de carregar, para não registrar um arquivo alterado no meio do processo
+    fontes = {p.relative_to(ASSETS_DIR).as_posix(): assinatura_fonte(p) for p in listar_fontes_sprites()}
+    sprites = coletar_sprites()
+
+    entradas, offset = {}, 0
+    ARQUIVO_PACOTE.parent.mkdir(parents=True, exist_ok=True)
+    with open(ARQUIVO_PACOTE, 'wb') as f:
+        for chave, surface in sprites.items():
+            dados = pygame.image.tostring(surface, "RGBA")
+            f.write(dados)
+            entradas[chave] = {"offset": offset, "tamanho": list(surface.get_size())}
+            offset += len(dados)
+
+    manifesto = {"versao": VERSAO_PACOTE, "fontes": fontes, "entradas": entradas}
+    with open(ARQUIVO_MANIFESTO, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, indent=2, ensure_ascii=False)
+    print(f"[LOG] Pacote de assets gerado: {len(entradas)} sprites, {offset // 1024} KB, {len(fontes)} imagens de origem.")
+
+if __name__ == '__main__':
+    pygame.init()
+    # Janela oculta: os carregadores usam convert_alpha, que exige um display
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    compilar()
+    pygame.quit()
@@ -6,12 +6,10 @@ cores, e dados estáticos (como o layout do labirinto)
 para o jogo Pac-Man.
 """
 
-import pygame
 from pathlib import Path
 
-# --- Inicialização Básica (só para ter os tipos, se necessário) ---
-# O init() real será chamado em main.py
-pygame.font.init()
+# Sem pygame aqui: fontes e áudio são inicializados só no primeiro uso
+# (assets.obter_fonte e utils._garantir_mixer)
 
 # --- Constantes Globais de Jogo ---
 TAM_CELULA = 30
@@ -22,6 +20,22 @@ ALTURA = (LINHAS_LABIRINTO + 3) * TAM_CELULA
 
 FPS = 60
 
+# Renderização por retângulos sujos no estado 'jogo' (útil em displays sem aceleração)
+RENDER_DIRTY_RECTS = False
+
+# Move todos os fantasmas em lote com arrays NumPy (motor_fantasmas.py; exige NumPy instalado)
+MOTOR_FANTASMAS_NUMPY = False
+
+# Quantidade máxima de textos renderizados mantidos no cache LRU
+TAMANHO_CACHE_TEXTOS = 256
+
+# Transparência dos clones da Crise Econômica e do fantasma "Falta de Acesso" invisível
+ALPHA_CLONE = 200
+ALPHA_FANTASMA_INVISIVEL = 120
+
+# Tipos de recurso coletáveis (o código guardado em GradeRecursos é o índice + 1)
+TIPOS_RECURSOS = ('Moeda', 'Alimento', 'Livro', 'Tijolo')
+
 # --- Caminhos de Arquivos e Pastas ---
 ARQUIVO_USUARIOS = "data/usuarios.json"
 ARQUIVO_REWARDS = "data/rewards_data.json"
@@ -35,6 +49,8 @@ ASSETS_DIR = BASE_DIR / "assets"
 ANIM32_DIR = ASSETS_DIR / "anim32"
 CENTROS48_DIR = ASSETS_DIR / "centros48"
 CENTROS_DIR = ASSETS_DIR / "centros"
+PACOTE_ASSETS_DIR = ASSETS_DIR / "pacote"  # Gerado por compilar_assets.py
+CACHE_LABIRINTO_DIR = BASE_DIR / "data" / "cache"  # Tabelas de distância do labirinto (geradas)
 
 # --- Cores ---
 PRETO = (0, 0, 0)
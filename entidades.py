@@ -2,53 +2,155 @@
 Arquivo de Entidades (classes.py)
 
 Define as classes principais do jogo (sprites e objetos interativos):
+- Inventario e EstatisticasPartida (dados do jogador)
 - Player
+- PoolClones (clones da Crise Econômica reaproveitados)
 - Inimigo
 - CentroComunitario
+- GradeRecursos
+- PoolCelulasLivres
 """
 
 import pygame
 import random
 import datetime
+from array import array
 from typing import Dict, List, Tuple, Optional
 
 # Importa constantes e layouts
 from config import (
-    TAM_CELULA, COLUNAS, LINHAS_LABIRINTO, LABIRINTO_LAYOUT, FPS,
+    TAM_CELULA, COLUNAS, LINHAS_LABIRINTO, FPS, LABIRINTO_LAYOUT,
+    ALPHA_CLONE, ALPHA_FANTASMA_INVISIVEL, TIPOS_RECURSOS,
     AMARELO, 
     # --- CORREÇÃO ADICIONADA AQUI ---
     PRETO, CINZA, ROXO, VERMELHO_CRISE 
     # --- FIM DA CORREÇÃO ---
 )
 
+# Tabelas pré-calculadas do labirinto (colisão e saídas de cada célula)
+from labirinto import LABIRINTO, CampoFluxo
+
+# Busca de caminhos com buffers reaproveitados (piloto automático do clique)
+from utils import encontrar_caminho
+
 # Importa carregadores de assets
 from assets import (
-    carregar_pacman_frames, carregar_fantasma_frames, carregar_centro
+    regioes_pacman, regioes_fantasma, regioes_centro, obter_anel
 )
 
 # --- Classes do Jogo ---
+# As entidades usam __slots__: sem dicionário por instância (menos memória e acesso
+# mais rápido aos atributos no laço de atualização). Veja perfil_entidades.py.
+
+class Inventario:
+    """
+    Inventário de capacidade fixa: contagem por tipo (consultas O(1)) e um buffer
+    pré-alocado com a ordem de coleta (HUD e descarte do último item), usado em
+    _itens[0:_tamanho]. Lido como uma lista: len, iteração, índice e 'in'.
+    """
+    __slots__ = ("capacidade", "_contagem", "_itens", "_tamanho")
+    _ZERADA = dict.fromkeys(TIPOS_RECURSOS, 0)
+
+    def __init__(self, capacidade: int = 5):
+        self.capacidade = capacidade
+        self._contagem: Dict[str, int] = dict(self._ZERADA)
+        self._itens: List[Optional[str]] = [None] * capacidade
+        self._tamanho = 0
+
+    def __len__(self) -> int: return self._tamanho
+    def __contains__(self, tipo) -> bool: return self._contagem.get(tipo, 0) > 0
+    def __iter__(self): return iter(self._itens[:self._tamanho])
+    def __repr__(self) -> str: return f"Inventario({list(self)!r})"
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0: i += self._tamanho
+        if not 0 <= i < self._tamanho: raise IndexError("índice fora do inventário")
+        return self._itens[i]
+
+    def cheio(self) -> bool: return self._tamanho >= self.capacidade
+
+    def contar(self, tipo: str) -> int: return self._contagem.get(tipo, 0)
+
+    def adicionar(self, tipo: str) -> bool:
+        """Guarda um item no fim da fila. Retorna False se o inventário estiver cheio."""
+        if self._tamanho >= self.capacidade: return False
+        self._itens[self._tamanho] = tipo
+        self._tamanho += 1
+        self._contagem[tipo] += 1
+        return True
+
+    def remover_ultimo(self) -> Optional[str]:
+        """Descarta o item coletado por último (None se estiver vazio)."""
+        if not self._tamanho: return None
+        self._tamanho -= 1
+        tipo = self._itens[self._tamanho]
+        self._contagem[tipo] -= 1
+        return tipo
+
+    def remover_tipo(self, tipo: str) -> int:
+        """Retira todos os itens de 'tipo', mantendo a ordem dos demais. Retorna quantos saíram."""
+        quantidade = self._contagem.get(tipo, 0)
+        if not quantidade: return 0
+        # Compacta o buffer no lugar: 'escrita' avança só pelos itens que ficam (nada é alocado)
+        itens, escrita = self._itens, 0
+        for leitura in range(self._tamanho):
+            item = itens[leitura]
+            if item != tipo:
+                itens[escrita] = item
+                escrita += 1
+        self._tamanho = escrita
+        self._contagem[tipo] = 0
+        return quantidade
+
+    def limpar(self):
+        self._contagem.update(self._ZERADA)
+        self._tamanho = 0
+
+class EstatisticasPartida:
+    """
+    Estatísticas da partida atual, com campos fixos e tipados.
+    get(chave, padrao) mantém a leitura usada pelo sistema de recompensas (utils.py).
+    """
+    __slots__ = ("recursos_coletados", "itens_entregues", "tempo_jogado", "tempo_sobrevivencia",
+                 "partidas_jogadas", "vitorias", "centros_completos", "inicio_partida")
+    recursos_coletados: int
+    itens_entregues: int
+    tempo_jogado: float
+    tempo_sobrevivencia: float
+    partidas_jogadas: int
+    vitorias: int
+    centros_completos: int
+    inicio_partida: datetime.datetime
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.recursos_coletados, self.itens_entregues = 0, 0
+        self.tempo_jogado, self.tempo_sobrevivencia = 0, 0
+        self.partidas_jogadas, self.vitorias, self.centros_completos = 0, 0, 0
+        self.inicio_partida = datetime.datetime.now()
+
+    def get(self, chave: str, padrao=0):
+        return getattr(self, chave) if chave in self.__slots__ else padrao
 
 class Player:
+    __slots__ = ("px", "py", "dir_x", "dir_y", "vel_x", "vel_y", "velocidade", "inventario",
+                 "caminho", "destino", "stats", "frames_direita", "frames_esquerda", "frames_cima",
+                 "frames_baixo", "frames_atual", "frame_atual", "timer_animacao", "tempo_por_frame")
+
     def __init__(self, x, y):
         self.px, self.py = x * TAM_CELULA, y * TAM_CELULA
         self.dir_x, self.dir_y, self.vel_x, self.vel_y = 0, 0, 0, 0
         self.velocidade = 3
-        self.inventario, self.capacidade_inventario = [], 5
-        self.caminho = []
-        self.stats = {
-            "recursos_coletados": 0,
-            "itens_entregues": 0,
-            "tempo_jogado": 0,
-            "tempo_sobrevivencia": 0,
-            "partidas_jogadas": 0,
-            "vitorias": 0,
-            "centros_completos": 0,
-            "inicio_partida": datetime.datetime.now()
-        }
+        self.inventario = Inventario(5)
+        # Piloto automático: células a percorrer até 'destino' (None = controle pelo teclado)
+        self.caminho, self.destino = [], None
+        self.stats = EstatisticasPartida()
         self.carregar_imagens()
 
     def carregar_imagens(self):
-        imgs = carregar_pacman_frames((32,32))
+        imgs = regioes_pacman((32,32))
         self.frames_direita = imgs["direita"]
         self.frames_esquerda = imgs["esquerda"]
         self.frames_cima = imgs["cima"]
@@ -59,21 +161,15 @@ class Player:
     def grid_x(self): return int((self.px + TAM_CELULA // 2) / TAM_CELULA)
     @property
     def grid_y(self): return int((self.py + TAM_CELULA // 2) / TAM_CELULA)
+    @property
+    def capacidade_inventario(self): return self.inventario.capacidade
 
     def reiniciar(self):
         self.px, self.py = 1 * TAM_CELULA, 1 * TAM_CELULA
         self.dir_x, self.dir_y, self.vel_x, self.vel_y = 0, 0, 0, 0
-        self.inventario.clear()
-        self.caminho.clear()
-        # Resetar stats da partida (mas manter estrutura)
-        self.stats["recursos_coletados"] = 0
-        self.stats["itens_entregues"] = 0
-        self.stats["tempo_jogado"] = 0
-        self.stats["tempo_sobrevivencia"] = 0
-        self.stats["partidas_jogadas"] = 0
-        self.stats["vitorias"] = 0
-        self.stats["centros_completos"] = 0
-        self.stats["inicio_partida"] = datetime.datetime.now()
+        self.inventario.limpar()
+        self.cancelar_caminho()
+        self.stats.reiniciar() # Resetar stats da partida
         if hasattr(self, 'frames_direita'): self.frames_atual, self.frame_atual, self.timer_animacao = self.frames_direita, 0, 0
 
     def atualizar_animacao(self, dt):
@@ -89,16 +185,49 @@ class Player:
             elif self.vel_y < 0: self.frames_atual = self.frames_cima
             elif self.vel_y > 0: self.frames_atual = self.frames_baixo
             
+    def definir_destino(self, destino: Tuple[int, int]) -> bool:
+        """Clique para mover: calcula o caminho até 'destino' (uma busca por clique, não por quadro)."""
+        if destino == self.destino and self.caminho: return True
+        self.caminho = encontrar_caminho(LABIRINTO_LAYOUT, (self.grid_x, self.grid_y), destino)
+        self.destino = destino if self.caminho else None
+        return self.destino is not None
+
+    def cancelar_caminho(self):
+        self.caminho.clear()
+        self.destino = None
+
+    def _seguir_caminho(self):
+        """Com o jogador alinhado, aponta dir_x/dir_y para a próxima célula do caminho."""
+        atual = (self.grid_x, self.grid_y)
+        # Descarta as células já percorridas (inclusive a atual, se o jogador adiantou-se no caminho)
+        if atual in self.caminho: del self.caminho[:self.caminho.index(atual) + 1]
+        if not self.caminho:
+            # Chegou ao destino: para e devolve o controle ao teclado
+            self.cancelar_caminho()
+            self.dir_x, self.dir_y, self.vel_x, self.vel_y = 0, 0, 0, 0
+            return
+        prox_x, prox_y = self.caminho[0]
+        dx, dy = prox_x - atual[0], prox_y - atual[1]
+        if abs(dx) + abs(dy) != 1 or LABIRINTO.parede(prox_x, prox_y):
+            # Fora do caminho (clique no meio de uma célula) ou passagem bloqueada: recalcula uma vez
+            destino, self.destino = self.destino, None
+            if self.definir_destino(destino): self._seguir_caminho()
+            else: self.dir_x, self.dir_y, self.vel_x, self.vel_y = 0, 0, 0, 0
+            return
+        self.dir_x, self.dir_y = dx, dy
+
     def mover(self):
         esta_alinhado = self.px % TAM_CELULA == 0 and self.py % TAM_CELULA == 0
         
         # Sistema de movimento contínuo (estilo Pac-Man original)
         if esta_alinhado:
+            # Piloto automático (clique): escolhe a direção pelo caminho calculado
+            if self.destino is not None: self._seguir_caminho()
             # Movimento contínuo por teclado
             if self.dir_x != 0 or self.dir_y != 0:
                 # Tenta mudar para a nova direção solicitada
                 prox_grid_x, prox_grid_y = self.grid_x + self.dir_x, self.grid_y + self.dir_y
-                if not self.colide_parede(prox_grid_x, prox_grid_y): 
+                if not LABIRINTO.parede(prox_grid_x, prox_grid_y): 
                     self.vel_x, self.vel_y = self.dir_x, self.dir_y
             # Se não pode ir na nova direção, continua na direção atual
             elif self.vel_x == 0 and self.vel_y == 0:
@@ -108,7 +237,7 @@ class Player:
             # Verifica se pode continuar na direção atual
             if self.vel_x != 0 or self.vel_y != 0:
                 prox_grid_x, prox_grid_y = self.grid_x + self.vel_x, self.grid_y + self.vel_y
-                if self.colide_parede(prox_grid_x, prox_grid_y):
+                if LABIRINTO.parede(prox_grid_x, prox_grid_y):
                     # Para se encontrar uma parede na direção atual
                     self.px, self.py = self.grid_x * TAM_CELULA, self.grid_y * TAM_CELULA
                     self.vel_x, self.vel_y = 0, 0
@@ -119,9 +248,7 @@ class Player:
         
         self.atualizar_direcao()
         
-    def colide_parede(self, x, y): return not (0 <= x < COLUNAS and 0 <= y < LINHAS_LABIRINTO and LABIRINTO_LAYOUT[y][x] != 1)
-    
-    def coletar(self, recursos: List[Dict]) -> Optional[Tuple[int, int]]:
+    def coletar(self, recursos: "GradeRecursos") -> Optional[Tuple[int, int]]:
         """
         Tenta coletar um recurso.
         (Implementação da Sugestão #4 - Otimização)
@@ -129,37 +256,111 @@ class Player:
         para que o game loop possa adicionar a posição de volta ao 
         conjunto de posições livres.
         """
-        if len(self.inventario) < self.capacidade_inventario:
-            for recurso in recursos[:]:
-                if recurso['x'] == self.grid_x and recurso['y'] == self.grid_y:
-                    self.inventario.append(recurso['tipo'])
-                    self.stats["recursos_coletados"] += 1
-                    recursos.remove(recurso)
-                    return (recurso['x'], recurso['y']) # Retorna a posição liberada
+        inventario = self.inventario
+        if not inventario.cheio():
+            x, y = self.grid_x, self.grid_y # Propriedades: calculadas uma vez só
+            tipo = recursos.remover(x, y) # Consulta direta à célula
+            if tipo is not None:
+                inventario.adicionar(tipo)
+                self.stats.recursos_coletados += 1
+                return (x, y) # Retorna a posição liberada
         return None # Nada foi coletado
 
     def descartar_item(self):
-        if self.inventario: self.inventario.pop()
+        self.inventario.remover_ultimo()
+
+    def obter_rect(self) -> pygame.Rect:
+        """Retângulo ocupado pelo sprite atual na tela (usado pelo modo dirty-rect)."""
+        centro = (self.px + TAM_CELULA//2, self.py + TAM_CELULA//2)
+        if self.frames_atual and self.frames_atual[self.frame_atual]:
+            return self.frames_atual[self.frame_atual].get_rect(center=centro).inflate(2, 2)
+        return pygame.Rect(self.px, self.py, TAM_CELULA, TAM_CELULA).inflate(2, 2)
 
     def desenhar(self, surface):
         centro = (self.px + TAM_CELULA//2, self.py + TAM_CELULA//2)
         if self.frames_atual and self.frames_atual[self.frame_atual]:
             img = self.frames_atual[self.frame_atual]
-            rect = img.get_rect(center=centro)
-            surface.blit(img, rect)
+            img.desenhar(surface, img.get_rect(center=centro))
         else:
             pygame.draw.circle(surface, AMARELO, centro, TAM_CELULA//2 - 3)
 
+class PoolClones:
+    """
+    Clones da Crise Econômica reaproveitados entre divisões.
+    Cada pai já nasce com seus clones pré-alocados; na divisão um clone é
+    reativado (posição, direção e timers) e na junção ele volta para o pool,
+    então a partida não cria objetos, frames nem ids novos a cada divisão.
+    """
+    __slots__ = ("por_pai", "_livres", "acertos", "faltas")
+
+    def __init__(self, por_pai: int = 1):
+        self.por_pai = por_pai
+        self._livres: Dict[int, List["Inimigo"]] = {}  # id do pai -> clones parados
+        self.acertos, self.faltas = 0, 0
+
+    def _novo_clone(self, pai: "Inimigo") -> "Inimigo":
+        clone = Inimigo.__new__(Inimigo)
+        clone._configurar(pai.grid_x, pai.grid_y, pai.cor, pai.nome, pai.dificuldade, True, pai.id)
+        return clone
+
+    def reservar(self, pai: "Inimigo"):
+        """Pré-aloca os clones de 'pai' (sem sorteios, para não alterar a sequência aleatória)."""
+        # Substitui o que houver com o mesmo id (sobra de uma partida anterior)
+        self._livres[pai.id] = [self._novo_clone(pai) for _ in range(self.por_pai)]
+
+    def obter(self, pai: "Inimigo") -> "Inimigo":
+        """Um clone de 'pai' pronto para entrar no jogo (do pool ou, se faltar, recém-criado)."""
+        livres = self._livres.get(pai.id)
+        if livres:
+            clone = livres.pop()
+            self.acertos += 1
+        else:
+            clone = self._novo_clone(pai)
+            self.faltas += 1
+        clone._reativar_clone(pai)
+        return clone
+
+    def devolver(self, clone: "Inimigo"):
+        self._livres.setdefault(clone.parent_id, []).append(clone)
+
+    def limpar(self):
+        """Descarta os clones guardados (nova partida: Inimigo.id_counter volta a zero)."""
+        self._livres.clear()
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna os contadores de acertos/faltas e o total de clones parados no pool."""
+        return {"acertos": self.acertos, "faltas": self.faltas, "livres": sum(len(l) for l in self._livres.values())}
+
 class Inimigo:
+    __slots__ = ("px", "py", "cor", "nome", "vel_x", "vel_y", "invisivel", "visivel",
+                 "timer_invisibilidade", "tempo_para_trocar", "dificuldade", "is_clone", "parent_id", "id",
+                 "velocidade", "comportamento_aleatorio", "frames", "frames_invisivel", "frames_clone",
+                 "pode_dividir", "split_cooldown_ms", "split_elapsed_ms", "split_duration_ms",
+                 "split_active", "split_active_elapsed_ms", "clones")
     id_counter = 0
+    # Distâncias até o jogador, compartilhadas por todos os inimigos (refeitas quando ele muda de célula)
+    campo_perseguicao = CampoFluxo(LABIRINTO)
+    # Clones da Crise Econômica, compartilhados pela partida (veja PoolClones)
+    pool_clones = PoolClones()
 
     def __init__(self, x, y, cor, nome, dificuldade="Default", *, is_clone=False, parent_id=None):
+        self._configurar(x, y, cor, nome, dificuldade, is_clone, parent_id)
+        # Sorteios sempre na mesma ordem (a mesma semente reproduz a partida)
+        self.vel_x, self.vel_y = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.tempo_para_trocar = random.randint(30, 60)
+        if self.pode_dividir:
+            self.split_cooldown_ms = random.randint(5500, 9000)
+            self.split_duration_ms = random.randint(2000, 3800)
+            Inimigo.pool_clones.reservar(self)
+
+    def _configurar(self, x, y, cor, nome, dificuldade, is_clone, parent_id):
+        """Campos que não dependem de sorteio (também usado pelos clones pré-alocados do pool)."""
         self.px, self.py = x * TAM_CELULA, y * TAM_CELULA
         self.cor, self.nome = cor, nome
-        self.vel_x, self.vel_y = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.vel_x, self.vel_y = 0, 0
         self.invisivel = (nome == "Falta de Acesso")
         self.visivel = True
-        self.timer_invisibilidade, self.tempo_para_trocar = 0, random.randint(30, 60)
+        self.timer_invisibilidade, self.tempo_para_trocar = 0, 0
         self.dificuldade = dificuldade
         self.is_clone = is_clone
         self.parent_id = parent_id
@@ -170,16 +371,17 @@ class Inimigo:
         elif self.dificuldade == "Hard": self.velocidade, self.comportamento_aleatorio = 2.5, 0.25
         else: self.velocidade, self.comportamento_aleatorio = 2.0, 0.7
 
-        self.frames = carregar_fantasma_frames(self.nome, (48, 48), invisivel=False)
-        self.frames_invisivel = carregar_fantasma_frames(self.nome, (48, 48), invisivel=True) if self.invisivel else None
+        # Frames são regiões do atlas; variantes translúcidas já vêm prontas (nada de copy() por quadro)
+        self.frames = regioes_fantasma(self.nome, (48, 48), invisivel=False)
+        self.frames_invisivel = regioes_fantasma(self.nome, (48, 48), invisivel=True, alpha=ALPHA_FANTASMA_INVISIVEL) if self.invisivel else None
+        self.frames_clone = regioes_fantasma(self.nome, (48, 48), invisivel=False, alpha=ALPHA_CLONE) if self.is_clone else None
 
         self.pode_dividir = (self.nome == "Crise Economica" and not self.is_clone)
-        self.split_cooldown_ms = random.randint(5500, 9000) if self.pode_dividir else 0
-        self.split_elapsed_ms = 0
-        self.split_duration_ms = random.randint(2000, 3800) if self.pode_dividir else 0
+        self.split_cooldown_ms, self.split_elapsed_ms = 0, 0
+        self.split_duration_ms = 0
         self.split_active = False
         self.split_active_elapsed_ms = 0
-        self.clone_ids: List[int] = []
+        self.clones: List["Inimigo"] = []
 
     @property
     def grid_x(self): return int((self.px + TAM_CELULA // 2) / TAM_CELULA)
@@ -192,32 +394,17 @@ class Inimigo:
             if self.timer_invisibilidade > self.tempo_para_trocar * (FPS / 10):
                 self.visivel = not self.visivel; self.timer_invisibilidade = 0; self.tempo_para_trocar = random.randint(20, 50)
         if self.px % TAM_CELULA == 0 and self.py % TAM_CELULA == 0:
-            opcoes = []
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                if not self.colide_parede(self.grid_x + dx, self.grid_y + dy): opcoes.append((dx, dy))
-            
-            if len(opcoes) > 1:
-                reverso = (-self.vel_x, -self.vel_y)
-                if reverso in opcoes:
-                    opcoes.remove(reverso)
+            # Saídas da célula já sem o retorno (quando há alternativa), direto da tabela
+            opcoes = LABIRINTO.saidas(self.grid_x, self.grid_y, self.vel_x, self.vel_y)
 
             if random.random() < self.comportamento_aleatorio or not opcoes:
                     if opcoes: self.vel_x, self.vel_y = random.choice(opcoes)
             else:
-                dist_x, dist_y = player.grid_x - self.grid_x, player.grid_y - self.grid_y
-                movimentos_preferidos = []
-                if abs(dist_x) > abs(dist_y):
-                    if dist_x > 0 and (1, 0) in opcoes: movimentos_preferidos.append((1, 0))
-                    elif dist_x < 0 and (-1, 0) in opcoes: movimentos_preferidos.append((-1, 0))
-                    if dist_y > 0 and (0, 1) in opcoes: movimentos_preferidos.append((0, 1))
-                    elif dist_y < 0 and (0, -1) in opcoes: movimentos_preferidos.append((0, -1))
-                else:
-                    if dist_y > 0 and (0, 1) in opcoes: movimentos_preferidos.append((0, 1))
-                    elif dist_y < 0 and (0, -1) in opcoes: movimentos_preferidos.append((0, -1))
-                    if dist_x > 0 and (1, 0) in opcoes: movimentos_preferidos.append((1, 0))
-                    elif dist_x < 0 and (-1, 0) in opcoes: movimentos_preferidos.append((-1, 0))
-                
-                if movimentos_preferidos: self.vel_x, self.vel_y = movimentos_preferidos[0]
+                # Persegue pelo menor caminho real (campo de fluxo), não pela distância em linha reta
+                campo = Inimigo.campo_perseguicao
+                campo.atualizar((player.grid_x, player.grid_y))
+                melhor = campo.melhor_saida(self.grid_x, self.grid_y, opcoes)
+                if melhor: self.vel_x, self.vel_y = melhor
                 elif opcoes: self.vel_x, self.vel_y = random.choice(opcoes)
         
         self.px += self.vel_x * self.velocidade
@@ -230,10 +417,16 @@ class Inimigo:
         return random.choice(direcoes) if direcoes else (0,0)
 
     def _criar_clone(self):
-        clone = Inimigo(self.grid_x, self.grid_y, self.cor, self.nome, self.dificuldade, is_clone=True, parent_id=self.id)
-        clone.px, clone.py = self.px, self.py
-        clone.vel_x, clone.vel_y = self._escolher_direcao_clone()
-        return clone
+        return Inimigo.pool_clones.obter(self)
+
+    def _reativar_clone(self, pai: "Inimigo"):
+        """Prepara este clone (vindo do pool) para uma nova divisão de 'pai'."""
+        self.px, self.py = pai.px, pai.py
+        self.visivel, self.timer_invisibilidade = True, 0
+        # Mesmos sorteios de um clone recém-construído: a direção inicial é descartada logo abaixo
+        random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.tempo_para_trocar = random.randint(30, 60)
+        self.vel_x, self.vel_y = pai._escolher_direcao_clone()
 
     def atualizar_divisao(self, dt_ms, novos_inimigos, remover_ids):
         if not self.pode_dividir: return
@@ -243,71 +436,118 @@ class Inimigo:
                 self.split_elapsed_ms = 0; self.split_active = True; self.split_active_elapsed_ms = 0
                 novo_clone = self._criar_clone()
                 novos_inimigos.append(novo_clone)
-                self.clone_ids = [novo_clone.id]
+                self.clones.append(novo_clone)
         else:
             self.split_active_elapsed_ms += dt_ms
             if self.split_active_elapsed_ms >= self.split_duration_ms:
-                if self.clone_ids: remover_ids.extend(self.clone_ids)
-                self.clone_ids = []; self.split_active = False
+                # Junção: os clones saem do jogo e voltam para o pool
+                for clone in self.clones:
+                    remover_ids.append(clone.id)
+                    Inimigo.pool_clones.devolver(clone)
+                self.clones.clear(); self.split_active = False
                 self.split_cooldown_ms = random.randint(5500, 9000)
                 self.split_duration_ms = random.randint(2000, 3800)
 
-    def colide_parede(self, x, y):
-        return not (0 <= x < COLUNAS and 0 <= y < LINHAS_LABIRINTO and LABIRINTO_LAYOUT[y][x] != 1)
-
-    def desenhar(self, surface):
-        frames_para_usar = self.frames
+    def obter_rect(self, centro=None) -> pygame.Rect:
+        """Retângulo ocupado pelo sprite na tela (usado pelo modo dirty-rect)."""
+        # 'centro' vem do MotorFantasmas, quando a posição está nos arrays e não em px/py
+        if centro is None: centro = (self.px + TAM_CELULA // 2, self.py + TAM_CELULA // 2)
+        if self.frames:
+            return self.frames[0].get_rect(center=centro).inflate(2, 2)
+        return pygame.Rect(centro[0] - TAM_CELULA // 2, centro[1] - TAM_CELULA // 2, TAM_CELULA, TAM_CELULA).inflate(2, 2)
+
+    def desenhar(self, surface, centro=None):
+        if centro is None: centro = (self.px + TAM_CELULA // 2, self.py + TAM_CELULA // 2)
+        frames_para_usar = self.frames_clone if self.is_clone else self.frames
         if self.invisivel and not self.visivel:
-            frames_para_usar = self.frames_invisivel or self.frames
+            frames_para_usar = self.frames_invisivel
         
         if not frames_para_usar:
             if not self.visivel: return
-            centro = (self.px + TAM_CELULA // 2, self.py + TAM_CELULA // 2)
             pygame.draw.circle(surface, self.cor, centro, TAM_CELULA // 2 - 4)
             return
 
         frame_index = int(pygame.time.get_ticks() / 300) % len(frames_para_usar)
         img = frames_para_usar[frame_index]
-        rect = img.get_rect(center=(self.px + TAM_CELULA // 2, self.py + TAM_CELULA // 2))
-        
-        render_img = img
-        if self.is_clone or (not self.visivel and self.invisivel):
-            render_img = img.copy()
-            alpha = 120 if (not self.visivel and self.invisivel) else 200
-            render_img.fill((255, 255, 255, alpha), None, pygame.BLEND_RGBA_MULT)
-        
-        surface.blit(render_img, rect)
+        img.desenhar(surface, img.get_rect(center=centro))
+
+class GerenciadorEfeitos:
+    """
+    Efeitos de brilho (anel que expande e esmaece) de um centro comunitário.
+    Os efeitos avançam pelo tempo decorrido em ms, independente do FPS.
+    """
+    RAIO_EXPANSAO = 60 # Quanto o anel cresce (px) ao longo do efeito
+
+    def __init__(self):
+        self.efeitos: List[Dict] = []
+
+    def __bool__(self): return bool(self.efeitos)
+    def __len__(self): return len(self.efeitos)
+
+    def adicionar(self, duracao_ms=500):
+        self.efeitos.append({"decorrido": 0, "duracao": duracao_ms})
+
+    def atualizar(self, dt_ms):
+        if not self.efeitos: return
+        for efeito in self.efeitos: efeito["decorrido"] += dt_ms
+        self.efeitos[:] = [e for e in self.efeitos if e["decorrido"] < e["duracao"]]
+
+    def raio_maximo(self) -> int:
+        return TAM_CELULA + self.RAIO_EXPANSAO
+
+    def desenhar(self, surface, centro):
+        for efeito in self.efeitos:
+            progresso = efeito["decorrido"] / efeito["duracao"]
+            intensidade = max(30, 200 * (1 - progresso))
+            raio = TAM_CELULA + int(progresso * self.RAIO_EXPANSAO)
+            anel = obter_anel(raio, intensidade, (255, 223, 0))
+            surface.blit(anel, (centro[0] - raio, centro[1] - raio), special_flags=pygame.BLEND_RGBA_ADD)
 
 class CentroComunitario:
+    __slots__ = ("x", "y", "nome", "cor", "recurso_necessario", "nivel_atual", "nivel_max",
+                 "anim_index", "anim_timer", "anim_interval_ms", "efeitos", "frames")
+
     def __init__(self, x, y, nome, cor, recurso_necessario):
         self.x, self.y, self.nome, self.cor = x, y, nome, cor
         self.recurso_necessario = recurso_necessario
         self.nivel_atual, self.nivel_max = 0, 5
         self.anim_index, self.anim_timer, self.anim_interval_ms = 0, 0, 220
-        self.efeitos = [] # Lista para efeitos visuais
+        self.efeitos = GerenciadorEfeitos() # Efeitos visuais (brilho ao entregar)
         self.carregar_imagens()
 
     def carregar_imagens(self):
         tamanho_centro = (48, 48)
         prefixo_map = {"Escola": "escola","Hospital": "hospital", "Mercado": "mercado","Moradia": "moradia"}
         prefixo = prefixo_map.get(self.nome, "escola")
-        self.frames = carregar_centro(prefixo, tamanho_centro)
+        self.frames = regioes_centro(prefixo, tamanho_centro)
 
     def atualizar_animacao(self, dt_ms):
+        self.efeitos.atualizar(dt_ms)
         if not self.frames: return
         self.anim_timer += dt_ms
         if self.anim_timer >= self.anim_interval_ms:
             self.anim_timer = 0
             self.anim_index = (self.anim_index + 1) % len(self.frames)
 
+    def obter_rect(self) -> pygame.Rect:
+        """Retângulo que cobre sprite, barra de progresso e efeitos ativos."""
+        px, py = self.x * TAM_CELULA, self.y * TAM_CELULA
+        centro = (px + TAM_CELULA//2, py + TAM_CELULA//2)
+        rect = pygame.Rect(px, py, TAM_CELULA, TAM_CELULA)
+        if self.frames and self.frames[self.anim_index]:
+            rect.union_ip(self.frames[self.anim_index].get_rect(center=centro))
+        if self.efeitos:
+            raio = self.efeitos.raio_maximo()
+            rect.union_ip(pygame.Rect(0, 0, raio*2, raio*2).move(centro[0] - raio, centro[1] - raio))
+        return rect
+
     def desenhar(self, surface):
         px, py = self.x * TAM_CELULA, self.y * TAM_CELULA
         
         # Desenha o sprite animado
         if self.frames and self.frames[self.anim_index]:
             frame = self.frames[self.anim_index]
-            img_rect = frame.get_rect(center=(px + TAM_CELULA//2, py + TAM_CELULA//2))
-            surface.blit(frame, img_rect)
+            frame.desenhar(surface, frame.get_rect(center=(px + TAM_CELULA//2, py + TAM_CELULA//2)))
         else: # Fallback
             pygame.draw.rect(surface, self.cor, (px+2, py+2, TAM_CELULA-4, TAM_CELULA-4), border_radius=4)
         
@@ -319,23 +559,126 @@ class CentroComunitario:
         pygame.draw.rect(surface, AMARELO, (px+4, py+TAM_CELULA-12, progresso, altura_barra))
 
         # Desenha efeitos (ex: brilho ao entregar)
-        for efeito in list(self.efeitos):
-            efeito["tempo"] -= 1
-            if efeito["tempo"] <= 0:
-                self.efeitos.remove(efeito)
-                continue
-            intensidade = max(30, 200 * efeito["tempo"] / efeito["duracao"])
-            raio = TAM_CELULA + (efeito["duracao"] - efeito["tempo"]) * 2
-            glow = pygame.Surface((raio*2, raio*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (255, 223, 0, int(intensidade)), (raio, raio), raio, width=4)
-            surface.blit(glow, (px + TAM_CELULA//2 - raio, py + TAM_CELULA//2 - raio), special_flags=pygame.BLEND_RGBA_ADD)
-
-    def receber_entrega(self, inventario_jogador, player_stats=None):
-        recursos_entregues = sum(1 for item in inventario_jogador if item == self.recurso_necessario)
+        self.efeitos.desenhar(surface, (px + TAM_CELULA//2, py + TAM_CELULA//2))
+
+    def receber_entrega(self, inventario_jogador: Inventario, player_stats: Optional[EstatisticasPartida] = None):
+        recursos_entregues = inventario_jogador.contar(self.recurso_necessario)
         if recursos_entregues > 0 and self.nivel_atual < self.nivel_max:
-            inventario_jogador[:] = [item for item in inventario_jogador if item != self.recurso_necessario]
+            inventario_jogador.remover_tipo(self.recurso_necessario)
             self.nivel_atual = min(self.nivel_max, self.nivel_atual + recursos_entregues)
-            if player_stats: player_stats["itens_entregues"] += recursos_entregues
-            self.efeitos.append({"tempo": 30, "duracao": 30}) 
+            if player_stats is not None: player_stats.itens_entregues += recursos_entregues
+            self.efeitos.adicionar()
             return recursos_entregues * 20
-        return 0
\ No newline at end of file
+        return 0
+
+
+class GradeRecursos:
+    """
+    Recursos espalhados pelo labirinto, no máximo um por célula.
+    Guarda o código do tipo de cada célula num array COLUNAS x LINHAS (0 = vazia)
+    e uma lista compacta das células ocupadas, para desenhar sem varrer a grade.
+    Adicionar, remover e consultar uma célula são O(1).
+    """
+    VAZIO = 0
+
+    def __init__(self, colunas: int = COLUNAS, linhas: int = LINHAS_LABIRINTO):
+        self.colunas, self.linhas = colunas, linhas
+        self.codigos = array('B', bytes(colunas * linhas))
+        self._ocupadas: List[int] = []  # Índices (y * colunas + x) das células com recurso
+        self._posicao_ocupada = array('i', [-1]) * (colunas * linhas)  # Índice de cada célula em _ocupadas
+        self._alteradas: set = set()  # Células alteradas desde o último consumir_alteracoes()
+        self._ouvintes: List = []  # Chamados com (x, y, tipo, presente) a cada alteração
+
+    def __len__(self) -> int: return len(self._ocupadas)
+
+    def __iter__(self):
+        """Percorre os recursos como tuplas (x, y, tipo)."""
+        colunas = self.colunas
+        for indice in self._ocupadas:
+            yield indice % colunas, indice // colunas, TIPOS_RECURSOS[self.codigos[indice] - 1]
+
+    def adicionar_ouvinte(self, ouvinte):
+        """Registra ouvinte(x, y, tipo, presente), avisado quando um recurso surge ou é retirado."""
+        self._ouvintes.append(ouvinte)
+
+    def tipo_em(self, x: int, y: int) -> Optional[str]:
+        """Tipo do recurso na célula (x, y), ou None se estiver vazia ou fora da grade."""
+        if not (0 <= x < self.colunas and 0 <= y < self.linhas): return None
+        codigo = self.codigos[y * self.colunas + x]
+        return TIPOS_RECURSOS[codigo - 1] if codigo else None
+
+    def adicionar(self, x: int, y: int, tipo: str) -> bool:
+        """Coloca um recurso em (x, y). Retorna False se a célula já estiver ocupada."""
+        indice = y * self.colunas + x
+        if self.codigos[indice] != self.VAZIO: return False
+        self.codigos[indice] = TIPOS_RECURSOS.index(tipo) + 1
+        self._posicao_ocupada[indice] = len(self._ocupadas)
+        self._ocupadas.append(indice)
+        self._alteradas.add(indice)
+        for ouvinte in self._ouvintes: ouvinte(x, y, tipo, True)
+        return True
+
+    def remover(self, x: int, y: int) -> Optional[str]:
+        """Retira o recurso de (x, y) e retorna seu tipo (None se a célula estiver vazia)."""
+        tipo = self.tipo_em(x, y)
+        if tipo is None: return None
+        indice = y * self.colunas + x
+        # Troca com o último da lista compacta para remover em O(1)
+        posicao, ultimo = self._posicao_ocupada[indice], self._ocupadas[-1]
+        self._ocupadas[posicao] = ultimo
+        self._posicao_ocupada[ultimo] = posicao
+        self._ocupadas.pop()
+        self._posicao_ocupada[indice] = -1
+        self.codigos[indice] = self.VAZIO
+        self._alteradas.add(indice)
+        for ouvinte in self._ouvintes: ouvinte(x, y, tipo, False)
+        return tipo
+
+    def consumir_alteracoes(self) -> List[Tuple[int, int]]:
+        """Células (x, y) que ganharam ou perderam recurso desde a última chamada."""
+        colunas = self.colunas
+        alteradas = [(indice % colunas, indice // colunas) for indice in self._alteradas]
+        self._alteradas.clear()
+        return alteradas
+
+
+class PoolCelulasLivres:
+    """
+    Células livres onde um recurso pode surgir.
+    Lista + mapa célula -> índice: inserir, remover (troca com o último) e
+    sortear são O(1). Com o mesmo 'rng' (mesma semente) e a mesma sequência
+    de operações, os sorteios se repetem.
+    """
+    def __init__(self, celulas=(), rng=random):
+        self._rng = rng
+        # Ordenadas para que o estado inicial não dependa da ordem de iteração de um set
+        self._celulas: List[Tuple[int, int]] = sorted(celulas)
+        self._indices: Dict[Tuple[int, int], int] = {c: i for i, c in enumerate(self._celulas)}
+
+    def __len__(self) -> int: return len(self._celulas)
+    def __contains__(self, celula) -> bool: return celula in self._indices
+
+    def adicionar(self, celula: Tuple[int, int]):
+        if celula not in self._indices:
+            self._indices[celula] = len(self._celulas)
+            self._celulas.append(celula)
+
+    def remover(self, celula: Tuple[int, int]) -> bool:
+        """Remove a célula (se estiver no pool), trocando-a de lugar com a última."""
+        indice = self._indices.pop(celula, None)
+        if indice is None: return False
+        ultima = self._celulas.pop()
+        if indice < len(self._celulas):
+            self._celulas[indice] = ultima
+            self._indices[ultima] = indice
+        return True
+
+    def sortear(self) -> Tuple[int, int]:
+        """Uma célula livre qualquer (uniforme), sem removê-la."""
+        return self._celulas[self._rng.randrange(len(self._celulas))]
+
+    def retirar_aleatoria(self) -> Tuple[int, int]:
+        """Sorteia uma célula livre e a remove do pool."""
+        celula = self.sortear()
+        self.remover(celula)
+        return celula
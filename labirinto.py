@@ -0,0 +1,428 @@
+"""
+Arquivo do Labirinto Compilado (labirinto.py)
+
+Pré-calcula, a partir de LABIRINTO_LAYOUT, as tabelas consultadas
+pelo movimento das entidades:
+- Bitmask das direções abertas de cada célula
+- Saídas legais de cada célula para cada direção de chegada
+  (sem o retorno, quando há alternativa), na ordem usada por Inimigo.mover
+- Distância e próximo passo entre quaisquer duas células livres
+  (calculados uma vez e guardados em disco, indexados pelo hash do layout)
+- Campo de fluxo (distâncias de todas as células até um alvo móvel)
+- Consultas de recurso/centro mais próximo (BFS com várias origens por tipo)
+"""
+
+import os
+from array import array
+from collections import deque
+from typing import List, Optional, Tuple
+
+from config import COLUNAS, LINHAS_LABIRINTO, LABIRINTO_LAYOUT, CACHE_LABIRINTO_DIR
+
+# Ordem das direções = ordem em que as saídas são listadas (e sorteadas)
+DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIREITA, ESQUERDA, BAIXO, CIMA = (1 << i for i in range(4))
+PARADO = 4 # Código de "chegada" para velocidade (0, 0)
+
+def codigo_direcao(dx: int, dy: int) -> int:
+    """Índice da direção em DIRECOES (PARADO para (0, 0))."""
+    if dx: return 0 if dx > 0 else 1
+    if dy: return 2 if dy > 0 else 3
+    return PARADO
+
+# Versão do layout: muda a cada alteração feita por alterar_celula. Os caches derivados do layout
+# (LABIRINTO e quem lê suas tabelas, a superfície do labirinto em telas.py e os BuscadorCaminhos
+# de utils.py) guardam a versão com que foram montados e comparam só esse número.
+_versao_layout = 0
+
+def versao_layout() -> int:
+    return _versao_layout
+
+def alterar_celula(x: int, y: int, valor: int, layout: List[List[int]] = LABIRINTO_LAYOUT):
+    """
+    Altera uma célula do layout (1 = parede, 0 = livre) e invalida os caches que dependem dele.
+    Edições feitas direto na lista não são detectadas: use sempre esta função.
+    """
+    global _versao_layout
+    layout[y][x] = valor
+    _versao_layout += 1
+    if layout is LABIRINTO.layout: LABIRINTO.recompilar()
+
+class LabirintoCompilado:
+    def __init__(self, layout: List[List[int]], colunas: int = COLUNAS, linhas: int = LINHAS_LABIRINTO):
+        self.layout, self.colunas, self.linhas = layout, colunas, linhas
+        self.recompilar()
+
+    def recompilar(self):
+        """Refaz todas as tabelas a partir do layout (o objeto continua o mesmo para quem o guarda)."""
+        layout, colunas, linhas = self.layout, self.colunas, self.linhas
+        self.versao = versao_layout()
+        n = colunas * linhas
+        # 1 = parede (fora da grade também conta como parede)
+        self.paredes = bytearray(1 if layout[y][x] == 1 else 0 for y in range(linhas) for x in range(colunas))
+        self.mascaras = bytearray(n)
+        # _saidas[indice * 5 + codigo_chegada] -> tupla de direções possíveis
+        self._saidas: List[Tuple[Tuple[int, int], ...]] = [()] * (n * 5)
+        for y in range(linhas):
+            for x in range(colunas):
+                indice = y * colunas + x
+                abertas = self._calcular_abertas(x, y)
+                self.mascaras[indice] = sum(1 << i for i, d in enumerate(DIRECOES) if d in abertas)
+                for codigo in range(5):
+                    self._saidas[indice * 5 + codigo] = self._sem_retorno(abertas, codigo)
+        # Vizinhos livres (índices planos) de cada célula, na ordem de DIRECOES
+        self.vizinhos: List[Tuple[int, ...]] = [
+            tuple(i + dy * colunas + dx for bit, (dx, dy) in enumerate(DIRECOES) if self.mascaras[i] >> bit & 1)
+            for i in range(n)
+        ]
+        self._tabela_distancias: Optional["TabelaDistancias"] = None
+
+    def parede(self, x: int, y: int) -> bool:
+        """True se (x, y) for parede ou estiver fora do labirinto."""
+        return not (0 <= x < self.colunas and 0 <= y < self.linhas) or self.paredes[y * self.colunas + x] == 1
+
+    def _calcular_abertas(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        return tuple((dx, dy) for dx, dy in DIRECOES if not self.parede(x + dx, y + dy))
+
+    @staticmethod
+    def _sem_retorno(abertas, codigo_chegada: int) -> Tuple[Tuple[int, int], ...]:
+        # Só proíbe voltar quando existe outra saída (becos sem saída permitem retornar)
+        if codigo_chegada == PARADO or len(abertas) <= 1: return abertas
+        dx, dy = DIRECOES[codigo_chegada]
+        return tuple(d for d in abertas if d != (-dx, -dy))
+
+    def abertas(self, x: int, y: int) -> int:
+        """Bitmask das direções abertas a partir de (x, y) (0 fora da grade)."""
+        if not (0 <= x < self.colunas and 0 <= y < self.linhas): return 0
+        return self.mascaras[y * self.colunas + x]
+
+    def saidas(self, x: int, y: int, vel_x: int, vel_y: int) -> Tuple[Tuple[int, int], ...]:
+        """Direções que uma entidade em (x, y), vindo com velocidade (vel_x, vel_y), pode tomar."""
+        if 0 <= x < self.colunas and 0 <= y < self.linhas:
+            return self._saidas[(y * self.colunas + x) * 5 + codigo_direcao(vel_x, vel_y)]
+        # Fora da grade (ex.: clone atravessando a borda): caminho lento, sem tabela
+        return self._sem_retorno(self._calcular_abertas(x, y), codigo_direcao(vel_x, vel_y))
+
+    def hash_layout(self) -> str:
+        """Identifica o layout (dimensões + paredes); muda sempre que o labirinto muda."""
+        import hashlib # Só usado ao montar/ler a tabela de distâncias
+        return hashlib.sha1(bytes(f"{self.colunas}x{self.linhas}:", "ascii") + bytes(self.paredes)).hexdigest()[:16]
+
+    def tabela_distancias(self) -> "TabelaDistancias":
+        """Tabela de distâncias entre todas as células (lida do disco ou calculada no primeiro uso)."""
+        if self._tabela_distancias is None:
+            self._tabela_distancias = TabelaDistancias.carregar_ou_calcular(self)
+        return self._tabela_distancias
+
+    def distancia(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[int]:
+        """Passos no menor caminho de a até b (None se alguma for parede ou não houver caminho)."""
+        return self.tabela_distancias().distancia(a, b)
+
+    def proximo_passo(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Célula vizinha de a no menor caminho até b (None se a == b ou não houver caminho)."""
+        return self.tabela_distancias().proximo_passo(a, b)
+
+class TabelaDistancias:
+    """
+    Distâncias (uint16) e próximo passo (código da direção, uint8) entre todos os pares
+    de células livres, em matrizes N x N indexadas pela posição da célula em 'celulas'.
+    Com ~250 células livres, as duas matrizes ocupam menos de 200 KB.
+    """
+    INALCANCAVEL = 0xFFFF
+    SEM_PASSO = 0xFF
+
+    def __init__(self, labirinto: LabirintoCompilado, distancias: array = None, proximos: array = None):
+        self.labirinto = labirinto
+        colunas = labirinto.colunas
+        self.celulas = [(i % colunas, i // colunas) for i, p in enumerate(labirinto.paredes) if not p]
+        self.n = n = len(self.celulas)
+        # Índice compacto de cada célula da grade (-1 para paredes)
+        self.indices = array('h', [-1]) * len(labirinto.paredes)
+        for i, (x, y) in enumerate(self.celulas): self.indices[y * colunas + x] = i
+        if distancias is None or proximos is None:
+            distancias, proximos = self._calcular()
+        self.distancias, self.proximos = distancias, proximos
+
+    def _calcular(self) -> Tuple[array, array]:
+        n, colunas, indices = self.n, self.labirinto.colunas, self.indices
+        vizinhos = [[(codigo, indices[(y + dy) * colunas + x + dx])
+                     for codigo, (dx, dy) in enumerate(DIRECOES) if not self.labirinto.parede(x + dx, y + dy)]
+                    for x, y in self.celulas]
+        distancias = array('H', [self.INALCANCAVEL]) * (n * n)
+        # Uma BFS por origem; o grafo é não direcionado, então distancias[a*n+b] == distancias[b*n+a]
+        for origem in range(n):
+            base = origem * n
+            distancias[base + origem] = 0
+            fila = deque([origem])
+            while fila:
+                atual = fila.popleft()
+                proxima = distancias[base + atual] + 1
+                for _, viz in vizinhos[atual]:
+                    if distancias[base + viz] == self.INALCANCAVEL:
+                        distancias[base + viz] = proxima
+                        fila.append(viz)
+        # Próximo passo de a até b: primeiro vizinho (na ordem de DIRECOES) que fica 1 passo mais perto
+        proximos = array('B', [self.SEM_PASSO]) * (n * n)
+        for a in range(n):
+            for b in range(n):
+                d = distancias[a * n + b]
+                if d == 0 or d == self.INALCANCAVEL: continue
+                for codigo, viz in vizinhos[a]:
+                    if distancias[viz * n + b] == d - 1:
+                        proximos[a * n + b] = codigo
+                        break
+        return distancias, proximos
+
+    @classmethod
+    def carregar_ou_calcular(cls, labirinto: LabirintoCompilado, pasta=CACHE_LABIRINTO_DIR) -> "TabelaDistancias":
+        """Lê a tabela do cache em disco (pelo hash do layout); se não houver, calcula e grava."""
+        caminho = pasta / f"distancias_{labirinto.hash_layout()}.bin"
+        n = sum(1 for p in labirinto.paredes if not p)
+        try:
+            with open(caminho, 'rb') as f:
+                distancias, proximos = array('H'), array('B')
+                distancias.fromfile(f, n * n)
+                proximos.fromfile(f, n * n)
+            return cls(labirinto, distancias, proximos)
+        except (OSError, EOFError):
+            pass # Ausente ou incompleto: recalcula
+        tabela = cls(labirinto)
+        try:
+            pasta.mkdir(parents=True, exist_ok=True)
+            temporario = caminho.with_suffix(".tmp")
+            with open(temporario, 'wb') as f:
+                tabela.distancias.tofile(f)
+                tabela.proximos.tofile(f)
+            os.replace(temporario, caminho)
+        except OSError as e:
+            print(f"[ERRO] Nao foi possivel gravar a tabela de distancias: {e}")
+        return tabela
+
+    def como_numpy(self):
+        """As duas matrizes como arrays NumPy N x N, sem cópia (NumPy é opcional; só esta função o exige)."""
+        import numpy as np
+        return (np.frombuffer(self.distancias, dtype=np.uint16).reshape(self.n, self.n),
+                np.frombuffer(self.proximos, dtype=np.uint8).reshape(self.n, self.n))
+
+    def _indice(self, celula: Tuple[int, int]) -> int:
+        x, y = celula
+        if not (0 <= x < self.labirinto.colunas and 0 <= y < self.labirinto.linhas): return -1
+        return self.indices[y * self.labirinto.colunas + x]
+
+    def distancia(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[int]:
+        ia, ib = self._indice(a), self._indice(b)
+        if ia < 0 or ib < 0: return None
+        d = self.distancias[ia * self.n + ib]
+        return None if d == self.INALCANCAVEL else d
+
+    def proximo_passo(self, a: Tuple[int, int], b: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        ia, ib = self._indice(a), self._indice(b)
+        if ia < 0 or ib < 0: return None
+        codigo = self.proximos[ia * self.n + ib]
+        if codigo == self.SEM_PASSO: return None
+        dx, dy = DIRECOES[codigo]
+        return (a[0] + dx, a[1] + dy)
+
+class CampoFluxo:
+    """
+    Distância (BFS) de cada célula do labirinto até um alvo, refeita só quando o alvo muda de célula.
+    Compartilhado por várias entidades: cada uma escolhe sua saída lendo o campo em O(1),
+    então o custo não cresce com o número de perseguidores.
+    """
+    INFINITO = 0xFFFF
+
+    def __init__(self, labirinto: LabirintoCompilado):
+        self.labirinto = labirinto
+        n = labirinto.colunas * labirinto.linhas
+        self.distancias = array('H', [self.INFINITO]) * n
+        self._vazio = array('H', [self.INFINITO]) * n
+        self._vizinhos = labirinto.vizinhos
+        self._fila = array('i', [0]) * n
+        self.alvo: Optional[Tuple[int, int]] = None
+        self._versao = labirinto.versao
+        self.recalculos = 0
+
+    def atualizar(self, alvo: Tuple[int, int]):
+        """Recalcula o campo se o alvo mudou de célula ou o labirinto foi alterado (senão, não faz nada)."""
+        if alvo == self.alvo and self._versao == self.labirinto.versao: return
+        if self._versao != self.labirinto.versao:
+            self._versao, self._vizinhos = self.labirinto.versao, self.labirinto.vizinhos
+        self.alvo = alvo
+        self.recalculos += 1
+        distancias, vizinhos, fila = self.distancias, self._vizinhos, self._fila
+        distancias[:] = self._vazio
+        x, y = alvo
+        if self.labirinto.parede(x, y): return # Alvo fora das células livres: campo todo infinito
+        origem = y * self.labirinto.colunas + x
+        distancias[origem] = 0
+        fila[0], cabeca, cauda = origem, 0, 1
+        while cabeca < cauda:
+            atual = fila[cabeca]; cabeca += 1
+            proxima = distancias[atual] + 1
+            for viz in vizinhos[atual]:
+                if distancias[viz] == self.INFINITO:
+                    distancias[viz] = proxima
+                    fila[cauda] = viz; cauda += 1
+
+    def distancia(self, x: int, y: int) -> int:
+        """Passos de (x, y) até o alvo (INFINITO se for parede, estiver fora ou sem caminho)."""
+        if not (0 <= x < self.labirinto.colunas and 0 <= y < self.labirinto.linhas): return self.INFINITO
+        return self.distancias[y * self.labirinto.colunas + x]
+
+    def melhor_saida(self, x: int, y: int, opcoes) -> Optional[Tuple[int, int]]:
+        """Entre as direções em 'opcoes', a que leva mais perto do alvo (a primeira, em caso de empate)."""
+        melhor, melhor_distancia = None, self.INFINITO
+        for dx, dy in opcoes:
+            d = self.distancia(x + dx, y + dy)
+            if d < melhor_distancia: melhor, melhor_distancia = (dx, dy), d
+        return melhor
+
+class ConsultaProximidade:
+    """
+    Responde "qual o recurso de tipo X mais próximo" e "qual centro alcanço primeiro".
+    Mantém, por tipo de recurso, a distância de cada célula até o recurso desse tipo mais
+    próximo (uma BFS com todas as ocorrências como origem). Um recurso novo só relaxa o
+    campo a partir da sua célula; um recurso coletado só refaz as células que o tinham
+    como mais próximo. O caminho até o mais próximo desce o campo em O(comprimento).
+    """
+    INFINITO = 0xFFFF
+
+    def __init__(self, recursos, labirinto: LabirintoCompilado = None):
+        self.labirinto = labirinto or LABIRINTO
+        self.recursos = recursos
+        self._n = self.labirinto.colunas * self.labirinto.linhas
+        self._campos: dict = {}     # tipo -> array('H') de distâncias
+        self._versao = self.labirinto.versao
+        self._fila = array('i', [0]) * self._n
+        self.reconstrucoes = 0
+        recursos.adicionar_ouvinte(self._ao_alterar_recurso)
+
+    def _conferir_versao(self):
+        # Labirinto alterado: os campos são refeitos do zero na próxima consulta
+        if self._versao != self.labirinto.versao:
+            self._campos.clear()
+            self._versao = self.labirinto.versao
+
+    def _ao_alterar_recurso(self, x: int, y: int, tipo: str, presente: bool):
+        self._conferir_versao()
+        campo = self._campos.get(tipo)
+        if campo is None: return # Campo ainda não pedido: nasce completo na primeira consulta
+        if not presente:
+            self._remover_origem(campo, y * self.labirinto.colunas + x)
+        else:
+            self._propagar(campo, [y * self.labirinto.colunas + x])
+
+    def _propagar(self, campo: array, origens: List[int]):
+        """BFS a partir de 'origens' (distância 0), só descendo distâncias que melhorarem."""
+        vizinhos, fila = self.labirinto.vizinhos, self._fila
+        cauda = 0
+        for origem in origens:
+            if campo[origem] != 0:
+                campo[origem] = 0
+                fila[cauda] = origem; cauda += 1
+        cabeca = 0
+        while cabeca < cauda:
+            atual = fila[cabeca]; cabeca += 1
+            proxima = campo[atual] + 1
+            for viz in vizinhos[atual]:
+                if proxima < campo[viz]:
+                    campo[viz] = proxima
+                    fila[cauda] = viz; cauda += 1
+
+    def _remover_origem(self, campo: array, origem: int):
+        """Retira a origem 'origem' do campo, refazendo só as células que a tinham como mais próxima."""
+        if campo[origem] != 0: return
+        vizinhos, fila, infinito = self.labirinto.vizinhos, self._fila, self.INFINITO
+        # 1) Região afetada: células que descem até 'origem' pelo campo (a distância cresce 1 a cada
+        #    passo). Percorrida por níveis, então a distância antiga de cada nível é conhecida e a
+        #    célula pode ser apagada (INFINITO) ao entrar na fila. Um vizinho que continua finito
+        #    não depende de 'origem': fica como semente, já com a distância certa.
+        sementes = []
+        campo[origem] = infinito
+        fila[0], inicio, fim, distancia = origem, 0, 1, 0
+        while inicio < fim:
+            fim_nivel = fim
+            for posicao in range(inicio, fim_nivel):
+                for viz in vizinhos[fila[posicao]]:
+                    valor = campo[viz]
+                    if valor == distancia + 1:
+                        campo[viz] = infinito
+                        fila[fim] = viz; fim += 1
+                    elif valor != infinito:
+                        sementes.append(viz)
+            inicio, distancia = fim_nivel, distancia + 1
+        if not sementes: return # Era o último recurso do tipo alcançável: a região fica INFINITO
+        # 2) Repropaga para dentro da região, intercalando as sementes (em ordem de distância)
+        #    com a fila, para processar as células sempre da menor distância para a maior
+        sementes.sort(key=campo.__getitem__)
+        cabeca = cauda = proxima_semente = 0
+        while proxima_semente < len(sementes) or cabeca < cauda:
+            if cabeca == cauda or (proxima_semente < len(sementes) and campo[sementes[proxima_semente]] <= campo[fila[cabeca]]):
+                atual = sementes[proxima_semente]; proxima_semente += 1
+            else:
+                atual = fila[cabeca]; cabeca += 1
+            proxima = campo[atual] + 1
+            for viz in vizinhos[atual]:
+                if proxima < campo[viz]:
+                    campo[viz] = proxima
+                    fila[cauda] = viz; cauda += 1
+
+    def _campo(self, tipo: str) -> array:
+        self._conferir_versao()
+        campo = self._campos.get(tipo)
+        if campo is None:
+            campo = self._campos[tipo] = array('H', [self.INFINITO]) * self._n
+            colunas = self.labirinto.colunas
+            self._propagar(campo, [y * colunas + x for x, y, t in self.recursos if t == tipo])
+            self.reconstrucoes += 1
+        return campo
+
+    def _indice(self, celula: Tuple[int, int]) -> int:
+        x, y = celula
+        if self.labirinto.parede(x, y): return -1
+        return y * self.labirinto.colunas + x
+
+    def distancia_recurso(self, origem: Tuple[int, int], tipo: str) -> Optional[int]:
+        """Passos de 'origem' até o recurso 'tipo' mais próximo (None se não houver)."""
+        indice = self._indice(origem)
+        if indice < 0: return None
+        d = self._campo(tipo)[indice]
+        return None if d == self.INFINITO else d
+
+    def caminho_recurso_mais_proximo(self, origem: Tuple[int, int], tipo: str) -> List[Tuple[int, int]]:
+        """Menor caminho (origem inclusive) até o recurso 'tipo' mais próximo, ou [] se não houver."""
+        indice = self._indice(origem)
+        if indice < 0: return []
+        campo, vizinhos, colunas = self._campo(tipo), self.labirinto.vizinhos, self.labirinto.colunas
+        if campo[indice] == self.INFINITO: return []
+        caminho = [origem]
+        while campo[indice] > 0:
+            # Desce o campo: algum vizinho está sempre exatamente 1 passo mais perto
+            indice = next(viz for viz in vizinhos[indice] if campo[viz] == campo[indice] - 1)
+            caminho.append((indice % colunas, indice // colunas))
+        return caminho
+
+    def recurso_mais_proximo(self, origem: Tuple[int, int], tipo: str) -> Optional[Tuple[int, int]]:
+        """Célula do recurso 'tipo' mais próximo de 'origem' (None se não houver)."""
+        caminho = self.caminho_recurso_mais_proximo(origem, tipo)
+        return caminho[-1] if caminho else None
+
+    def centro_mais_proximo(self, origem: Tuple[int, int], inventario, centros):
+        """Centro incompleto que aceita algum item do inventário e é alcançado em menos passos (ou None)."""
+        melhor, melhor_distancia = None, None
+        for centro in centros:
+            if centro.nivel_atual >= centro.nivel_max or centro.recurso_necessario not in inventario: continue
+            d = self.labirinto.distancia(origem, (centro.x, centro.y))
+            if d is not None and (melhor_distancia is None or d < melhor_distancia):
+                melhor, melhor_distancia = centro, d
+        return melhor
+
+    def caminho_ate(self, origem: Tuple[int, int], destino: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Menor caminho (origem inclusive) seguindo a tabela de próximo passo, ou [] se não houver."""
+        if self.labirinto.distancia(origem, destino) is None: return []
+        caminho = [origem]
+        while caminho[-1] != destino:
+            caminho.append(self.labirinto.proximo_passo(caminho[-1], destino))
+        return caminho
+
+LABIRINTO = LabirintoCompilado(LABIRINTO_LAYOUT)
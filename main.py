@@ -8,18 +8,24 @@ Orquestra o jogo:
 - Gerencia as entidades e a lógica de jogo
 """
 
-import pygame
 import sys
+
+# Perfil de inicialização: precisa rodar antes de qualquer import do jogo (inclusive pygame)
+if __name__ == '__main__' and '--import-profile' in sys.argv:
+    from perfil_inicializacao import executar_perfil
+    sys.exit(executar_perfil())
+
+import pygame
 import random
 import datetime
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Tuple
 
 # --- 1. Importar Constantes e Configurações ---
 from config import *
 
 # --- 2. Importar Utilitários e Sistemas ---
 from utils import (
-    tocar_musica_labirinto, tocar_musica_game_over, parar_musica,
+    tocar_musica_labirinto, tocar_musica_game_over, parar_musica, pausar_musica,
     carregar_usuarios, salvar_usuarios,
     RewardsSystem,
     encontrar_caminho,
@@ -28,22 +34,28 @@ from utils import (
 )
 
 # --- 3. Importar Entidades do Jogo ---
-from entidades import Player, Inimigo, CentroComunitario
+from entidades import Player, Inimigo, CentroComunitario, GradeRecursos, PoolCelulasLivres
 
 # --- 4. Importar Funções de Desenho de UI ---
 from telas import *
 
+# --- 5. Importar Caches de Assets (Fontes, Textos e Sprites) ---
+from assets import obter_fonte, estatisticas_fontes, renderizar_texto, estatisticas_textos, iniciar_carregamento_assets
+
 
 # --- Loop Principal e Logica de Estados ---
 def main():
     # --- Inicialização do Pygame ---
-    pygame.init()
-    pygame.mixer.init()
+    # Só vídeo/eventos: fontes e áudio iniciam no primeiro uso (obter_fonte, tocar_musica_*)
+    pygame.display.init()
     
     # Mover a criação de tela e clock para dentro do main
     tela = pygame.display.set_mode((LARGURA, ALTURA))
     pygame.display.set_caption("Pac-Man - A Missão Comunitária")
     clock = pygame.time.Clock()
+    clock.tick() # Também inicia o timer do SDL, usado por pygame.time.get_ticks
+    # Sprites são lidos numa thread enquanto o jogador está nos menus (jogo primeiro, por prioridade)
+    carregador_assets = iniciar_carregamento_assets()
     
     rodando = True
     estado_jogo = 'tela_inicial'
@@ -58,7 +70,7 @@ def main():
     avaliacoes_dados = carregar_avaliacoes()
     
     # --- Variáveis de Estado (Avaliação) ---
-    fonte_layout_avaliacao = pygame.font.SysFont(None, 24)
+    fonte_layout_avaliacao = obter_fonte(None, 24)
     layout_avaliacao, perguntas_avaliacao = construir_layout_avaliacao(QUESTOES_AVALIACAO, fonte_layout_avaliacao, 520)
     rects_avaliacao = gerar_rects_avaliacao(perguntas_avaliacao)
     respostas_avaliacao = {}
@@ -112,7 +124,7 @@ def main():
     player: Player | None = None
     inimigos: List[Inimigo] = []
     centros: List[CentroComunitario] = []
-    recursos: List[Dict] = []
+    recursos = GradeRecursos()
     pontos = 0
     inimigo_colisor: Inimigo | None = None
     pontos_finais, pontos_bonus_vitoria = 0, 0
@@ -120,14 +132,23 @@ def main():
     tempo_inicio_partida = datetime.datetime.now()
     musica_labirinto_tocando = False
     jogo_pausado = False
+    renderizador_jogo = RenderizadorDirtyRects()
+    motor_fantasmas = None
+    if MOTOR_FANTASMAS_NUMPY:
+        from motor_fantasmas import MotorFantasmas # NumPy só é necessário com o motor ligado
+        motor_fantasmas = MotorFantasmas()
+    
+    # Menus sem animação: enquanto nada acontece, o loop dorme em pygame.event.wait
+    estados_menu_estaticos = {'tela_inicial', 'tela_dificuldade', 'tela_instrucoes', 'tela_rewards', 'tela_ranking'}
+    ultimo_estado_desenhado = None
     
     # --- Variáveis de Spawn ---
-    tipos_recursos_padrao = ['Moeda', 'Alimento', 'Livro', 'Tijolo']
+    tipos_recursos_padrao = list(TIPOS_RECURSOS)
     tempo_spawn_recursos_ms = 900
     timer_spawn_recursos = 0
     max_recursos_no_cenario = 60
-    # (Sugestão #4) Set dinâmico de posições livres
-    posicoes_livres_dinamicas: Set[Tuple[int, int]] = set() 
+    # (Sugestão #4) Pool dinâmico de posições livres (sorteio O(1))
+    posicoes_livres_dinamicas = PoolCelulasLivres()
 
     # --- Funções Aninhadas (para gerenciar o estado do jogo) ---
     
@@ -137,57 +158,72 @@ def main():
         nomes, cores = ["Desemprego","Desigualdade","Falta de Acesso","Crise Economica"], [CINZA,ROXO,CINZA_ESCURO,VERMELHO_CRISE]
         inimigos.clear()
         Inimigo.id_counter = 0
+        Inimigo.pool_clones.limpar()
         for i,pos in enumerate(posicoes_iniciais_inimigos):
             inimigos.append(Inimigo(pos[0], pos[1], cores[i], nomes[i], dificuldade))
+        if motor_fantasmas is not None: motor_fantasmas.carregar(inimigos)
     
     def inicializar_novo_jogo(dificuldade):
         nonlocal pontos, centros, recursos, player, tempo_inicio_partida, timer_spawn_recursos
         nonlocal posicoes_livres_dinamicas # (Sugestão #4)
         
+        carregador_assets.aguardar() # Normalmente já terminou durante os menus
         pontos, tempo_inicio_partida = 0, datetime.datetime.now()
         player = Player(1, 1)
         centros = [CentroComunitario(1, 7, "Moradia", COR_MORADIA, "Tijolo"), CentroComunitario(30, 7, "Mercado", COR_MERCADO, "Alimento"), CentroComunitario(15, 1, "Escola", COR_ESCOLA, "Livro"), CentroComunitario(15, 13, "Hospital", COR_HOSPITAL, "Moeda")]
-        recursos = []
+        recursos = GradeRecursos()
         timer_spawn_recursos = 0
         
-        # (Sugestão #4) Inicializa o set dinâmico a partir da constante
-        posicoes_livres_dinamicas = set(MAPA_POSICOES_LIVRES) 
+        # (Sugestão #4) Inicializa o pool dinâmico a partir da constante
+        posicoes_livres_dinamicas = PoolCelulasLivres(MAPA_POSICOES_LIVRES)
         
         # Remove posições ocupadas inicialmente
-        posicoes_livres_dinamicas.discard((player.grid_x, player.grid_y))
+        posicoes_livres_dinamicas.remover((player.grid_x, player.grid_y))
         for c in centros:
-            posicoes_livres_dinamicas.discard((c.x, c.y))
+            posicoes_livres_dinamicas.remover((c.x, c.y))
             
         for tipo in tipos_recursos_padrao:
             for _ in range(6):
                 if not posicoes_livres_dinamicas: break
-                pos = random.choice(list(posicoes_livres_dinamicas))
-                recursos.append({'x':pos[0], 'y':pos[1], 'tipo':tipo})
-                posicoes_livres_dinamicas.discard(pos) # Remove do set
+                pos = posicoes_livres_dinamicas.retirar_aleatoria()
+                recursos.adicionar(pos[0], pos[1], tipo)
 
         reiniciar_posicoes(dificuldade)
+        renderizador_jogo.invalidar()
         
     def spawn_recurso():
         nonlocal recursos, posicoes_livres_dinamicas # (Sugestão #4)
         if len(recursos) >= max_recursos_no_cenario: return
-        if not posicoes_livres_dinamicas: return # (Sugestão #4) Checa o set
+        if not posicoes_livres_dinamicas: return # (Sugestão #4) Checa o pool
         
         quantidade_por_spawn = 2
         for _ in range(quantidade_por_spawn):
             if len(recursos) >= max_recursos_no_cenario or not posicoes_livres_dinamicas: break
             
-            # (Sugestão #4) Pega uma posição direto do set (muito rápido)
-            pos = random.choice(list(posicoes_livres_dinamicas))
-            posicoes_livres_dinamicas.discard(pos)
+            # (Sugestão #4) Sorteia e remove a posição do pool em O(1)
+            pos = posicoes_livres_dinamicas.retirar_aleatoria()
             
             tipo = random.choice(tipos_recursos_padrao)
-            recursos.append({'x': pos[0], 'y': pos[1], 'tipo': tipo})
+            recursos.adicionar(pos[0], pos[1], tipo)
 
     # ==========================
     # --- INICIO DO GAME LOOP ---
     # ==========================
     while rodando:
-        eventos = pygame.event.get()
+        rects_sujos = None
+        if not carregador_assets.concluido:
+            carregador_assets.processar()
+            ultimo_estado_desenhado = None # Redesenha o menu (com a barra de progresso) até terminar
+        if estado_jogo == ultimo_estado_desenhado and estado_jogo in estados_menu_estaticos:
+            # A tela já está na tela e só muda com um evento ou com a expiração de um popup
+            expiracoes = [p["expira"] for p in (popup_sem_cadastro, popup_controles) if p["ativo"]]
+            timeout = max(1, min(expiracoes) - pygame.time.get_ticks() + 1) if expiracoes else 0
+            evento = pygame.event.wait(timeout)
+            eventos = ([] if evento.type == pygame.NOEVENT else [evento]) + pygame.event.get()
+            clock.tick() # Descarta o tempo parado para não inflar o dt do próximo quadro
+        else:
+            eventos = pygame.event.get()
+        ultimo_estado_desenhado = estado_jogo
         for e in eventos:
             if e.type == pygame.QUIT: rodando = False
         
@@ -218,13 +254,11 @@ def main():
                             popup_sem_cadastro["ativo"] = True
                             popup_sem_cadastro["expira"] = pygame.time.get_ticks() + 10000  # 10 segundos
             
-            desenhar_tela_inicial(tela, rects_inicial)
+            if popup_sem_cadastro["ativo"] and pygame.time.get_ticks() > popup_sem_cadastro["expira"]:
+                popup_sem_cadastro["ativo"] = False
             
-            # Desenhar popup se ativo
-            if popup_sem_cadastro["ativo"]:
-                desenhar_popup_sem_cadastro(tela)
-                if pygame.time.get_ticks() > popup_sem_cadastro["expira"]:
-                    popup_sem_cadastro["ativo"] = False
+            # O popup faz parte da tela em cache (recomposta só quando ele abre/fecha)
+            desenhar_tela_inicial(tela, rects_inicial, popup_sem_cadastro["ativo"])
 
         elif estado_jogo in ['tela_login', 'tela_cadastro']:
             titulo = "Logar" if estado_jogo == 'tela_login' else "Cadastrar"
@@ -313,11 +347,7 @@ def main():
                         estado_jogo = 'tela_inicial'
                         
                     if dificuldade_foi_escolhida: inicializar_novo_jogo(dificuldade_selecionada); estado_jogo = 'jogo'
-            desenhar_tela_dificuldade(tela, rects_dificuldade, nick_usuario)
-            
-            # Desenhar popup de controles se ativo
-            if popup_controles["ativo"]:
-                desenhar_popup_controles(tela)
+            desenhar_tela_dificuldade(tela, rects_dificuldade, nick_usuario, popup_controles["ativo"])
 
         elif estado_jogo == 'tela_instrucoes':
             for e in eventos:
@@ -403,7 +433,7 @@ def main():
                     elif rects_game_over['nao'].collidepoint(e.pos):
                         if player:
                             tempo_decorrido = (datetime.datetime.now() - tempo_inicio_partida).total_seconds()
-                            player.stats["tempo_jogado"], player.stats["tempo_sobrevivencia"] = tempo_decorrido, tempo_decorrido
+                            player.stats.tempo_jogado, player.stats.tempo_sobrevivencia = tempo_decorrido, tempo_decorrido
                             # Só adiciona pontos se não for visitante
                             if nick_usuario != "Visitante":
                                 rewards_system.adicionar_pontos(nick_usuario, pontos, "partida")
@@ -434,10 +464,7 @@ def main():
                     if e.key == pygame.K_p:
                         jogo_pausado = not jogo_pausado
                         # Pausar/despausar música
-                        if jogo_pausado:
-                            pygame.mixer.music.pause()
-                        else:
-                            pygame.mixer.music.unpause()
+                        pausar_musica(jogo_pausado)
                 
                 # Botão desistir
                 if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
@@ -450,19 +477,30 @@ def main():
                             jogo_pausado = False
                             estado_jogo = 'tela_dificuldade'
                             continue
+                        
+                        # Clique no labirinto: piloto automático até a célula clicada
+                        if not jogo_pausado and mouse_y < LINHAS_LABIRINTO * TAM_CELULA:
+                            celula = (mouse_x // TAM_CELULA, mouse_y // TAM_CELULA)
+                            if celula in MAPA_POSICOES_LIVRES:
+                                player.definir_destino(celula)
             
             # Se o jogo está pausado, não atualiza a lógica
             if not jogo_pausado:
                 # --- Movimentação contínua por teclado (estilo Pac-Man original) ---
                 teclas = pygame.key.get_pressed()
+                direcao_teclado = None
                 if teclas[pygame.K_LEFT] or teclas[pygame.K_a]:
-                    player.dir_x, player.dir_y = -1, 0
+                    direcao_teclado = (-1, 0)
                 elif teclas[pygame.K_RIGHT] or teclas[pygame.K_d]:
-                    player.dir_x, player.dir_y = 1, 0
+                    direcao_teclado = (1, 0)
                 elif teclas[pygame.K_UP] or teclas[pygame.K_w]:
-                    player.dir_x, player.dir_y = 0, -1
+                    direcao_teclado = (0, -1)
                 elif teclas[pygame.K_DOWN] or teclas[pygame.K_s]:
-                    player.dir_x, player.dir_y = 0, 1
+                    direcao_teclado = (0, 1)
+                if direcao_teclado:
+                    # O teclado tem prioridade: desliga o piloto automático do clique
+                    player.cancelar_caminho()
+                    player.dir_x, player.dir_y = direcao_teclado
                 
                 # --- Atualização de Lógica ---
                 player.atualizar_animacao(dt)
@@ -471,27 +509,34 @@ def main():
                 # (Sugestão #4) Lógica de coleta modificada
                 pos_liberada = player.coletar(recursos)
                 if pos_liberada:
-                    posicoes_livres_dinamicas.add(pos_liberada)
+                    posicoes_livres_dinamicas.adicionar(pos_liberada)
                 
                 timer_spawn_recursos += dt
                 if timer_spawn_recursos >= tempo_spawn_recursos_ms:
                     timer_spawn_recursos = 0
                     spawn_recurso()
                 
-                novos_inimigos, remover_ids = [], []
-                for inimigo in list(inimigos):
-                    inimigo.mover(player) 
-                    inimigo.atualizar_divisao(dt, novos_inimigos, remover_ids)
-                    if inimigo.grid_x == player.grid_x and inimigo.grid_y == player.grid_y and inimigo.visivel:
-                        inimigo_colisor = inimigo
-                        parar_musica()
-                        tocar_musica_game_over()
-                        musica_labirinto_tocando = False
-                        jogo_pausado = False
-                        estado_jogo = 'tela_game_over'
+                colisor = None
+                if motor_fantasmas is not None:
+                    # Mesmo laço abaixo (mover, dividir, colidir), em lote; já aplica clones novos/removidos
+                    colisor = motor_fantasmas.atualizar(inimigos, player, dt)
+                else:
+                    novos_inimigos, remover_ids = [], []
+                    for inimigo in list(inimigos):
+                        inimigo.mover(player)
+                        inimigo.atualizar_divisao(dt, novos_inimigos, remover_ids)
+                        if inimigo.grid_x == player.grid_x and inimigo.grid_y == player.grid_y and inimigo.visivel:
+                            colisor = inimigo
+                    if novos_inimigos: inimigos.extend(novos_inimigos)
+                    if remover_ids: inimigos[:] = [ini for ini in inimigos if ini.id not in remover_ids]
                 
-                if novos_inimigos: inimigos.extend(novos_inimigos)
-                if remover_ids: inimigos[:] = [ini for ini in inimigos if ini.id not in remover_ids]
+                if colisor is not None:
+                    inimigo_colisor = colisor
+                    parar_musica()
+                    tocar_musica_game_over()
+                    musica_labirinto_tocando = False
+                    jogo_pausado = False
+                    estado_jogo = 'tela_game_over'
                 
                 for centro in centros:
                     centro.atualizar_animacao(dt)
@@ -504,21 +549,13 @@ def main():
                     centro.atualizar_animacao(dt)
             
             # --- Desenho ---
-            tela.fill(PRETO)
-            desenhar_labirinto(tela)
-            desenhar_recursos(tela, recursos)
-            for centro in centros: centro.desenhar(tela)
-            desenhar_rotulos_coleta(tela, centros, player)
-            player.desenhar(tela)
-            for inimigo in inimigos: inimigo.desenhar(tela)
-            desenhar_hud(tela, player, centros, pontos)
-            
-            # Desenhar botão desistir no HUD
-            pygame.draw.rect(tela, (150, 50, 50), rect_desistir_jogo, border_radius=6)
-            pygame.draw.rect(tela, (200, 80, 80), rect_desistir_jogo, width=2, border_radius=6)
-            fonte_desistir = pygame.font.SysFont(None, 26)
-            texto_desistir = fonte_desistir.render("Desistir", True, BRANCO)
-            tela.blit(texto_desistir, texto_desistir.get_rect(center=rect_desistir_jogo.center))
+            # Com o motor ligado, as posições dos fantasmas estão nos arrays dele (não nos objetos)
+            inimigos_cena = motor_fantasmas if motor_fantasmas is not None else inimigos
+            if RENDER_DIRTY_RECTS and not jogo_pausado:
+                rects_sujos = renderizador_jogo.desenhar(tela, player, inimigos_cena, centros, recursos, pontos, rect_desistir_jogo)
+            else:
+                renderizador_jogo.invalidar()
+                desenhar_cena_jogo(tela, player, inimigos_cena, centros, recursos, pontos, rect_desistir_jogo)
             
             # Overlay de pausa
             if jogo_pausado:
@@ -528,11 +565,11 @@ def main():
                 tela.blit(overlay, (0, 0))
                 
                 # Mensagem de pausa
-                fonte_pausa_titulo = pygame.font.SysFont("bahnschrift", 60, bold=True)
-                fonte_pausa_info = pygame.font.SysFont(None, 30)
+                fonte_pausa_titulo = obter_fonte("bahnschrift", 60, negrito=True)
+                fonte_pausa_info = obter_fonte(None, 30)
                 
-                texto_pausado = fonte_pausa_titulo.render("JOGO PAUSADO", True, COR_OURO)
-                texto_continuar = fonte_pausa_info.render("Pressione [P] para continuar", True, BRANCO)
+                texto_pausado = renderizar_texto(fonte_pausa_titulo, "JOGO PAUSADO", COR_OURO)
+                texto_continuar = renderizar_texto(fonte_pausa_info, "Pressione [P] para continuar", BRANCO)
                 
                 tela.blit(texto_pausado, texto_pausado.get_rect(center=(LARGURA//2, ALTURA//2 - 30)))
                 tela.blit(texto_continuar, texto_continuar.get_rect(center=(LARGURA//2, ALTURA//2 + 30)))
@@ -540,10 +577,10 @@ def main():
             # --- Verificação de Vitória ---
             if all(c.nivel_atual >= c.nivel_max for c in centros):
                 tempo_decorrido = (datetime.datetime.now() - tempo_inicio_partida).total_seconds()
-                player.stats["tempo_jogado"] = tempo_decorrido
-                player.stats["tempo_sobrevivencia"] = tempo_decorrido
-                player.stats["vitorias"] = 1
-                player.stats["centros_completos"] = len(centros)
+                player.stats.tempo_jogado = tempo_decorrido
+                player.stats.tempo_sobrevivencia = tempo_decorrido
+                player.stats.vitorias = 1
+                player.stats.centros_completos = len(centros)
                 
                 pontos_finais = pontos
                 pontos_bonus_vitoria = 500
@@ -560,11 +597,20 @@ def main():
                 musica_labirinto_tocando = False
                 estado_jogo = 'tela_vitoria'
 
-        # Atualiza a tela
-        pygame.display.flip()
+        if not carregador_assets.concluido and estado_jogo in estados_menu_estaticos:
+            desenhar_progresso_carregamento(tela, carregador_assets.progresso())
+
+        # Atualiza a tela (apenas as áreas sujas, se o renderizador as informou)
+        if rects_sujos is not None:
+            pygame.display.update(rects_sujos)
+        else:
+            pygame.display.flip()
         clock.tick(FPS)
 
     # --- Fim do Jogo ---
+    print(f"[LOG] Cache de fontes: {estatisticas_fontes()}")
+    print(f"[LOG] Cache de textos: {estatisticas_textos()}")
+    print(f"[LOG] Pool de clones: {Inimigo.pool_clones.estatisticas()}")
     pygame.quit()
     sys.exit()
 
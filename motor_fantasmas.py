@@ -0,0 +1,270 @@
+"""
+Motor de Fantasmas em Arrays (motor_fantasmas.py)
+
+Alternativa ao laço "for inimigo in inimigos: mover + atualizar_divisao + colisão".
+Posição, velocidade e timers de invisibilidade de todos os fantasmas ficam
+em arrays NumPy (os arrays são o estado oficial; os objetos Inimigo não são
+atualizados a cada quadro) e todos avançam em um único passo:
+- Teste de alinhamento, timers de invisibilidade, posição e colisão: vetorizados
+- Saídas legais e escolha da saída (perseguição ou sorteio): tabelas + campo de fluxo
+- Sorteios (random) e divisão da Crise Econômica: em Python, fantasma por
+  fantasma, na mesma ordem do laço de main.py; com a mesma semente o
+  resultado é idêntico ao laço original (clones inclusive)
+- Desenho: telas.py lê os centros direto dos arrays (veja posicoes)
+
+NumPy é opcional para o resto do jogo; este módulo só é importado com
+MOTOR_FANTASMAS_NUMPY = True em config.py.
+Modo de estresse: python motor_fantasmas.py [quantidade_de_fantasmas]
+"""
+
+import random
+import numpy as np
+from typing import List, Optional
+
+from config import TAM_CELULA, FPS, MAPA_POSICOES_LIVRES
+from labirinto import LABIRINTO, DIRECOES, PARADO, LabirintoCompilado, CampoFluxo, codigo_direcao
+from entidades import Inimigo
+
+# Velocidade de cada código de direção (o último é PARADO)
+VELOCIDADES = DIRECOES + ((0, 0),)
+
+class MotorFantasmas:
+    def __init__(self, labirinto: LabirintoCompilado = LABIRINTO, campo: CampoFluxo = None):
+        self.labirinto = labirinto
+        # Mesmo campo compartilhado por Inimigo.mover (recalculado só quando o jogador muda de célula)
+        self.campo = campo if campo is not None else Inimigo.campo_perseguicao
+        self._compilar_saidas()
+        # Deslocamento do índice plano para cada código de direção (o último serve às posições vazias)
+        self._passo_indice = np.array([1, -1, labirinto.colunas, -labirinto.colunas, 0], dtype=np.int64)
+        self._dx = np.array([dx for dx, _ in VELOCIDADES], dtype=np.int64)
+        self._dy = np.array([dy for _, dy in VELOCIDADES], dtype=np.int64)
+        # Código da velocidade atual: _codigo_chegada[(vel_x + 1) * 3 + vel_y + 1]
+        self._codigo_chegada = np.full(9, PARADO, dtype=np.int64)
+        for codigo, (dx, dy) in enumerate(DIRECOES): self._codigo_chegada[(dx + 1) * 3 + dy + 1] = codigo
+        self._objetos: List[Inimigo] = []
+        self.carregar([])
+
+    def _compilar_saidas(self):
+        """Tabela de saídas em códigos (refeita quando o labirinto é alterado)."""
+        lab = self.labirinto
+        self._versao = lab.versao
+        # _codigos_saidas[indice * 5 + codigo_chegada] -> códigos das saídas legais (-1 = vazio),
+        # na mesma ordem de LabirintoCompilado.saidas
+        self._codigos_saidas = np.full((lab.colunas * lab.linhas * 5, 4), -1, dtype=np.int8)
+        for y in range(lab.linhas):
+            for x in range(lab.colunas):
+                for codigo in range(PARADO + 1):
+                    linha = (y * lab.colunas + x) * 5 + codigo
+                    for j, direcao in enumerate(lab.saidas(x, y, *VELOCIDADES[codigo])):
+                        self._codigos_saidas[linha, j] = codigo_direcao(*direcao)
+
+    def carregar(self, inimigos: List[Inimigo]):
+        """Devolve o estado atual aos objetos antigos e copia os de 'inimigos' para os arrays."""
+        self.sincronizar()
+        self._objetos = list(inimigos)
+        self.px = np.array([i.px for i in inimigos], dtype=np.float64)
+        self.py = np.array([i.py for i in inimigos], dtype=np.float64)
+        self.vel_x = np.array([i.vel_x for i in inimigos], dtype=np.int64)
+        self.vel_y = np.array([i.vel_y for i in inimigos], dtype=np.int64)
+        self.velocidade = np.array([i.velocidade for i in inimigos], dtype=np.float64)
+        self._velocidades = self.velocidade.tolist()
+        self.comportamento_aleatorio = [i.comportamento_aleatorio for i in inimigos]
+        self.invisivel = np.array([i.invisivel for i in inimigos], dtype=bool)
+        self.visivel = np.array([i.visivel for i in inimigos], dtype=bool)
+        self.timer_invisibilidade = np.array([i.timer_invisibilidade for i in inimigos], dtype=np.int64)
+        self.tempo_para_trocar = np.array([i.tempo_para_trocar for i in inimigos], dtype=np.int64)
+        self.divisor = np.array([i.pode_dividir for i in inimigos], dtype=bool)
+        self._invisiveis = np.flatnonzero(self.invisivel)
+
+    def sincronizar(self):
+        """Escreve nos objetos Inimigo o estado que só existe nos arrays (posição, velocidade e timers)."""
+        objetos = self._objetos
+        if not objetos: return
+        for objeto, px, py, vel_x, vel_y in zip(objetos, self.px.tolist(), self.py.tolist(),
+                                                self.vel_x.tolist(), self.vel_y.tolist()):
+            objeto.px, objeto.py, objeto.vel_x, objeto.vel_y = px, py, vel_x, vel_y
+        for i, timer in zip(self._invisiveis.tolist(), self.timer_invisibilidade[self._invisiveis].tolist()):
+            objetos[i].timer_invisibilidade = timer
+
+    def __len__(self): return len(self._objetos)
+
+    def posicoes(self):
+        """(inimigo, centro na tela) de cada fantasma, com o centro lido dos arrays."""
+        meio = TAM_CELULA // 2
+        return zip(self._objetos, zip((self.px + meio).tolist(), (self.py + meio).tolist()))
+
+    def _saidas(self, alinhados: np.ndarray, gx: np.ndarray, gy: np.ndarray, chegada: np.ndarray):
+        """Códigos das saídas legais (K x 4, -1 = vazio) e quantos são, para cada fantasma alinhado."""
+        lab = self.labirinto
+        dentro = (gx >= 0) & (gx < lab.colunas) & (gy >= 0) & (gy < lab.linhas)
+        codigos = np.full((len(alinhados), 4), -1, dtype=np.int64)
+        codigos[dentro] = self._codigos_saidas[(gy[dentro] * lab.colunas + gx[dentro]) * 5 + chegada[dentro]]
+        # Fora da grade (clone atravessando a borda): caminho lento, como em LabirintoCompilado.saidas
+        for k in np.flatnonzero(~dentro).tolist():
+            for j, direcao in enumerate(lab.saidas(int(gx[k]), int(gy[k]), *VELOCIDADES[chegada[k]])):
+                codigos[k, j] = codigo_direcao(*direcao)
+        return codigos, dentro
+
+    def _melhores_saidas(self, codigos: np.ndarray, dentro: np.ndarray, gx: np.ndarray, gy: np.ndarray, alvo) -> List[int]:
+        """Código da saída de perseguição de cada fantasma alinhado (-1 = nenhuma), todos de uma vez."""
+        self.campo.atualizar(alvo)
+        resultado = np.full(len(codigos), -1, dtype=np.int64)
+        if dentro.any():
+            saidas = codigos[dentro]
+            vizinhos = (gy[dentro] * self.labirinto.colunas + gx[dentro])[:, None] + self._passo_indice[saidas]
+            distancias = np.frombuffer(self.campo.distancias, dtype=np.uint16)[vizinhos]
+            distancias[saidas < 0] = CampoFluxo.INFINITO
+            # argmin devolve o primeiro mínimo: mesmo desempate de CampoFluxo.melhor_saida
+            j = distancias.argmin(axis=1)
+            linhas = np.arange(len(saidas))
+            resultado[dentro] = np.where(distancias[linhas, j] < CampoFluxo.INFINITO, saidas[linhas, j], -1)
+        for k in np.flatnonzero(~dentro).tolist():
+            opcoes = [VELOCIDADES[c] for c in codigos[k].tolist() if c >= 0]
+            melhor = self.campo.melhor_saida(int(gx[k]), int(gy[k]), opcoes)
+            if melhor: resultado[k] = codigo_direcao(*melhor)
+        return resultado.tolist()
+
+    def atualizar(self, inimigos: List[Inimigo], player, dt_ms) -> Optional[Inimigo]:
+        """
+        Equivale ao laço de main.py: para cada inimigo, em ordem, mover(player) e
+        atualizar_divisao(dt_ms); depois aplica clones novos/removidos em 'inimigos'.
+        Retorna o último inimigo visível na célula do jogador (ou None).
+        """
+        if inimigos != self._objetos: self.carregar(inimigos)
+        if not self._objetos: return None
+        if self._versao != self.labirinto.versao: self._compilar_saidas()
+        objetos = self._objetos
+
+        # Invisibilidade: todos os timers avançam juntos; só as trocas sorteiam
+        self.timer_invisibilidade += self.invisivel
+        trocas = self.invisivel & (self.timer_invisibilidade > self.tempo_para_trocar * (FPS / 10))
+        alinhado = (self.px % TAM_CELULA == 0) & (self.py % TAM_CELULA == 0)
+        eventos = np.flatnonzero(trocas | alinhado | self.divisor)
+        if not eventos.size:
+            self.px += self.vel_x * self.velocidade
+            self.py += self.vel_y * self.velocidade
+            return self._colisor(player)
+
+        alinhados = np.flatnonzero(alinhado)
+        posicao = np.full(len(objetos), -1, dtype=np.int64)
+        posicao[alinhados] = np.arange(len(alinhados))
+        if alinhados.size:
+            # Mesma conversão das propriedades grid_x/grid_y de Inimigo (truncamento)
+            gx = ((self.px[alinhados] + TAM_CELULA // 2) / TAM_CELULA).astype(np.int64)
+            gy = ((self.py[alinhados] + TAM_CELULA // 2) / TAM_CELULA).astype(np.int64)
+            chegada = self._codigo_chegada[(self.vel_x[alinhados] + 1) * 3 + self.vel_y[alinhados] + 1]
+            codigos, dentro = self._saidas(alinhados, gx, gy, chegada)
+            quantidades = (codigos >= 0).sum(axis=1).tolist()
+            lista_codigos, escolhas = codigos.tolist(), chegada.tolist()
+        melhores = None # Calculado na primeira perseguição do quadro, como em Inimigo.mover
+        novos_inimigos, remover_ids = [], []
+
+        for i, k, troca, divisor, px, py, vel_x, vel_y in zip(
+                eventos.tolist(), posicao[eventos].tolist(), trocas[eventos].tolist(), self.divisor[eventos].tolist(),
+                self.px[eventos].tolist(), self.py[eventos].tolist(), self.vel_x[eventos].tolist(), self.vel_y[eventos].tolist()):
+            if troca:
+                visivel, tempo = not self.visivel[i], random.randint(20, 50)
+                self.visivel[i], self.timer_invisibilidade[i], self.tempo_para_trocar[i] = visivel, 0, tempo
+                objetos[i].visivel, objetos[i].tempo_para_trocar = visivel, tempo # Lidos pelo desenho
+            if k >= 0:
+                quantidade = quantidades[k]
+                if random.random() < self.comportamento_aleatorio[i] or not quantidade:
+                    if quantidade: escolhas[k] = lista_codigos[k][random.randrange(quantidade)]
+                else:
+                    if melhores is None: melhores = self._melhores_saidas(codigos, dentro, gx, gy, (player.grid_x, player.grid_y))
+                    if melhores[k] >= 0: escolhas[k] = melhores[k]
+                    else: escolhas[k] = lista_codigos[k][random.randrange(quantidade)]
+            if divisor:
+                # A divisão lê posição e direção do pai já depois do seu movimento neste quadro
+                objeto, velocidade = objetos[i], self._velocidades[i]
+                if k >= 0: vel_x, vel_y = VELOCIDADES[escolhas[k]]
+                objeto.px, objeto.py = px + vel_x * velocidade, py + vel_y * velocidade
+                objeto.vel_x, objeto.vel_y = vel_x, vel_y
+                objeto.atualizar_divisao(dt_ms, novos_inimigos, remover_ids)
+
+        if alinhados.size:
+            escolhidos = np.array(escolhas, dtype=np.int64)
+            self.vel_x[alinhados], self.vel_y[alinhados] = self._dx[escolhidos], self._dy[escolhidos]
+        self.px += self.vel_x * self.velocidade
+        self.py += self.vel_y * self.velocidade
+        colisor = self._colisor(player)
+
+        if novos_inimigos or remover_ids:
+            if novos_inimigos: inimigos.extend(novos_inimigos)
+            if remover_ids: inimigos[:] = [ini for ini in inimigos if ini.id not in remover_ids]
+            self.carregar(inimigos)
+        return colisor
+
+    def _colisor(self, player) -> Optional[Inimigo]:
+        gx = ((self.px + TAM_CELULA // 2) / TAM_CELULA).astype(np.int64)
+        gy = ((self.py + TAM_CELULA // 2) / TAM_CELULA).astype(np.int64)
+        colisores = np.flatnonzero((gx == player.grid_x) & (gy == player.grid_y) & self.visivel)
+        return self._objetos[colisores[-1]] if colisores.size else None
+
+# =======================
+#   MODO DE ESTRESSE
+# =======================
+
+def _criar_fantasmas(quantidade: int, semente: int) -> List[Inimigo]:
+    random.seed(semente)
+    Inimigo.id_counter = 0
+    Inimigo.pool_clones.limpar()
+    nomes = ("Desemprego", "Desigualdade", "Falta de Acesso", "Crise Economica")
+    dificuldades = ("Easy", "Default", "Hard")
+    livres = sorted(MAPA_POSICOES_LIVRES)
+    return [Inimigo(*livres[(i * 7) % len(livres)], (128, 128, 128), nomes[i % 4], dificuldades[i % 3])
+            for i in range(quantidade)]
+
+def _atualizar_objetos(inimigos: List[Inimigo], player, dt_ms) -> Optional[Inimigo]:
+    """O laço de objetos de main.py (mover, dividir e colidir, fantasma por fantasma)."""
+    novos_inimigos, remover_ids, colisor = [], [], None
+    for inimigo in list(inimigos):
+        inimigo.mover(player)
+        inimigo.atualizar_divisao(dt_ms, novos_inimigos, remover_ids)
+        if inimigo.grid_x == player.grid_x and inimigo.grid_y == player.grid_y and inimigo.visivel:
+            colisor = inimigo
+    if novos_inimigos: inimigos.extend(novos_inimigos)
+    if remover_ids: inimigos[:] = [ini for ini in inimigos if ini.id not in remover_ids]
+    return colisor
+
+def executar_estresse(quantidade: int = 400, quadros: int = 900, semente: int = 7):
+    """Compara o laço de objetos com o motor em lote (mesma semente) e imprime o tempo por quadro."""
+    import time
+    from entidades import Player
+
+    resultados, dt_ms = {}, 1000 / FPS
+    for modo in ("objetos", "motor"):
+        fantasmas = _criar_fantasmas(quantidade, semente)
+        jogador, motor = Player(1, 1), MotorFantasmas()
+        colisoes, divisoes = [], Inimigo.pool_clones.acertos + Inimigo.pool_clones.faltas
+        inicio = time.perf_counter()
+        for quadro in range(quadros):
+            if quadro % 40 == 0: jogador.dir_x, jogador.dir_y = DIRECOES[(quadro // 40) % 4]
+            jogador.mover()
+            if modo == "motor": colisor = motor.atualizar(fantasmas, jogador, dt_ms)
+            else: colisor = _atualizar_objetos(fantasmas, jogador, dt_ms)
+            colisoes.append(colisor.id if colisor else None)
+        ms = (time.perf_counter() - inicio) * 1000 / quadros
+        motor.sincronizar()
+        estados = [(f.id, f.px, f.py, f.vel_x, f.vel_y, f.visivel, f.timer_invisibilidade, f.tempo_para_trocar)
+                   for f in fantasmas]
+        divisoes = Inimigo.pool_clones.acertos + Inimigo.pool_clones.faltas - divisoes
+        resultados[modo] = (estados, colisoes, random.getstate(), ms, divisoes)
+
+    identicos = resultados["objetos"][:3] == resultados["motor"][:3]
+    print(f"[LOG] Modo de estresse: {quantidade} fantasmas, {quadros} quadros, "
+          f"{resultados['motor'][4]} divisões da Crise Econômica")
+    print(f"  laço de objetos   {resultados['objetos'][3]:8.3f} ms/quadro")
+    print(f"  motor em arrays   {resultados['motor'][3]:8.3f} ms/quadro")
+    print(f"  estados, colisões e sequência aleatória idênticos: {'sim' if identicos else 'NÃO'}")
+    return 0 if identicos else 1
+
+if __name__ == '__main__':
+    import sys
+    import pygame
+    pygame.init()
+    # Janela oculta: os sprites dos fantasmas vêm do atlas, que exige um display
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    codigo_saida = executar_estresse(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
+    pygame.quit()
+    sys.exit(codigo_saida)
@@ -0,0 +1,130 @@
+"""
+Perfil das Entidades (perfil_entidades.py)
+
+Micro-benchmark das entidades com __slots__ contra as mesmas classes com
+dicionário por instância (como eram antes):
+- Memória por instância de Player, Inimigo e CentroComunitario (tracemalloc)
+- Tempo do laço de atualização (Player.mover e Inimigo.mover)
+- Inventário fixo (contagem + buffer) x lista, e estatísticas tipadas x dict
+
+Uso: python perfil_entidades.py [quantidade_de_fantasmas]
+"""
+
+import random
+import timeit
+import tracemalloc
+import datetime
+from functools import partial
+
+def versao_com_dict(classe):
+    """Cópia da classe sem __slots__ (métodos e propriedades iguais, atributos num __dict__)."""
+    membros = {nome: valor for nome, valor in vars(classe).items()
+               if nome not in getattr(classe, "__slots__", ()) and nome not in ("__slots__", "__dict__", "__weakref__")}
+    return type(f"{classe.__name__}ComDict", (), membros)
+
+def _memoria_por_instancia(fabrica, quantidade: int) -> float:
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = [fabrica() for _ in range(quantidade)]
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (depois - antes) / quantidade
+
+def executar_perfil(quantidade: int = 400) -> int:
+    from config import CINZA, COR_ESCOLA
+    from entidades import Player, Inimigo, CentroComunitario, GradeRecursos, EstatisticasPartida
+
+    linhas = []
+    classes = {
+        "Player": (Player, lambda c: c(1, 1)),
+        "Inimigo": (Inimigo, lambda c: c(15, 7, CINZA, "Desemprego", "Hard")),
+        "CentroComunitario": (CentroComunitario, lambda c: c(15, 1, "Escola", COR_ESCOLA, "Livro")),
+    }
+    for nome, (classe, criar) in classes.items():
+        com_dict = versao_com_dict(classe)
+        linhas.append((f"memória {nome} (bytes/instância)",
+                       _memoria_por_instancia(lambda: criar(com_dict), 200),
+                       _memoria_por_instancia(lambda: criar(classe), 200)))
+
+    # Laço de atualização: mesma semente, mesmas chamadas, só muda o armazenamento dos atributos
+    def laco(classe_jogador, classe_inimigo):
+        random.seed(7)
+        jogador = classe_jogador(1, 1)
+        jogador.dir_x = 1
+        fantasmas = [classe_inimigo(15, 7, CINZA, "Desemprego", "Hard") for _ in range(quantidade)]
+        def quadro():
+            jogador.mover(); jogador.atualizar_animacao(16)
+            for fantasma in fantasmas: fantasma.mover(jogador)
+        return min(timeit.repeat(quadro, number=100, repeat=5)) * 10 # ms por quadro
+    linhas.append((f"quadro com {quantidade} fantasmas (ms)",
+                   laco(versao_com_dict(Player), versao_com_dict(Inimigo)), laco(Player, Inimigo)))
+
+    # Inventário: o caminho real do jogo (Player.coletar e CentroComunitario.receber_entrega)
+    # contra o mesmo código com lista + dict, como era antes do Inventario
+    grade, itens = GradeRecursos(), ("Livro", "Moeda", "Livro", "Tijolo", "Livro")
+    jogador, centro = Player(1, 1), CentroComunitario(1, 1, "Escola", COR_ESCOLA, "Livro")
+    centro.nivel_max = float("inf") # Sem limite de nível: toda entrega conta
+    inventario_lista, stats_lista = [], {"recursos_coletados": 0, "itens_entregues": 0}
+    def coletar_lista():
+        if len(inventario_lista) < 5:
+            tipo = grade.remover(jogador.grid_x, jogador.grid_y)
+            if tipo is not None:
+                inventario_lista.append(tipo)
+                stats_lista["recursos_coletados"] += 1
+                return (jogador.grid_x, jogador.grid_y)
+        return None
+    def entregar_lista():
+        entregues = sum(1 for item in inventario_lista if item == centro.recurso_necessario)
+        if entregues > 0 and centro.nivel_atual < centro.nivel_max:
+            inventario_lista[:] = [item for item in inventario_lista if item != centro.recurso_necessario]
+            centro.nivel_atual = min(centro.nivel_max, centro.nivel_atual + entregues)
+            stats_lista["itens_entregues"] += entregues
+            centro.efeitos.adicionar()
+            return entregues * 20
+        return 0
+    def ciclo(coletar, entregar):
+        def executar():
+            for item in itens:
+                grade.adicionar(1, 1, item)
+                coletar()
+            entregar(); entregar() # A segunda chamada é o caso de todo quadro: nada a entregar
+            centro.efeitos.efeitos.clear()
+        return executar
+    def descartar_lista(): inventario_lista.clear()
+    ciclo_lista = ciclo(coletar_lista, entregar_lista)
+    ciclo_fixo = ciclo(partial(jogador.coletar, grade), partial(centro.receber_entrega, jogador.inventario, jogador.stats))
+    def medir(executar, esvaziar):
+        def rodada(): executar(); esvaziar()
+        return min(timeit.repeat(rodada, number=20000, repeat=7)) * 50 # µs por ciclo
+    linhas.append(("coletar 5 + entregar (µs)",
+                   medir(ciclo_lista, descartar_lista), medir(ciclo_fixo, jogador.inventario.limpar)))
+    inventario_lista[:] = ["Moeda", "Tijolo"]
+    jogador.inventario.limpar()
+    for item in inventario_lista: jogador.inventario.adicionar(item)
+    linhas.append(("centro sem o item, por quadro (µs)",
+                   min(timeit.repeat(entregar_lista, number=100000, repeat=5)) * 10,
+                   min(timeit.repeat(partial(centro.receber_entrega, jogador.inventario, jogador.stats), number=100000, repeat=5)) * 10))
+
+    stats_dict = {"recursos_coletados": 0, "itens_entregues": 0, "tempo_jogado": 0, "tempo_sobrevivencia": 0,
+                  "partidas_jogadas": 0, "vitorias": 0, "centros_completos": 0, "inicio_partida": datetime.datetime.now()}
+    linhas.append(("memória das estatísticas (bytes)",
+                   _memoria_por_instancia(lambda: dict(stats_dict), 200),
+                   _memoria_por_instancia(EstatisticasPartida, 200)))
+
+    largura = max(len(nome) for nome, _, _ in linhas)
+    print("[LOG] Perfil das entidades (antes = __dict__/lista/dict, depois = __slots__/Inventario/EstatisticasPartida):")
+    print(f"  {'':<{largura}}  {'antes':>10}  {'depois':>10}")
+    for nome, antes, depois in linhas:
+        print(f"  {nome:<{largura}}  {antes:10.2f}  {depois:10.2f}")
+    return 0
+
+if __name__ == '__main__':
+    import sys
+    import pygame
+    pygame.init()
+    # Janela oculta: os sprites das entidades vêm do atlas, que exige um display
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    codigo_saida = executar_perfil(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
+    pygame.quit()
+    sys.exit(codigo_saida)
@@ -0,0 +1,65 @@
+"""
+Perfil de Inicialização (perfil_inicializacao.py)
+
+Mede quanto custa cada etapa até o primeiro quadro do jogo:
+- Importação de cada módulo (só o custo próprio: dependências são importadas antes)
+- Inicialização dos subsistemas do Pygame (vídeo, fontes)
+- Primeiro quadro da tela inicial
+O mixer é medido à parte, pois só é iniciado na primeira música.
+
+Uso: python main.py --import-profile
+"""
+
+import importlib
+import time
+
+# Dependências antes de quem as importa (utils importa labirinto; entidades importa
+# labirinto, utils e assets; telas importa entidades): cada tempo exclui o que já foi
+# importado antes, então cada linha mede só o custo do próprio módulo
+MODULOS = ("pygame", "config", "assets", "labirinto", "utils", "entidades", "telas")
+
+def _medir(etapas, nome, funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    etapas.append((nome, (time.perf_counter() - inicio) * 1000))
+    return resultado
+
+def executar_perfil() -> int:
+    """Executa a inicialização até o primeiro quadro e imprime o tempo de cada etapa."""
+    etapas = []
+    inicio = time.perf_counter()
+    for nome in MODULOS:
+        _medir(etapas, f"import {nome}", lambda: importlib.import_module(nome))
+
+    import pygame
+    from config import LARGURA, ALTURA
+    from assets import obter_fonte, iniciar_carregamento_assets
+    from telas import desenhar_tela_inicial
+
+    _medir(etapas, "pygame.display.init", pygame.display.init)
+    tela = _medir(etapas, "pygame.display.set_mode", lambda: pygame.display.set_mode((LARGURA, ALTURA)))
+    _medir(etapas, "iniciar_carregamento_assets", iniciar_carregamento_assets)
+    _medir(etapas, "primeira fonte (font.init + SysFont)", lambda: obter_fonte("bahnschrift", 68, negrito=True))
+    # Mesmos rects da tela inicial em main.py
+    rects_inicial = {
+        'logar': pygame.Rect(LARGURA/2-150, 230, 300, 70),
+        'cadastrar': pygame.Rect(LARGURA/2-150, 320, 300, 70),
+        'sem_cadastro': pygame.Rect(LARGURA/2-150, 410, 300, 50)
+    }
+    _medir(etapas, "primeiro quadro (tela inicial)", lambda: (desenhar_tela_inicial(tela, rects_inicial), pygame.display.flip()))
+    ate_primeiro_quadro = (time.perf_counter() - inicio) * 1000
+
+    def iniciar_mixer():
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"[LOG] Mixer indisponivel: {e}")
+    _medir(etapas, "pygame.mixer.init (adiado até a 1a música)", iniciar_mixer)
+
+    largura = max(len(nome) for nome, _ in etapas)
+    print("[LOG] Perfil de inicialização (ms):")
+    for nome, ms in etapas:
+        print(f"  {nome:<{largura}}  {ms:8.2f}")
+    print(f"  {'total até o primeiro quadro':<{largura}}  {ate_primeiro_quadro:8.2f}")
+    pygame.quit()
+    return 0
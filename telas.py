@@ -14,12 +14,13 @@ from config import *
 
 # Importa entidades (para tipos) e assets
 from entidades import Player, CentroComunitario
-from assets import carregar_item
+from labirinto import versao_layout
+from assets import regiao_item, obter_fonte, renderizar_texto, obter_anel
 
 # --- Funções de Desenho de Texto (Helpers) ---
 
 def desenhar_texto(surface, texto, pos, fonte, cor=BRANCO, alinhamento="center"):
-    render = fonte.render(texto, True, cor)
+    render = renderizar_texto(fonte, texto, cor)
     rect = render.get_rect()
     if alinhamento == "center":
         rect.center = pos
@@ -39,7 +40,7 @@ def desenhar_texto_quebra_linha(surface, texto, pos, largura_maxima, fonte, cor=
     linhas_renderizadas.append(linha_atual)
     y_inicial = pos[1]
     for i, linha in enumerate(linhas_renderizadas):
-        render_linha = fonte.render(linha, True, cor)
+        render_linha = renderizar_texto(fonte, linha, cor)
         rect_linha = render_linha.get_rect(center=(pos[0], y_inicial + i * fonte.get_linesize()))
         surface.blit(render_linha, rect_linha)
 
@@ -102,21 +103,57 @@ def gerar_rects_avaliacao(perguntas_layout, largura_coluna_direita=350):
     return {"opcoes": opcoes, "confirmar": confirmar, "voltar": voltar}
 
 
+# --- Cache de Telas Estáticas (Menus) ---
+
+# Cada menu é composto uma vez em uma Surface própria e só é recomposto
+# quando a chave (entradas que alteram o desenho) muda.
+_CACHE_TELAS: Dict[str, Tuple] = {}
+
+def _chave_rects(rects):
+    return tuple((nome, tuple(rect)) for nome, rect in rects.items())
+
+def _desenhar_tela_em_cache(surface, nome, chave, compor):
+    """Blita a tela 'nome' a partir do cache, chamando compor(surface) só quando 'chave' muda."""
+    entrada = _CACHE_TELAS.get(nome)
+    if entrada is None or entrada[0] != chave or entrada[1].get_size() != surface.get_size():
+        composta = pygame.Surface(surface.get_size())
+        if pygame.display.get_surface() is not None:
+            composta = composta.convert()
+        compor(composta)
+        entrada = _CACHE_TELAS[nome] = (chave, composta)
+    surface.blit(entrada[1], (0, 0))
+
+
 # --- Funções de Desenho de Tela (Estados) ---
 
-def desenhar_tela_inicial(surface, rects):
+def desenhar_tela_inicial(surface, rects, popup_sem_cadastro=False):
+    def compor(tela):
+        _compor_tela_inicial(tela, rects)
+        if popup_sem_cadastro: desenhar_popup_sem_cadastro(tela)
+    _desenhar_tela_em_cache(surface, "tela_inicial", (_chave_rects(rects), popup_sem_cadastro), compor)
+
+def desenhar_progresso_carregamento(surface, fracao):
+    """Barra discreta no rodapé dos menus enquanto os sprites carregam em segundo plano."""
+    barra = pygame.Rect(LARGURA // 2 - 150, ALTURA - 40, 300, 8)
+    pygame.draw.rect(surface, (30, 30, 30), barra, border_radius=4)
+    if fracao > 0:
+        pygame.draw.rect(surface, COR_OURO, (barra.x, barra.y, int(barra.width * fracao), barra.height), border_radius=4)
+    fonte = obter_fonte(None, 20)
+    desenhar_texto(surface, f"Carregando sprites... {int(fracao * 100)}%", (barra.centerx, barra.y - 12), fonte, (150, 150, 150))
+
+def _compor_tela_inicial(surface, rects):
     surface.fill((5, 5, 5))
-    fonte_logo = pygame.font.SysFont("bahnschrift", 68, bold=True)
-    fonte_logo_small = pygame.font.SysFont("bahnschrift", 30)
-    fonte_botao = pygame.font.SysFont(None, 34)
-    fonte_legenda = pygame.font.SysFont(None, 26)
+    fonte_logo = obter_fonte("bahnschrift", 68, negrito=True)
+    fonte_logo_small = obter_fonte("bahnschrift", 30)
+    fonte_botao = obter_fonte(None, 34)
+    fonte_legenda = obter_fonte(None, 26)
 
     # Ícone e texto lado a lado, centralizados como grupo
     y_logo = 130
     raio_pac = 46
     ponta_boca = 52
     espacamento = 8
-    render_logo = fonte_logo.render("PACMAN", True, COR_OURO)
+    render_logo = renderizar_texto(fonte_logo, "PACMAN", COR_OURO)
     logo_rect = render_logo.get_rect()
     
     largura_icone = raio_pac + ponta_boca  # da borda esquerda do círculo até a ponta da boca
@@ -132,7 +169,7 @@ def desenhar_tela_inicial(surface, rects):
     logo_rect.left = x_inicio + largura_icone + espacamento
     surface.blit(render_logo, logo_rect)
     
-    render_sub = fonte_logo_small.render("MISSÃO COMUNITÁRIA", True, BRANCO)
+    render_sub = renderizar_texto(fonte_logo_small, "MISSÃO COMUNITÁRIA", BRANCO)
     sub_rect = render_sub.get_rect()
     sub_rect.left = logo_rect.left
     sub_rect.top = logo_rect.bottom + 5
@@ -151,25 +188,25 @@ def desenhar_tela_inicial(surface, rects):
     rect_sem_cadastro = rects['sem_cadastro']
     pygame.draw.rect(surface, (30, 30, 30), rect_sem_cadastro, border_radius=6)
     pygame.draw.rect(surface, (100, 100, 100), rect_sem_cadastro, width=1, border_radius=6)
-    fonte_sem_cadastro = pygame.font.SysFont(None, 26)
+    fonte_sem_cadastro = obter_fonte(None, 26)
     desenhar_texto(surface, "Entrar sem cadastro", rect_sem_cadastro.center, fonte_sem_cadastro, (180, 180, 180))
 
 def desenhar_tela_formulario(surface, titulo, nick, senha, campo_ativo, rects, msg_erro=""):
     surface.fill((5, 5, 5))
 
-    fonte_logo = pygame.font.SysFont("bahnschrift", 52, bold=True)
-    fonte_logo_small = pygame.font.SysFont("bahnschrift", 26)
-    fonte_titulo = pygame.font.SysFont(None, 40)
-    fonte_label = pygame.font.SysFont(None, 24)
-    fonte_input = pygame.font.SysFont(None, 30)
-    fonte_msg = pygame.font.SysFont(None, 24)
+    fonte_logo = obter_fonte("bahnschrift", 52, negrito=True)
+    fonte_logo_small = obter_fonte("bahnschrift", 26)
+    fonte_titulo = obter_fonte(None, 40)
+    fonte_label = obter_fonte(None, 24)
+    fonte_input = obter_fonte(None, 30)
+    fonte_msg = obter_fonte(None, 24)
 
     # Ícone e texto lado a lado, centralizados como grupo (formulário)
     y_logo = 110
     raio_pac = 36
     ponta_boca = 40
     espacamento = 8
-    render_logo = fonte_logo.render("PACMAN", True, COR_OURO)
+    render_logo = renderizar_texto(fonte_logo, "PACMAN", COR_OURO)
     logo_rect = render_logo.get_rect()
     
     largura_icone = raio_pac + ponta_boca
@@ -185,7 +222,7 @@ def desenhar_tela_formulario(surface, titulo, nick, senha, campo_ativo, rects, m
     logo_rect.left = x_inicio + largura_icone + espacamento
     surface.blit(render_logo, logo_rect)
     
-    render_sub = fonte_logo_small.render("MISSÃO COMUNITÁRIA", True, BRANCO)
+    render_sub = renderizar_texto(fonte_logo_small, "MISSÃO COMUNITÁRIA", BRANCO)
     sub_rect = render_sub.get_rect()
     sub_rect.left = logo_rect.left
     sub_rect.top = logo_rect.bottom + 5
@@ -209,7 +246,7 @@ def desenhar_tela_formulario(surface, titulo, nick, senha, campo_ativo, rects, m
         cor_borda = COR_OURO if campo_ativo == campo_id else (120, 120, 120)
         pygame.draw.rect(surface, (8, 8, 8), rect, border_radius=4)
         pygame.draw.rect(surface, cor_borda, rect, width=2, border_radius=4)
-        surface.blit(fonte_label.render(label, True, COR_OURO if campo_ativo == campo_id else CINZA), (rect.x, rect.y - 22))
+        surface.blit(renderizar_texto(fonte_label, label, COR_OURO if campo_ativo == campo_id else CINZA), (rect.x, rect.y - 22))
 
         # Texto do campo (centralizado)
         if valor:
@@ -219,7 +256,7 @@ def desenhar_tela_formulario(surface, titulo, nick, senha, campo_ativo, rects, m
             texto = "Password" if ocultar else "Login"
             cor_texto = (120, 120, 150)
 
-        texto_render = fonte_input.render(texto, True, cor_texto)
+        texto_render = renderizar_texto(fonte_input, texto, cor_texto)
         texto_rect = texto_render.get_rect(center=rect.center)
         surface.blit(texto_render, texto_rect)
 
@@ -258,11 +295,17 @@ def desenhar_tela_formulario(surface, titulo, nick, senha, campo_ativo, rects, m
     if not msg_erro:
         desenhar_texto(surface, "Already a member? Use o mesmo formulario para logar.", (painel.centerx, painel.bottom + 65), fonte_msg, CINZA)
 
-def desenhar_tela_dificuldade(surface, rects, username=""):
+def desenhar_tela_dificuldade(surface, rects, username="", popup_controles=False):
+    def compor(tela):
+        _compor_tela_dificuldade(tela, rects, username)
+        if popup_controles: desenhar_popup_controles(tela)
+    _desenhar_tela_em_cache(surface, "tela_dificuldade", (_chave_rects(rects), username, popup_controles), compor)
+
+def _compor_tela_dificuldade(surface, rects, username=""):
     surface.fill(COR_FUNDO_UI)
-    fonte_titulo, fonte_botao = pygame.font.SysFont(None, 50), pygame.font.SysFont(None, 38)
-    fonte_usuario = pygame.font.SysFont(None, 24)
-    fonte_deslogar = pygame.font.SysFont(None, 28)
+    fonte_titulo, fonte_botao = obter_fonte(None, 50), obter_fonte(None, 38)
+    fonte_usuario = obter_fonte(None, 24)
+    fonte_deslogar = obter_fonte(None, 28)
     
     desenhar_texto(surface, "Selecione o Nível de Dificuldade", (LARGURA / 2, 80), fonte_titulo, AMARELO)
     
@@ -287,11 +330,20 @@ def desenhar_tela_dificuldade(surface, rects, username=""):
     pygame.draw.rect(surface, COR_BOTAO, rects['avaliacao']); desenhar_texto(surface, "Avaliação", rects['avaliacao'].center, fonte_botao)
 
 def desenhar_tela_rewards(surface, rewards_system, username, rects):
+    user_data = rewards_system.obter_usuario_rewards(username)
+    chave = (
+        _chave_rects(rects), username, user_data["pontos_totais"], user_data["nivel"],
+        tuple((k, v.get("concluida", False)) for k, v in user_data.get("tarefas_diarias", {}).items()),
+        tuple((k, v.get("desbloqueada", False)) for k, v in user_data.get("conquistas", {}).items())
+    )
+    _desenhar_tela_em_cache(surface, "tela_rewards", chave, lambda tela: _compor_tela_rewards(tela, rewards_system, username, rects))
+
+def _compor_tela_rewards(surface, rewards_system, username, rects):
     surface.fill(COR_FUNDO_UI)
-    fonte_titulo = pygame.font.SysFont("bahnschrift", 40, bold=True)
-    fonte_secao = pygame.font.SysFont("bahnschrift", 30)
-    fonte_media = pygame.font.SysFont(None, 26)
-    fonte_pequena = pygame.font.SysFont(None, 24)
+    fonte_titulo = obter_fonte("bahnschrift", 40, negrito=True)
+    fonte_secao = obter_fonte("bahnschrift", 30)
+    fonte_media = obter_fonte(None, 26)
+    fonte_pequena = obter_fonte(None, 24)
     
     user_data = rewards_system.obter_usuario_rewards(username)
     
@@ -398,10 +450,14 @@ def desenhar_tela_rewards(surface, rewards_system, username, rects):
     desenhar_texto(surface, "Voltar", rects['voltar_rewards'].center, fonte_media, BRANCO)
 
 def desenhar_tela_ranking(surface, rewards_system, rects):
+    ranking = rewards_system.obter_ranking(10)
+    chave = (_chave_rects(rects), tuple(ranking))
+    _desenhar_tela_em_cache(surface, "tela_ranking", chave, lambda tela: _compor_tela_ranking(tela, ranking, rects))
+
+def _compor_tela_ranking(surface, ranking, rects):
     surface.fill(COR_FUNDO_UI)
-    fonte_titulo, fonte_media, fonte_pequena = pygame.font.SysFont(None, 45), pygame.font.SysFont(None, 32), pygame.font.SysFont(None, 28)
+    fonte_titulo, fonte_media, fonte_pequena = obter_fonte(None, 45), obter_fonte(None, 32), obter_fonte(None, 28)
     desenhar_texto(surface, "Ranking de Jogadores", (LARGURA/2, 50), fonte_titulo, COR_OURO)
-    ranking = rewards_system.obter_ranking(10)
     y_offset = 120
     for i, (username, pontos) in enumerate(ranking):
         cor = [COR_OURO, COR_PRATA, COR_BRONZE][i] if i < 3 else BRANCO
@@ -412,11 +468,11 @@ def desenhar_tela_ranking(surface, rewards_system, rects):
 
 def desenhar_tela_game_over(surface, rects, nome_inimigo):
     surface.fill((5, 5, 5))
-    fonte_logo = pygame.font.SysFont("bahnschrift", 52, bold=True)
-    fonte_logo_small = pygame.font.SysFont("bahnschrift", 26)
-    fonte_titulo = pygame.font.SysFont(None, 50)
-    fonte_mensagem = pygame.font.SysFont(None, 26)
-    fonte_botao = pygame.font.SysFont(None, 34)
+    fonte_logo = obter_fonte("bahnschrift", 52, negrito=True)
+    fonte_logo_small = obter_fonte("bahnschrift", 26)
+    fonte_titulo = obter_fonte(None, 50)
+    fonte_mensagem = obter_fonte(None, 26)
+    fonte_botao = obter_fonte(None, 34)
 
     logo_x = LARGURA // 2 - 220
     
@@ -429,7 +485,7 @@ def desenhar_tela_game_over(surface, rects, nome_inimigo):
     pygame.draw.circle(surface, (20, 20, 20), (pac_center[0] + 10, pac_center[1] - 12), 5)
 
     # 2. Renderiza o texto "PACMAN"
-    render_logo = fonte_logo.render("PACMAN", True, COR_OURO)
+    render_logo = renderizar_texto(fonte_logo, "PACMAN", COR_OURO)
     logo_rect = render_logo.get_rect()
     
     # 3. Alinha o centro Y do texto ao centro Y do ícone
@@ -442,7 +498,7 @@ def desenhar_tela_game_over(surface, rects, nome_inimigo):
     surface.blit(render_logo, logo_rect)
     
     # 6. Renderiza e alinha o subtítulo
-    render_sub = fonte_logo_small.render("MISSÃO COMUNITÁRIA", True, BRANCO)
+    render_sub = renderizar_texto(fonte_logo_small, "MISSÃO COMUNITÁRIA", BRANCO)
     sub_rect = render_sub.get_rect()
     
     # Alinha ao 'left' do título principal e abaixo dele
@@ -473,9 +529,9 @@ def desenhar_tela_game_over(surface, rects, nome_inimigo):
 
 def desenhar_tela_vitoria(surface, rects, pontos_finais, pontos_bonus):
     surface.fill(COR_FUNDO_UI)
-    fonte_grande = pygame.font.SysFont(None, 60)
-    fonte_media = pygame.font.SysFont(None, 45)
-    fonte_pontos = pygame.font.SysFont(None, 50)
+    fonte_grande = obter_fonte(None, 60)
+    fonte_media = obter_fonte(None, 45)
+    fonte_pontos = obter_fonte(None, 50)
     
     desenhar_texto(surface, "Parabens!", (LARGURA/2, 100), fonte_grande, AMARELO)
     desenhar_texto(surface, "A comunidade prosperou!", (LARGURA/2, 160), fonte_media, (120, 255, 120))
@@ -498,17 +554,17 @@ def desenhar_tela_avaliacao(surface, layout_avaliacao, perguntas_layout, rects,
     Agora aceita 'medias_gerais' para exibir a média de notas.
     """
     surface.fill(COR_FUNDO_UI)
-    fonte_titulo = pygame.font.SysFont(None, 46)
-    fonte_secao = pygame.font.SysFont(None, 30)
-    fonte_pergunta = pygame.font.SysFont(None, 24)
-    fonte_opcao = pygame.font.SysFont(None, 24)
-    fonte_media = pygame.font.SysFont(None, 20)
-    fonte_mensagem = pygame.font.SysFont(None, 30)
-    fonte_botao_voltar = pygame.font.SysFont(None, 24)
+    fonte_titulo = obter_fonte(None, 46)
+    fonte_secao = obter_fonte(None, 30)
+    fonte_pergunta = obter_fonte(None, 24)
+    fonte_opcao = obter_fonte(None, 24)
+    fonte_media = obter_fonte(None, 20)
+    fonte_mensagem = obter_fonte(None, 30)
+    fonte_botao_voltar = obter_fonte(None, 24)
 
     desenhar_texto(surface, "Avaliação do Produto", (LARGURA/2, 50), fonte_titulo, AMARELO)
     
-    texto_legenda = fonte_media.render("Avalie de 1 (ruim) a 5 (excelente).", True, BRANCO)
+    texto_legenda = renderizar_texto(fonte_media, "Avalie de 1 (ruim) a 5 (excelente).", BRANCO)
     legenda_rect = texto_legenda.get_rect(centerx=LARGURA/2, y=85)
     surface.blit(texto_legenda, legenda_rect)
 
@@ -518,7 +574,7 @@ def desenhar_tela_avaliacao(surface, layout_avaliacao, perguntas_layout, rects,
         elif item["tipo"] == "pergunta":
             x_texto, y_linha = 50, item["y_texto"]
             for linha in item["linhas"]:
-                render = fonte_pergunta.render(linha, True, BRANCO)
+                render = renderizar_texto(fonte_pergunta, linha, BRANCO)
                 surface.blit(render, (x_texto, y_linha))
                 y_linha += fonte_pergunta.get_linesize()
 
@@ -530,7 +586,7 @@ def desenhar_tela_avaliacao(surface, layout_avaliacao, perguntas_layout, rects,
                 cor_borda = COR_OURO if selecionado else BRANCO
                 pygame.draw.rect(surface, cor_fundo, rect, border_radius=6)
                 pygame.draw.rect(surface, cor_borda, rect, width=2, border_radius=6)
-                numero = fonte_opcao.render(str(nota), True, BRANCO)
+                numero = renderizar_texto(fonte_opcao, str(nota), BRANCO)
                 surface.blit(numero, numero.get_rect(center=rect.center))
 
             # --- SEÇÃO MODIFICADA (Sugestão #2) ---
@@ -542,7 +598,7 @@ def desenhar_tela_avaliacao(surface, layout_avaliacao, perguntas_layout, rects,
             # 1. Mostrar a nota que o usuário está selecionando AGORA
             if item['indice'] in respostas:
                 nota_selecionada = respostas[item['indice']]
-                texto_nota = fonte_media.render(f"Sua Nota: {nota_selecionada}", True, COR_OURO)
+                texto_nota = renderizar_texto(fonte_media, f"Sua Nota: {nota_selecionada}", COR_OURO)
                 nota_rect = texto_nota.get_rect(midleft=(pos_base_x, pos_base_y - 8))
                 surface.blit(texto_nota, nota_rect)
             # --- FIM DA CORREÇÃO ---
@@ -551,9 +607,9 @@ def desenhar_tela_avaliacao(surface, layout_avaliacao, perguntas_layout, rects,
             if medias_gerais:
                 media_da_pergunta = medias_gerais[item['indice']]
                 if media_da_pergunta > 0:
-                    texto_media = fonte_media.render(f"Média: {media_da_pergunta:.1f}", True, CINZA)
+                    texto_media = renderizar_texto(fonte_media, f"Média: {media_da_pergunta:.1f}", CINZA)
                 else:
-                    texto_media = fonte_media.render("Sem média", True, CINZA)
+                    texto_media = renderizar_texto(fonte_media, "Sem média", CINZA)
                 
                 # Ajusta a posição Y se a "Sua Nota" também estiver sendo mostrada
                 pos_y_media = pos_base_y + 8 if item['indice'] in respostas else pos_base_y
@@ -590,23 +646,26 @@ def desenhar_popup(surface, titulo, mensagem):
     pygame.draw.rect(surface, (12, 12, 35), popup_rect, border_radius=16)
     pygame.draw.rect(surface, COR_OURO, popup_rect, width=2, border_radius=16)
 
-    fonte_titulo = pygame.font.SysFont(None, 36)
-    fonte_texto = pygame.font.SysFont(None, 26)
-    fonte_dica = pygame.font.SysFont(None, 22)
+    fonte_titulo = obter_fonte(None, 36)
+    fonte_texto = obter_fonte(None, 26)
+    fonte_dica = obter_fonte(None, 22)
 
     desenhar_texto(surface, titulo or "Mensagem", (popup_rect.centerx, popup_rect.y + 40), fonte_titulo, AMARELO)
     desenhar_texto_quebra_linha(surface, mensagem, (popup_rect.centerx, popup_rect.centery), popup_rect.width - 60, fonte_texto, BRANCO)
 
-    dica = fonte_dica.render("Clique para fechar ou aguarde alguns segundos.", True, CINZA)
+    dica = renderizar_texto(fonte_dica, "Clique para fechar ou aguarde alguns segundos.", CINZA)
     surface.blit(dica, dica.get_rect(center=(popup_rect.centerx, popup_rect.bottom - 30)))
 
 def desenhar_tela_instrucoes(surface, rects):
+    _desenhar_tela_em_cache(surface, "tela_instrucoes", _chave_rects(rects), lambda tela: _compor_tela_instrucoes(tela, rects))
+
+def _compor_tela_instrucoes(surface, rects):
     surface.fill(COR_FUNDO_UI)
-    fonte_titulo = pygame.font.SysFont(None, 50)
-    fonte_subtitulo = pygame.font.SysFont(None, 38)
-    fonte_texto = pygame.font.SysFont(None, 30)
-    fonte_texto_menor = pygame.font.SysFont(None, 28)
-    fonte_botao_voltar = pygame.font.SysFont(None, 22)
+    fonte_titulo = obter_fonte(None, 50)
+    fonte_subtitulo = obter_fonte(None, 38)
+    fonte_texto = obter_fonte(None, 30)
+    fonte_texto_menor = obter_fonte(None, 28)
+    fonte_botao_voltar = obter_fonte(None, 22)
     y_pos = 50
     desenhar_texto(surface, "Instruções do Jogo", (LARGURA/2, y_pos), fonte_titulo, AMARELO)
     y_pos += 60
@@ -636,39 +695,60 @@ def desenhar_tela_instrucoes(surface, rects):
 
 # --- Funções de Desenho do Jogo (Labirinto, HUD) ---
 
-def desenhar_labirinto(surface):
+def obter_superficie_labirinto() -> pygame.Surface:
+    """
+    Retorna o labirinto rasterizado em uma Surface estática.
+    A Surface é refeita apenas se o layout (labirinto.alterar_celula) ou o TAM_CELULA mudarem.
+    """
+    chave = (versao_layout(), TAM_CELULA)
+    cache = getattr(obter_superficie_labirinto, "_cache", None)
+    if cache is not None and cache[0] == chave:
+        return cache[1]
+
+    largura, altura = len(LABIRINTO_LAYOUT[0]) * TAM_CELULA, len(LABIRINTO_LAYOUT) * TAM_CELULA
+    fundo = pygame.Surface((largura, altura))
+    if pygame.display.get_surface() is not None:
+        fundo = fundo.convert()
+    fundo.fill(PRETO)
     for y,linha in enumerate(LABIRINTO_LAYOUT):
         for x,celula in enumerate(linha):
-            if celula == 1: pygame.draw.rect(surface,AZUL_PAREDE,(x*TAM_CELULA, y*TAM_CELULA,TAM_CELULA,TAM_CELULA))
+            if celula == 1: pygame.draw.rect(fundo,AZUL_PAREDE,(x*TAM_CELULA, y*TAM_CELULA,TAM_CELULA,TAM_CELULA))
+    obter_superficie_labirinto._cache = (chave, fundo)
+    return fundo
+
+def desenhar_labirinto(surface):
+    surface.blit(obter_superficie_labirinto(), (0, 0))
 
 def desenhar_recursos(surface, recursos):
     tamanho_item = (24, 24)
     # Cache simples para não recarregar imagens 60x por segundo
     if not hasattr(desenhar_recursos, "_cache"):
         desenhar_recursos._cache = {
-            'Moeda': carregar_item('moeda', tamanho_item), 
-            'Alimento': carregar_item('alimento', tamanho_item), 
-            'Livro': carregar_item('livro', tamanho_item), 
-            'Tijolo': carregar_item('tijolo', tamanho_item) 
+            'Moeda': regiao_item('moeda', tamanho_item), 
+            'Alimento': regiao_item('alimento', tamanho_item), 
+            'Livro': regiao_item('livro', tamanho_item), 
+            'Tijolo': regiao_item('tijolo', tamanho_item) 
         }
     cache = desenhar_recursos._cache
 
-    for r in recursos:
-        centro = (r['x']*TAM_CELULA + TAM_CELULA//2, r['y']*TAM_CELULA + TAM_CELULA//2)
-        img = cache.get(r['tipo'])
-        if img: surface.blit(img, img.get_rect(center=centro))
+    for x, y, tipo in recursos:
+        centro = (x*TAM_CELULA + TAM_CELULA//2, y*TAM_CELULA + TAM_CELULA//2)
+        img = cache.get(tipo)
+        if img: img.desenhar(surface, img.get_rect(center=centro))
 
-def desenhar_rotulos_coleta(surface, centros, player, alcance=3):
-    fonte = pygame.font.SysFont(None, 22)
-    tem_item = player.inventario[0] if player.inventario else None
-    for centro in centros:
-        distancia = abs(player.grid_x - centro.x) + abs(player.grid_y - centro.y)
-        # Mostra o rótulo se o jogador estiver perto OU se tiver o item certo
-        if distancia > alcance and centro.recurso_necessario != tem_item: 
-            continue
-        
-        texto = f"Entregar {centro.recurso_necessario}"
-        render = fonte.render(texto, True, BRANCO)
+def _obter_superficie_rotulo(recurso, tamanho_fonte=22):
+    """
+    Retorna a Surface pronta do rótulo "Entregar <recurso>" (fundo, borda e texto).
+    É montada uma vez por (recurso, tamanho da fonte); se o recurso_necessario de
+    um centro mudar, a chave muda e um novo rótulo é montado.
+    """
+    if not hasattr(_obter_superficie_rotulo, "_cache"):
+        _obter_superficie_rotulo._cache = {}
+    cache = _obter_superficie_rotulo._cache
+    chave = (recurso, tamanho_fonte)
+    label_surface = cache.get(chave)
+    if label_surface is None:
+        render = renderizar_texto(obter_fonte(None, tamanho_fonte), f"Entregar {recurso}", BRANCO)
         padding_x, padding_y = 10, 6
         largura = render.get_width() + padding_x * 2
         altura = render.get_height() + padding_y * 2
@@ -676,6 +756,21 @@ def desenhar_rotulos_coleta(surface, centros, player, alcance=3):
         label_surface.fill((0, 0, 0, 200))
         pygame.draw.rect(label_surface, COR_OURO, label_surface.get_rect(), width=1, border_radius=6)
         label_surface.blit(render, render.get_rect(center=label_surface.get_rect().center))
+        cache[chave] = label_surface
+    return label_surface
+
+def _layout_rotulos_coleta(centros, player, alcance=3):
+    """Calcula quais rótulos de entrega aparecem e onde, sem desenhar nada."""
+    tem_item = player.inventario[0] if player.inventario else None
+    rotulos = []
+    for centro in centros:
+        distancia = abs(player.grid_x - centro.x) + abs(player.grid_y - centro.y)
+        # Mostra o rótulo se o jogador estiver perto OU se tiver o item certo
+        if distancia > alcance and centro.recurso_necessario != tem_item: 
+            continue
+        
+        label_surface = _obter_superficie_rotulo(centro.recurso_necessario)
+        largura, altura = label_surface.get_size()
         
         # Calcular posição com ajuste para não sair da tela
         pos_x = centro.x * TAM_CELULA + TAM_CELULA // 2 - largura // 2
@@ -692,42 +787,218 @@ def desenhar_rotulos_coleta(surface, centros, player, alcance=3):
         if pos_y < 5:
             pos_y = centro.y * TAM_CELULA + TAM_CELULA + 6  # Coloca abaixo do centro
         
-        surface.blit(label_surface, (pos_x, pos_y))
+        rect_label = pygame.Rect(pos_x, pos_y, largura, altura)
+        rect_halo = None
+        if centro.recurso_necessario == tem_item:
+            rect_halo = pygame.Rect(0, 0, TAM_CELULA*2, TAM_CELULA*2)
+            rect_halo.center = (centro.x * TAM_CELULA + TAM_CELULA//2, centro.y * TAM_CELULA + TAM_CELULA//2)
+        rotulos.append((label_surface, rect_label, rect_halo))
+    return rotulos
+
+def _desenhar_rotulos(surface, rotulos):
+    for label_surface, rect_label, rect_halo in rotulos:
+        surface.blit(label_surface, rect_label.topleft)
         
         # Desenha "halo" de destaque se for o alvo correto
-        if centro.recurso_necessario == tem_item:
-            halo_surface = pygame.Surface((TAM_CELULA*2, TAM_CELULA*2), pygame.SRCALPHA)
+        if rect_halo:
             intensidade = 80 + int(40 * (1 + math.sin(pygame.time.get_ticks() / 250)))
-            pygame.draw.circle(halo_surface, (*COR_OURO, intensidade), (halo_surface.get_width()//2, halo_surface.get_height()//2), TAM_CELULA, width=4)
-            target_pos = (centro.x * TAM_CELULA + TAM_CELULA//2 - halo_surface.get_width()//2,
-                          centro.y * TAM_CELULA + TAM_CELULA//2 - halo_surface.get_height()//2)
-            surface.blit(halo_surface, target_pos, special_flags=pygame.BLEND_RGBA_ADD)
+            surface.blit(obter_anel(TAM_CELULA, intensidade, COR_OURO), rect_halo.topleft, special_flags=pygame.BLEND_RGBA_ADD)
+
+def desenhar_rotulos_coleta(surface, centros, player, alcance=3):
+    _desenhar_rotulos(surface, _layout_rotulos_coleta(centros, player, alcance))
 
 # --- CORREÇÃO 3 (Função Incompleta) ---
 # Esta é a função `desenhar_hud` completa, que foi cortada na resposta anterior
-def desenhar_hud(surface, jogador, centros, pontos):
-    base_y = LINHAS_LABIRINTO * TAM_CELULA
-    pygame.draw.rect(surface, COR_FUNDO_UI, (0, base_y, LARGURA, ALTURA - base_y))
-    fonte, fonte_instrucao = pygame.font.SysFont(None, 28), pygame.font.SysFont(None, 24)
-    surface.blit(fonte.render("Inventario:", True, BRANCO), (40, base_y + 15))
-    mapa_cor={'Moeda':COR_MOEDA,'Alimento':COR_ALIMENTO,'Livro':COR_LIVRO,'Tijolo':COR_TIJOLO}
-    for i in range(jogador.capacidade_inventario):
-        pygame.draw.rect(surface,BRANCO,(40+i*30,base_y+40,25,25),1)
-        if i < len(jogador.inventario): pygame.draw.rect(surface,mapa_cor[jogador.inventario[i]],(40+i*30,base_y+40,25,25))
-    surface.blit(fonte_instrucao.render("Pressione [H] para Descartar", True, BRANCO), (40, base_y + 75))
-    surface.blit(fonte.render("Desenvolvimento Comunitário",True,BRANCO), (LARGURA/2, base_y+10))
-    centros_esquerda, centros_direita = centros[:2], centros[2:]
-    for i, centro in enumerate(centros_esquerda):
-        pos_x, pos_y = 320, base_y + 40 + i * 25
-        surface.blit(fonte.render(f"{centro.nome}:",True,centro.cor), (pos_x, pos_y))
-        prog=(centro.nivel_atual/centro.nivel_max)
-        pygame.draw.rect(surface,PRETO,(pos_x + 90, pos_y+2, 100, 12)); pygame.draw.rect(surface,AMARELO,(pos_x + 90, pos_y+2, 100*prog, 12))
-    for i, centro in enumerate(centros_direita):
-        pos_x, pos_y = LARGURA/2 + 100, base_y + 40 + i * 25
-        surface.blit(fonte.render(f"{centro.nome}:",True,centro.cor), (pos_x, pos_y))
+class HudRetido:
+    """
+    HUD do jogo mantido em uma Surface própria. Cada widget (inventário, barra
+    de cada centro, pontos) guarda a chave do dado que exibe e só é redesenhado
+    quando ela muda; no resto dos quadros o HUD custa um único blit.
+    """
+    def __init__(self):
+        self.camada = None
+        self._chaves = {}
+
+    def _mudou(self, widget, chave):
+        if self._chaves.get(widget) == chave: return False
+        self._chaves[widget] = chave
+        return True
+
+    def desenhar(self, surface, jogador, centros, pontos, rect_desistir=None):
+        base_y = LINHAS_LABIRINTO * TAM_CELULA
+        estatico = (tuple((c.nome, c.cor) for c in centros), jogador.capacidade_inventario, tuple(rect_desistir) if rect_desistir else None)
+        if self.camada is None or self._mudou('estatico', estatico):
+            self.camada = pygame.Surface((LARGURA, ALTURA - base_y))
+            if pygame.display.get_surface() is not None:
+                self.camada = self.camada.convert()
+            self._chaves = {'estatico': estatico}
+            self._desenhar_estatico(centros, rect_desistir.move(0, -base_y) if rect_desistir else None)
+
+        if self._mudou('inventario', tuple(jogador.inventario)):
+            self._desenhar_inventario(jogador)
+        for i, centro in enumerate(centros):
+            if self._mudou(('centro', i), (centro.nivel_atual, centro.nivel_max)):
+                self._desenhar_barra_centro(i, centro)
+        if self._mudou('pontos', pontos):
+            self._desenhar_pontos(pontos)
+
+        surface.blit(self.camada, (0, base_y))
+
+    @staticmethod
+    def _posicao_centro(i):
+        # Dois centros em cada coluna (coordenadas relativas à camada do HUD)
+        if i < 2: return 320, 40 + i * 25
+        return LARGURA/2 + 100, 40 + (i - 2) * 25
+
+    def _desenhar_estatico(self, centros, rect_desistir):
+        camada = self.camada
+        fonte, fonte_instrucao = obter_fonte(None, 28), obter_fonte(None, 24)
+        camada.fill(COR_FUNDO_UI)
+        camada.blit(renderizar_texto(fonte, "Inventario:", BRANCO), (40, 15))
+        camada.blit(renderizar_texto(fonte_instrucao, "Pressione [H] para Descartar", BRANCO), (40, 75))
+        camada.blit(renderizar_texto(fonte, "Desenvolvimento Comunitário", BRANCO), (LARGURA/2, 10))
+        for i, centro in enumerate(centros):
+            camada.blit(renderizar_texto(fonte, f"{centro.nome}:", centro.cor), self._posicao_centro(i))
+        if rect_desistir:
+            desenhar_botao_desistir(camada, rect_desistir)
+
+    def _desenhar_inventario(self, jogador):
+        mapa_cor={'Moeda':COR_MOEDA,'Alimento':COR_ALIMENTO,'Livro':COR_LIVRO,'Tijolo':COR_TIJOLO}
+        self.camada.fill(COR_FUNDO_UI, (40, 40, jogador.capacidade_inventario*30, 25))
+        for i in range(jogador.capacidade_inventario):
+            pygame.draw.rect(self.camada,BRANCO,(40+i*30,40,25,25),1)
+            if i < len(jogador.inventario): pygame.draw.rect(self.camada,mapa_cor[jogador.inventario[i]],(40+i*30,40,25,25))
+
+    def _desenhar_barra_centro(self, i, centro):
+        pos_x, pos_y = self._posicao_centro(i)
         prog=(centro.nivel_atual/centro.nivel_max)
-        pygame.draw.rect(surface,PRETO,(pos_x + 90, pos_y+2, 100, 12)); pygame.draw.rect(surface,AMARELO,(pos_x + 90, pos_y+2, 100*prog, 12))
-    surface.blit(fonte.render(f"Pontos: {pontos}",True,BRANCO), (LARGURA-150,base_y+10))
+        pygame.draw.rect(self.camada,PRETO,(pos_x + 90, pos_y+2, 100, 12)); pygame.draw.rect(self.camada,AMARELO,(pos_x + 90, pos_y+2, 100*prog, 12))
+
+    def _desenhar_pontos(self, pontos):
+        fonte = obter_fonte(None, 28)
+        self.camada.fill(COR_FUNDO_UI, (LARGURA-150, 10, 150, fonte.get_linesize()))
+        self.camada.blit(renderizar_texto(fonte, f"Pontos: {pontos}", BRANCO), (LARGURA-150, 10))
+
+_HUD = HudRetido()
+
+def desenhar_hud(surface, jogador, centros, pontos, rect_desistir=None):
+    _HUD.desenhar(surface, jogador, centros, pontos, rect_desistir)
+
+def desenhar_botao_desistir(surface, rect):
+    pygame.draw.rect(surface, (150, 50, 50), rect, border_radius=6)
+    pygame.draw.rect(surface, (200, 80, 80), rect, width=2, border_radius=6)
+    desenhar_texto(surface, "Desistir", rect.center, obter_fonte(None, 26), BRANCO)
+
+def _inimigos_e_centros(inimigos):
+    """
+    (inimigo, centro) de cada fantasma. 'inimigos' é a lista de Inimigo (centro None: vem de px/py)
+    ou o MotorFantasmas, cujos objetos não são atualizados a cada quadro (centro lido dos arrays).
+    """
+    posicoes = getattr(inimigos, "posicoes", None)
+    return posicoes() if posicoes else ((inimigo, None) for inimigo in inimigos)
+
+def desenhar_cena_jogo(surface, jogador, inimigos, centros, recursos, pontos, rect_desistir):
+    """Desenha o quadro completo do estado 'jogo' (labirinto, entidades e HUD)."""
+    surface.fill(PRETO)
+    desenhar_labirinto(surface)
+    desenhar_recursos(surface, recursos)
+    for centro in centros: centro.desenhar(surface)
+    desenhar_rotulos_coleta(surface, centros, jogador)
+    jogador.desenhar(surface)
+    for inimigo, centro in _inimigos_e_centros(inimigos): inimigo.desenhar(surface, centro)
+    desenhar_hud(surface, jogador, centros, pontos, rect_desistir)
+
+class RenderizadorDirtyRects:
+    """
+    Renderizador opcional do estado 'jogo' baseado em retângulos sujos.
+    Restaura do fundo estático apenas as áreas ocupadas (antes e depois)
+    pelo jogador, inimigos, centros, rótulos e recursos alterados, redesenha
+    o HUD só quando ele muda e devolve a lista de rects para
+    pygame.display.update().
+    """
+    def __init__(self):
+        self._fundo = None
+        self._labirinto_base = None
+        self._rects_anteriores: Dict = {}
+        self._assinatura_hud = None
+        self._redesenho_total = True
+
+    def invalidar(self):
+        """Força um redesenho completo no próximo quadro."""
+        self._redesenho_total = True
+
+    def _obter_fundo(self, surface):
+        labirinto = obter_superficie_labirinto()
+        if self._fundo is None or self._labirinto_base is not labirinto or self._fundo.get_size() != surface.get_size():
+            self._fundo = pygame.Surface(surface.get_size()).convert()
+            self._fundo.fill(PRETO)
+            self._fundo.blit(labirinto, (0, 0))
+            self._labirinto_base = labirinto
+            self._redesenho_total = True
+        return self._fundo
+
+    def desenhar(self, surface, jogador, inimigos, centros, recursos, pontos, rect_desistir) -> List[pygame.Rect]:
+        fundo = self._obter_fundo(surface)
+        tela_rect = surface.get_rect()
+        rotulos = _layout_rotulos_coleta(centros, jogador)
+
+        # Retângulos atuais de tudo que se move ou anima a cada quadro
+        rects_atuais = {('player',): jogador.obter_rect()}
+        fantasmas = list(_inimigos_e_centros(inimigos))
+        for inimigo, centro in fantasmas: rects_atuais[('inimigo', inimigo.id)] = inimigo.obter_rect(centro)
+        for i, centro in enumerate(centros): rects_atuais[('centro', i)] = centro.obter_rect()
+        for i, (_, rect_label, rect_halo) in enumerate(rotulos):
+            rects_atuais[('rotulo', i)] = rect_label.union(rect_halo) if rect_halo else rect_label
+
+        # Células que ganharam/perderam recurso desde o quadro anterior (só as alteradas, sem varrer todos)
+        celulas_alteradas = recursos.consumir_alteracoes()
+        assinatura_hud = (tuple(jogador.inventario), tuple(c.nivel_atual for c in centros), pontos)
+
+        if self._redesenho_total:
+            desenhar_cena_jogo(surface, jogador, inimigos, centros, recursos, pontos, rect_desistir)
+            self._rects_anteriores = rects_atuais
+            self._assinatura_hud, self._redesenho_total = assinatura_hud, False
+            return [tela_rect]
+
+        sujos = list(rects_atuais.values()) + list(self._rects_anteriores.values())
+        for x, y in celulas_alteradas:
+            sujos.append(pygame.Rect(x * TAM_CELULA, y * TAM_CELULA, TAM_CELULA, TAM_CELULA))
+
+        # Recursos parcialmente cobertos entram inteiros na área suja, para não
+        # serem misturados (alpha) sobre o próprio desenho anterior.
+        # Só as células sob as áreas sujas são consultadas na grade.
+        recursos_redesenhar, celulas_vistas = [], set()
+        for rect in list(sujos):
+            x0, x1 = max(0, rect.left // TAM_CELULA), min(COLUNAS - 1, (rect.right - 1) // TAM_CELULA)
+            y0, y1 = max(0, rect.top // TAM_CELULA), min(LINHAS_LABIRINTO - 1, (rect.bottom - 1) // TAM_CELULA)
+            for y in range(y0, y1 + 1):
+                for x in range(x0, x1 + 1):
+                    tipo = recursos.tipo_em(x, y)
+                    if tipo is None or (x, y) in celulas_vistas: continue
+                    celulas_vistas.add((x, y))
+                    recursos_redesenhar.append((x, y, tipo))
+                    sujos.append(pygame.Rect(x * TAM_CELULA, y * TAM_CELULA, TAM_CELULA, TAM_CELULA))
+
+        sujos = [r.clip(tela_rect) for r in sujos]
+        for rect in sujos:
+            surface.blit(fundo, rect, rect)
+
+        desenhar_recursos(surface, recursos_redesenhar)
+        for centro in centros: centro.desenhar(surface)
+        _desenhar_rotulos(surface, rotulos)
+        jogador.desenhar(surface)
+        for inimigo, centro in fantasmas: inimigo.desenhar(surface, centro)
+
+        # O HUD é desenhado por cima de tudo: refaz se mudou ou se algo o invadiu
+        base_y = LINHAS_LABIRINTO * TAM_CELULA
+        rect_hud = pygame.Rect(0, base_y, LARGURA, ALTURA - base_y)
+        if assinatura_hud != self._assinatura_hud or rect_hud.collidelist(sujos) != -1:
+            desenhar_hud(surface, jogador, centros, pontos, rect_desistir)
+            sujos.append(rect_hud)
+            self._assinatura_hud = assinatura_hud
+
+        self._rects_anteriores = rects_atuais
+        return sujos
 
 def desenhar_popup_sem_cadastro(surface):
     """Desenha um popup informativo sobre entrar sem cadastro"""
@@ -747,13 +1018,13 @@ def desenhar_popup_sem_cadastro(surface):
     pygame.draw.rect(surface, COR_OURO, popup_rect, width=3, border_radius=12)
     
     # Título
-    fonte_titulo = pygame.font.SysFont("bahnschrift", 32, bold=True)
-    titulo = fonte_titulo.render("Modo Visitante", True, COR_OURO)
+    fonte_titulo = obter_fonte("bahnschrift", 32, negrito=True)
+    titulo = renderizar_texto(fonte_titulo, "Modo Visitante", COR_OURO)
     titulo_rect = titulo.get_rect(center=(LARGURA // 2, y_popup + 40))
     surface.blit(titulo, titulo_rect)
     
     # Mensagem
-    fonte_msg = pygame.font.SysFont(None, 26)
+    fonte_msg = obter_fonte(None, 26)
     mensagens = [
         "Você está entrando como visitante.",
         "",
@@ -763,7 +1034,7 @@ def desenhar_popup_sem_cadastro(surface):
     
     y_texto = y_popup + 85
     for msg in mensagens:
-        texto = fonte_msg.render(msg, True, BRANCO)
+        texto = renderizar_texto(fonte_msg, msg, BRANCO)
         texto_rect = texto.get_rect(center=(LARGURA // 2, y_texto))
         surface.blit(texto, texto_rect)
         y_texto += 32
@@ -772,8 +1043,8 @@ def desenhar_popup_sem_cadastro(surface):
     rect_ok = pygame.Rect(LARGURA//2 - 60, ALTURA//2 + 80, 120, 40)
     pygame.draw.rect(surface, (250, 210, 0), rect_ok, border_radius=8)
     pygame.draw.rect(surface, (5, 5, 5), rect_ok, width=2, border_radius=8)
-    fonte_botao = pygame.font.SysFont(None, 32)
-    texto_ok = fonte_botao.render("OK", True, (0, 0, 0))
+    fonte_botao = obter_fonte(None, 32)
+    texto_ok = renderizar_texto(fonte_botao, "OK", (0, 0, 0))
     texto_ok_rect = texto_ok.get_rect(center=rect_ok.center)
     surface.blit(texto_ok, texto_ok_rect)
 
@@ -795,13 +1066,13 @@ def desenhar_popup_controles(surface):
     pygame.draw.rect(surface, COR_OURO, popup_rect, width=3, border_radius=12)
     
     # Título
-    fonte_titulo = pygame.font.SysFont("bahnschrift", 32, bold=True)
-    titulo = fonte_titulo.render("Controles do Jogo", True, COR_OURO)
+    fonte_titulo = obter_fonte("bahnschrift", 32, negrito=True)
+    titulo = renderizar_texto(fonte_titulo, "Controles do Jogo", COR_OURO)
     titulo_rect = titulo.get_rect(center=(LARGURA // 2, y_popup + 35))
     surface.blit(titulo, titulo_rect)
     
     # Mensagem
-    fonte_msg = pygame.font.SysFont(["segoe ui symbol", "segoe ui", "arial"], 26)
+    fonte_msg = obter_fonte(["segoe ui symbol", "segoe ui", "arial"], 26)
     mensagens = [
         "Você pode jogar usando:",
         "",
@@ -814,18 +1085,18 @@ def desenhar_popup_controles(surface):
     for msg in mensagens:
         if msg == "OU":
             cor = COR_OURO
-            fonte_ou = pygame.font.SysFont(None, 24, bold=True)
-            texto = fonte_ou.render(msg, True, cor)
+            fonte_ou = obter_fonte(None, 24, negrito=True)
+            texto = renderizar_texto(fonte_ou, msg, cor)
         else:
             cor = BRANCO
-            texto = fonte_msg.render(msg, True, cor)
+            texto = renderizar_texto(fonte_msg, msg, cor)
         texto_rect = texto.get_rect(center=(LARGURA // 2, y_texto))
         surface.blit(texto, texto_rect)
         y_texto += 32
     
     # Instrução para fechar
-    fonte_dica = pygame.font.SysFont(None, 22)
-    dica = fonte_dica.render("Clique em qualquer lugar para fechar", True, CINZA)
+    fonte_dica = obter_fonte(None, 22)
+    dica = renderizar_texto(fonte_dica, "Clique em qualquer lugar para fechar", CINZA)
     dica_rect = dica.get_rect(center=(LARGURA // 2, y_popup + altura_popup - 30))
     surface.blit(dica, dica_rect)
 # --- FIM DA CORREÇÃO 3 ---
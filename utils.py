@@ -15,8 +15,8 @@ import json
 import datetime
 import sys
 from pathlib import Path
-from collections import deque
-from typing import Dict, List, Tuple
+from array import array
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 # Importa constantes necessárias
 from config import (
@@ -24,13 +24,33 @@ from config import (
     MUSICA_LABIRINTO, MUSICA_GAME_OVER,
     COLUNAS, LINHAS_LABIRINTO
 )
+from labirinto import versao_layout
+
+if TYPE_CHECKING: # Só para as anotações: entidades.py importa este módulo
+    from entidades import EstatisticasPartida
 
 # =======================
 #   CONTROLE DE MUSICA
 # =======================
 
+def _garantir_mixer() -> bool:
+    """Inicializa o mixer na primeira musica (abrir o dispositivo de audio atrasa o primeiro quadro)."""
+    if pygame.mixer.get_init():
+        return True
+    if _garantir_mixer.falhou:
+        return False
+    try:
+        pygame.mixer.init()
+        return True
+    except pygame.error as e:
+        print(f"[ERRO] Audio indisponivel, jogo seguira sem musica: {e}")
+        _garantir_mixer.falhou = True
+        return False
+_garantir_mixer.falhou = False
+
 def tocar_musica_labirinto():
     """Toca a musica de fundo do labirinto em loop"""
+    if not _garantir_mixer(): return
     try:
         pygame.mixer.music.load(MUSICA_LABIRINTO)
         pygame.mixer.music.set_volume(0.3)  # Volume baixo para nao atrapalhar
@@ -42,6 +62,7 @@ def tocar_musica_labirinto():
 
 def tocar_musica_game_over():
     """Toca a musica de game over uma vez, comecando em 5 segundos"""
+    if not _garantir_mixer(): return
     try:
         pygame.mixer.music.load(MUSICA_GAME_OVER)
         pygame.mixer.music.set_volume(0.5)
@@ -63,11 +84,20 @@ def tocar_musica_game_over():
 
 def parar_musica():
     """Para a musica atual"""
+    if not pygame.mixer.get_init(): return # Nada tocou ainda
     try:
         pygame.mixer.music.stop()
     except Exception as e:
         print(f"[ERRO] Erro ao parar musica: {e}")
 
+def pausar_musica(pausar: bool):
+    """Pausa (ou retoma) a musica atual"""
+    if not pygame.mixer.get_init(): return
+    if pausar:
+        pygame.mixer.music.pause()
+    else:
+        pygame.mixer.music.unpause()
+
 # =======================
 #   GERENCIAMENTO DE DADOS (JSON)
 # =======================
@@ -264,7 +294,7 @@ class RewardsSystem:
         user_data["nivel"] = min(100, (user_data["pontos_totais"] // 1000) + 1)
         self.salvar_rewards()
     
-    def verificar_tarefas_diarias(self, username: str, stats: Dict):
+    def verificar_tarefas_diarias(self, username: str, stats: "EstatisticasPartida"):
         user_data = self.obter_usuario_rewards(username)
         hoje = datetime.datetime.now().date().isoformat()
         if user_data.get("ultima_tarefa_dia") != hoje: user_data["tarefas_diarias"] = {k:v.copy() for k,v in self.daily_tasks.items()}; user_data["ultima_tarefa_dia"] = hoje
@@ -294,7 +324,7 @@ class RewardsSystem:
         
         self.salvar_rewards()
     
-    def verificar_conquistas(self, username: str, stats: Dict):
+    def verificar_conquistas(self, username: str, stats: "EstatisticasPartida"):
         user_data = self.obter_usuario_rewards(username)
         conquistas = user_data.setdefault("conquistas", {})
         stats_acum = user_data.get("stats_acumuladas", {})
@@ -352,7 +382,7 @@ class RewardsSystem:
         percentual = (xp_atual_no_nivel / xp_necessario_nivel) * 100
         return (xp_atual_no_nivel, xp_necessario_nivel, percentual)
     
-    def obter_progresso_tarefa(self, username: str, task_id: str, stats: Dict) -> Tuple[int, int]:
+    def obter_progresso_tarefa(self, username: str, task_id: str, stats: "EstatisticasPartida") -> Tuple[int, int]:
         """Retorna (progresso_atual, requisito_total)"""
         if task_id not in self.daily_tasks:
             return (0, 0)
@@ -364,7 +394,7 @@ class RewardsSystem:
         
         return (min(progresso, requisito), requisito)
     
-    def obter_progresso_conquista(self, username: str, achievement_id: str, stats: Dict) -> Tuple[int, int]:
+    def obter_progresso_conquista(self, username: str, achievement_id: str, stats: "EstatisticasPartida") -> Tuple[int, int]:
         """Retorna (progresso_atual, requisito_total)"""
         if achievement_id not in self.achievements:
             return (0, 0)
@@ -384,7 +414,7 @@ class RewardsSystem:
         
         return (min(progresso, requisito), requisito)
     
-    def atualizar_stats_acumuladas(self, username: str, stats: Dict, vitoria: bool = False):
+    def atualizar_stats_acumuladas(self, username: str, stats: "EstatisticasPartida", vitoria: bool = False):
         """Atualiza estatísticas acumuladas do jogador"""
         user_data = self.obter_usuario_rewards(username)
         stats_acum = user_data.setdefault("stats_acumuladas", {})
@@ -424,24 +454,111 @@ class RewardsSystem:
 #   PATHFINDING (BFS)
 # =======================
 
+class BuscadorCaminhos:
+    """
+    BFS com ponteiros para o pai num array plano, pré-alocado e reaproveitado entre buscas.
+    O caminho só é montado (seguindo os pais) quando o destino é encontrado.
+    Os vizinhos livres de cada célula são pré-calculados: se o layout mudar, chame recompilar()
+    (ou recompilar_se_mudou(), que compara a versão de labirinto.alterar_celula).
+    """
+    VIZINHOS = ((0, 1), (0, -1), (1, 0), (-1, 0)) # Ordem de expansão (define o desempate entre caminhos)
+
+    def __init__(self, labirinto: List[List[int]], colunas: int = COLUNAS, linhas: int = LINHAS_LABIRINTO):
+        self.labirinto, self.colunas, self.linhas = labirinto, colunas, linhas
+        n = colunas * linhas
+        self._pais = array('i', [-1]) * n
+        self._fila = array('i', [0]) * n # Cada célula entra no máximo uma vez: basta um array + 2 ponteiros
+        # Marca de visita por "geração": evita limpar o buffer a cada busca
+        self._visitado = array('I', [0]) * n
+        self._geracao = 0
+        self.recompilar()
+
+    def recompilar(self):
+        """Relê o layout e refaz a lista de vizinhos livres (índices planos) de cada célula."""
+        colunas, linhas, labirinto = self.colunas, self.linhas, self.labirinto
+        self._versao = versao_layout()
+        self._vizinhos = [
+            tuple((y + dy) * colunas + x + dx for dx, dy in self.VIZINHOS
+                  if 0 <= x + dx < colunas and 0 <= y + dy < linhas and labirinto[y + dy][x + dx] == 0)
+            for y in range(linhas) for x in range(colunas)
+        ]
+
+    def recompilar_se_mudou(self) -> bool:
+        """Recompila se algum layout foi alterado (labirinto.alterar_celula) desde a última compilação."""
+        if self._versao == versao_layout(): return False
+        self.recompilar()
+        return True
+
+    def _buscar(self, inicio: Tuple[int, int], alvos) -> bool:
+        """Expande a BFS a partir de 'inicio' até visitar todos os índices de 'alvos' (ou esgotar a grade)."""
+        vizinhos, pais, fila, visitado = self._vizinhos, self._pais, self._fila, self._visitado
+        self._geracao += 1
+        geracao = self._geracao
+        origem = inicio[1] * self.colunas + inicio[0]
+        visitado[origem], pais[origem] = geracao, -1
+        fila[0], cabeca, cauda = origem, 0, 1
+        restantes = len(alvos) - (origem in alvos)
+        if restantes == 0: return True
+        while cabeca < cauda:
+            atual = fila[cabeca]; cabeca += 1
+            for prox in vizinhos[atual]:
+                if visitado[prox] != geracao:
+                    visitado[prox], pais[prox] = geracao, atual
+                    fila[cauda] = prox; cauda += 1
+                    # Saída antecipada: o pai de um destino já é definitivo ao descobri-lo
+                    if prox in alvos:
+                        restantes -= 1
+                        if restantes == 0: return True
+        return False
+
+    def _montar(self, fim: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Caminho do início até 'fim' (já visitado na última busca), seguindo os pais."""
+        colunas, pais = self.colunas, self._pais
+        indice = fim[1] * colunas + fim[0]
+        if self._visitado[indice] != self._geracao: return []
+        caminho = []
+        while indice != -1:
+            caminho.append((indice % colunas, indice // colunas))
+            indice = pais[indice]
+        caminho.reverse()
+        return caminho
+
+    def _dentro(self, celula: Tuple[int, int]) -> bool:
+        return 0 <= celula[0] < self.colunas and 0 <= celula[1] < self.linhas
+
+    def caminho(self, inicio: Tuple[int, int], fim: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Menor caminho de 'inicio' a 'fim' (inclusive), ou [] se não houver."""
+        if not (self._dentro(inicio) and self._dentro(fim)) or self.labirinto[fim[1]][fim[0]] == 1: return []
+        self._buscar(inicio, {fim[1] * self.colunas + fim[0]})
+        return self._montar(fim)
+
+    def caminhos(self, inicio: Tuple[int, int], destinos) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """Vários destinos com uma única BFS a partir de 'inicio'; destinos inalcançáveis recebem []."""
+        validos = [d for d in destinos if self._dentro(d) and self.labirinto[d[1]][d[0]] != 1]
+        if self._dentro(inicio) and validos:
+            self._buscar(inicio, {d[1] * self.colunas + d[0] for d in validos})
+        else:
+            validos = []
+        resultado = {d: [] for d in destinos}
+        for d in validos: resultado[d] = self._montar(d)
+        return resultado
+
 def encontrar_caminho(labirinto: List[List[int]], inicio: Tuple[int, int], fim: Tuple[int, int]) -> List[Tuple[int, int]]:
     """Encontra o caminho mais curto usando Breadth-First Search (BFS)"""
-    if labirinto[fim[1]][fim[0]] == 1: return []
-    fila = deque([[inicio]])
-    visitados = {inicio}
-    while fila:
-        caminho = fila.popleft()
-        x, y = caminho[-1]
-        if (x, y) == fim: return caminho
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            prox_x, prox_y = x + dx, y + dy
-            if (0 <= prox_x < COLUNAS and 0 <= prox_y < LINHAS_LABIRINTO and
-                    labirinto[prox_y][prox_x] == 0 and (prox_x, prox_y) not in visitados):
-                novo_caminho = list(caminho)
-                novo_caminho.append((prox_x, prox_y))
-                fila.append(novo_caminho)
-                visitados.add((prox_x, prox_y))
-    return []
+    # Um BuscadorCaminhos (com seus buffers) por layout, reaproveitado entre chamadas.
+    # Guarda só os últimos layouts usados (LRU); um layout alterado (alterar_celula) é recompilado.
+    buscadores = encontrar_caminho._buscadores
+    buscador = buscadores.pop(id(labirinto), None)
+    if buscador is None or buscador.labirinto is not labirinto:
+        buscador = BuscadorCaminhos(labirinto)
+    else:
+        buscador.recompilar_se_mudou()
+    buscadores[id(labirinto)] = buscador # Reinserido no fim: o mais recente
+    while len(buscadores) > encontrar_caminho.MAX_BUSCADORES:
+        del buscadores[next(iter(buscadores))]
+    return buscador.caminho(inicio, fim)
+encontrar_caminho._buscadores = {}
+encontrar_caminho.MAX_BUSCADORES = 4
 
 # =======================
 #   HELPERS DE UI (Formulário)